@@ -28,7 +28,7 @@ from research_cli.models.expert import ExpertConfig
 from research_cli.models.author import AuthorRole, WriterTeam
 from research_cli.utils.citation_manager import CitationManager
 from research_cli import db as appdb
-from research_cli.model_config import get_role_config, get_reviewer_models, get_pricing, get_all_pricing, create_llm_for_role
+from research_cli.model_config import get_role_config, get_reviewer_models, get_pricing, get_all_pricing, create_llm_for_role, token_cost
 
 
 app = FastAPI(title="Autonomous Research Press API")
@@ -92,6 +92,9 @@ if _raw_keys:
 
 ADMIN_API_KEY = os.environ.get("RESEARCH_ADMIN_KEY", "")
 
+# Site index read/written by the article and settings endpoints
+INDEX_PATH = Path(os.environ.get("RESEARCH_INDEX_PATH", "web/data/index.json"))
+
 
 async def verify_api_key(request: Request) -> str:
     """FastAPI dependency: validate X-API-Key header (env var keys + SQLite)."""
@@ -1073,8 +1076,8 @@ def add_activity_log(project_id: str, level: str, message: str, details: dict =
 def calculate_cost_estimate(input_tokens: int, output_tokens: int, model: str = "claude-opus-4.5") -> dict:
     """Calculate cost estimate based on tokens and model."""
     model_price = get_pricing(model)
-    input_cost = (input_tokens / 1_000_000) * model_price["input"]
-    output_cost = (output_tokens / 1_000_000) * model_price["output"]
+    input_cost = token_cost(model_price, input_tokens, 0)
+    output_cost = token_cost(model_price, 0, output_tokens)
 
     return {
         "input_tokens": input_tokens,
@@ -1956,7 +1959,7 @@ async def delete_workflow(project_id: str, api_key: str = Depends(verify_admin_k
         md_path.unlink()
 
     # Remove from index.json
-    index_path = Path("web/data/index.json")
+    index_path = INDEX_PATH
     if index_path.exists():
         try:
             with open(index_path) as f:
@@ -2178,7 +2181,7 @@ async def submit_article(request: SubmitArticleRequest, api_key: str = Depends(v
         md_path.write_text(request.content, encoding="utf-8")
 
         # Update index.json
-        index_path = Path("web/data/index.json")
+        index_path = INDEX_PATH
         index_data = {"projects": [], "updated_at": datetime.now().isoformat()}
         if index_path.exists():
             with open(index_path) as f:
@@ -2929,7 +2932,7 @@ async def revoke_key(key_prefix: str, api_key: str = Depends(verify_admin_key)):
 @app.get("/api/site-settings")
 async def get_site_settings_public():
     """Get public site settings (min_date filter). No auth required."""
-    index_path = Path("web/data/index.json")
+    index_path = INDEX_PATH
     if not index_path.exists():
         return {"min_date": None}
     with open(index_path) as f:
@@ -2942,7 +2945,7 @@ async def get_site_settings_public():
 @app.get("/api/admin/site-settings")
 async def get_site_settings(api_key: str = Depends(verify_admin_key)):
     """Get site-level settings (min_date filter, etc.). Admin only."""
-    index_path = Path("web/data/index.json")
+    index_path = INDEX_PATH
     if not index_path.exists():
         return {"min_date": None}
     with open(index_path) as f:
@@ -2957,7 +2960,7 @@ class SiteSettingsRequest(BaseModel):
 @app.put("/api/admin/site-settings")
 async def update_site_settings(body: SiteSettingsRequest, api_key: str = Depends(verify_admin_key)):
     """Update site-level settings (min_date filter, etc.)."""
-    index_path = Path("web/data/index.json")
+    index_path = INDEX_PATH
     data = {}
     if index_path.exists():
         with open(index_path) as f:
@@ -3043,7 +3046,7 @@ class UpdateArticleRequest(BaseModel):
 async def update_article(project_id: str, body: UpdateArticleRequest, api_key: str = Depends(verify_admin_key)):
     """Update article content and/or metadata (admin only)."""
     # Look up existing metadata from index.json or workflow_complete.json
-    index_path = Path("web/data/index.json")
+    index_path = INDEX_PATH
     index_data = {"projects": []}
     entry = None
     if index_path.exists():
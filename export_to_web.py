@@ -336,7 +336,9 @@ def generate_article_html(project_id, workflow_data, manuscript_text, audience_l
     return html
 
 
-def _build_project_entry(project_dir: Path, project_id: str, web_data_dir: Path, web_articles_dir: Path) -> dict | None:
+def _build_project_entry(
+    project_dir: Path, project_id: str, web_data_dir: Path, web_articles_dir: Path, quiet: bool = False
+) -> dict | None:
     """Process a single project directory: copy data, generate HTML, return index entry.
 
     Returns the index entry dict, or None if the project has no workflow_complete.json.
@@ -382,7 +384,8 @@ def _build_project_entry(project_dir: Path, project_id: str, web_data_dir: Path,
             article_file = web_articles_dir / f"{project_id}.html"
             with open(article_file, "w", encoding='utf-8') as f:
                 f.write(article_html)
-            print(f"  ✓ Generated: articles/{project_id}.html")
+            if not quiet:
+                print(f"  ✓ Generated: articles/{project_id}.html")
         except Exception as e:
             print(f"  ✗ Error generating {project_id}.html: {e}")
 
@@ -485,8 +488,16 @@ def export_single_project(project_dir: Path, project_id: str = None) -> dict | N
     return entry
 
 
-def export_results_to_web():
-    """Export all research results to web/data directory and generate articles."""
+def export_results_to_web(quiet: bool = False):
+    """Export all research results to web/data directory and generate articles.
+
+    Args:
+        quiet: Skip the per-project progress and summary output (for callers
+            that report the export themselves). Errors are still printed.
+
+    Returns:
+        Number of exported projects.
+    """
     results_dir = Path("results")
     web_data_dir = Path("web/data")
     web_articles_dir = Path("web/articles")
@@ -500,7 +511,7 @@ def export_results_to_web():
             continue
 
         project_id = project_dir.name
-        entry = _build_project_entry(project_dir, project_id, web_data_dir, web_articles_dir)
+        entry = _build_project_entry(project_dir, project_id, web_data_dir, web_articles_dir, quiet=quiet)
         if entry is not None:
             workflows.append(entry)
 
@@ -515,10 +526,11 @@ def export_results_to_web():
             "updated_at": datetime.now().isoformat()
         }, f, indent=2)
 
-    print(f"\n✓ Exported {len(workflows)} research projects")
-    for wf in workflows:
-        status = "✓ PASS" if wf["passed"] else "⚠ REVISE"
-        print(f"  - {wf['topic']}: {wf['final_score']:.1f}/10 {status}")
+    if not quiet:
+        print(f"\n✓ Exported {len(workflows)} research projects")
+        for wf in workflows:
+            status = "✓ PASS" if wf["passed"] else "⚠ REVISE"
+            print(f"  - {wf['topic']}: {wf['final_score']:.1f}/10 {status}")
 
     return len(workflows)
 
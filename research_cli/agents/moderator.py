@@ -1,7 +1,10 @@
 """Moderator agent for making accept/reject decisions on peer reviews."""
 
+from statistics import fmean
 from typing import List, Dict
 from ..model_config import create_llm_for_role
+from ..utils.fast_json import loads as json_loads
+from ..utils.json_repair import strip_code_fence
 
 
 class ModeratorAgent:
@@ -61,9 +64,7 @@ STRUCTURAL COMPLETENESS (check independently of reviewer scores):
 When reviewers disagree by >2 points on any dimension, explain in your note which
 reviewer's assessment is more substantive and why. Do not simply average conflicting scores."""
 
-        # Format reviews — compact summary only
-        reviews_summary = self._format_reviews_compact(reviews)
-        overall_avg = sum(r["average"] for r in reviews) / len(reviews)
+        overall_avg = fmean(r["average"] for r in reviews)
 
         # Trajectory — overall + per-dimension
         trajectory = ""
@@ -104,6 +105,9 @@ reviewer's assessment is more substantive and why. Do not simply average conflic
         final_round = round_number >= max_rounds
         decision_options = "ACCEPT or REJECT" if final_round else "ACCEPT, MINOR_REVISION, MAJOR_REVISION, or REJECT"
 
+        # Format reviews — compact summary only
+        reviews_summary = self._format_reviews_compact(reviews)
+
         prompt = f"""Round {round_number}/{max_rounds} | Avg score: {overall_avg:.1f}/10 | Threshold: {threshold}{trajectory}
 {"⚠ FINAL ROUND — binary decision only (ACCEPT or REJECT)." if final_round else ""}
 {flags}
@@ -133,23 +137,16 @@ required_changes: list specific changes if requesting revision; empty list [] if
         # Parse JSON response
         import json
         import re
-        content = response.content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
+        content = strip_code_fence(response.content)
 
         decision_data = None
         try:
-            decision_data = json.loads(content)
+            decision_data = json_loads(content)
         except json.JSONDecodeError:
             json_match = re.search(r'```json\s*\n(.*?)\n```', response.content, re.DOTALL)
             if json_match:
                 try:
-                    decision_data = json.loads(json_match.group(1).strip())
+                    decision_data = json_loads(json_match.group(1).strip())
                 except json.JSONDecodeError:
                     pass
 
@@ -157,7 +154,7 @@ required_changes: list specific changes if requesting revision; empty list [] if
                 brace_match = re.search(r'\{.*\}', response.content, re.DOTALL)
                 if brace_match:
                     try:
-                        decision_data = json.loads(brace_match.group(0))
+                        decision_data = json_loads(brace_match.group(0))
                     except json.JSONDecodeError:
                         pass
 
@@ -4,6 +4,7 @@ import asyncio
 import logging
 from typing import Optional, List, Dict
 from ..llm.base import LLMResponse
+from ..llm.circuit import breaker
 from ..model_config import create_llm_for_role, create_fallback_llm_for_role
 from ..models.section import WritingContext, SectionOutput
 from ..models.collaborative_research import Reference
@@ -76,6 +77,7 @@ class WriterAgent:
 
         # Token tracking for last LLM call
         self._last_input_tokens: int = 0
+        self._last_cached_input_tokens: int = 0
         self._last_output_tokens: int = 0
         self._last_total_tokens: int = 0
         self._last_model_used: str = self.model
@@ -84,12 +86,13 @@ class WriterAgent:
         """Return token usage from the most recent LLM call.
 
         Returns:
-            Dict with tokens, input_tokens, output_tokens, model keys
+            Dict with tokens, input_tokens, output_tokens, cached_input_tokens, model keys
         """
         return {
             "tokens": self._last_total_tokens,
             "input_tokens": self._last_input_tokens,
             "output_tokens": self._last_output_tokens,
+            "cached_input_tokens": self._last_cached_input_tokens,
             "model": self._last_model_used,
         }
 
@@ -114,6 +117,7 @@ class WriterAgent:
         temperature: float = 0.7,
         max_tokens: int = 16384,
         timeout: int = LLM_TIMEOUT_SECONDS,
+        cached_prefix: Optional[str] = None,
     ) -> LLMResponse:
         """Single LLM call with timeout and fallback. No continuation logic.
 
@@ -126,6 +130,7 @@ class WriterAgent:
                     system=system,
                     temperature=temperature,
                     max_tokens=max_tokens,
+                    cached_prefix=cached_prefix,
                 ),
                 timeout=timeout,
             )
@@ -135,6 +140,9 @@ class WriterAgent:
             reason = f"timeout ({timeout}s)" if is_timeout else f"{type(e).__name__}: {e}"
             fallback_name = self._fallback_llm.model if self._fallback_llm else "same model"
             logger.warning(f"Primary LLM ({self.model}) failed: {reason} — falling back to {fallback_name}")
+            if is_timeout:
+                # Errors are recorded by retry_llm_call; a timeout cancels it first
+                breaker.record_failure(self.llm.provider_name, self.llm.model)
 
             # Force-close the primary client to release proxy connections
             try:
@@ -154,6 +162,7 @@ class WriterAgent:
                 system=system,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                cached_prefix=cached_prefix,
             )
             return response
 
@@ -167,21 +176,27 @@ class WriterAgent:
         temperature: float = 0.7,
         max_tokens: int = 16384,
         timeout: int = LLM_TIMEOUT_SECONDS,
+        cached_prefix: Optional[str] = None,
     ) -> LLMResponse:
         """Call LLM with timeout/fallback and auto-continuation on truncation.
 
         If the LLM response is truncated (stop_reason == "max_tokens" or "length"),
         automatically continues generation up to MAX_CONTINUATIONS times, stitching
         the output together seamlessly.
+
+        cached_prefix is stable leading context shared with other calls, kept
+        ahead of prompt for provider prompt caching; it is sent with the first
+        request only.
         """
         response = await self._call_llm_once(
             prompt=prompt, system=system, temperature=temperature,
-            max_tokens=max_tokens, timeout=timeout,
+            max_tokens=max_tokens, timeout=timeout, cached_prefix=cached_prefix,
         )
 
         # Track cumulative tokens
         total_input = response.input_tokens or 0
         total_output = response.output_tokens or 0
+        total_cached = response.cached_input_tokens or 0
 
         accumulated = response.content
 
@@ -211,6 +226,7 @@ class WriterAgent:
 
             total_input += response.input_tokens or 0
             total_output += response.output_tokens or 0
+            total_cached += response.cached_input_tokens or 0
             accumulated += response.content
 
         if response.stop_reason in ("max_tokens", "length"):
@@ -227,9 +243,11 @@ class WriterAgent:
             input_tokens=total_input,
             output_tokens=total_output,
             stop_reason=response.stop_reason,
+            cached_input_tokens=total_cached,
         )
 
         self._last_input_tokens = total_input
+        self._last_cached_input_tokens = total_cached
         self._last_output_tokens = total_output
         self._last_total_tokens = total_input + total_output
         self._last_model_used = response.model
@@ -780,42 +798,32 @@ Focus on substantive improvements that address reviewer concerns."""
         Returns:
             Formatted feedback summary
         """
-        feedback_parts = []
+        buf = []
 
-        for review in reviews:
-            specialist = review["specialist_name"]
+        for i, review in enumerate(reviews):
             scores = review["scores"]
-            avg = review["average"]
-
-            citations_line = f"\n- Citations: {scores['citations']}/10" if 'citations' in scores else ""
-            part = f"""
-## {specialist} (Average: {avg}/10)
-
-**Scores:**
-- Accuracy: {scores['accuracy']}/10
-- Completeness: {scores['completeness']}/10
-- Clarity: {scores['clarity']}/10
-- Novelty: {scores['novelty']}/10
-- Rigor: {scores['rigor']}/10{citations_line}
-
-**Summary:**
-{review['summary']}
-
-**Strengths:**
-{chr(10).join('- ' + s for s in review['strengths'])}
-
-**Weaknesses:**
-{chr(10).join('- ' + w for w in review['weaknesses'])}
-
-**Suggestions:**
-{chr(10).join('- ' + s for s in review['suggestions'])}
-
-**Detailed Feedback:**
-{review['detailed_feedback']}
-"""
-            feedback_parts.append(part)
-
-        return "\n---\n".join(feedback_parts)
+            if i:
+                buf.append("\n---\n")
+            buf.append(
+                f"\n## {review['specialist_name']} (Average: {review['average']}/10)\n\n"
+                f"**Scores:**\n"
+                f"- Accuracy: {scores['accuracy']}/10\n"
+                f"- Completeness: {scores['completeness']}/10\n"
+                f"- Clarity: {scores['clarity']}/10\n"
+                f"- Novelty: {scores['novelty']}/10\n"
+                f"- Rigor: {scores['rigor']}/10"
+            )
+            if 'citations' in scores:
+                buf.append(f"\n- Citations: {scores['citations']}/10")
+            buf.append(f"\n\n**Summary:**\n{review['summary']}\n\n**Strengths:**\n")
+            buf.append("\n".join(f"- {s}" for s in review['strengths']))
+            buf.append("\n\n**Weaknesses:**\n")
+            buf.append("\n".join(f"- {w}" for w in review['weaknesses']))
+            buf.append("\n\n**Suggestions:**\n")
+            buf.append("\n".join(f"- {s}" for s in review['suggestions']))
+            buf.append(f"\n\n**Detailed Feedback:**\n{review['detailed_feedback']}\n")
+
+        return "".join(buf)
 
     def _consolidate_feedback_compact(self, reviews: List[Dict]) -> str:
         """Compact review format for revision prompt.
@@ -1081,9 +1089,9 @@ Your writing style:
 
 You are writing ONE SECTION of a larger paper. Focus deeply on this section's topic."""
 
-        prompt = f"""You are writing Section {section_spec.order} of a research paper.
-
-OVERALL RESEARCH PLAN:
+        # Plan and earlier sections are shared by every section call of this
+        # paper and only grow at the end, so they lead as the cacheable prefix
+        cached_prefix = f"""OVERALL RESEARCH PLAN:
 Topic: {context.research_plan.topic}
 
 Research Questions:
@@ -1094,6 +1102,9 @@ PREVIOUSLY WRITTEN SECTIONS:
 
 ---
 
+"""
+        prompt = f"""You are writing Section {section_spec.order} of the research paper above.
+
 CURRENT SECTION TO WRITE:
 Title: {section_spec.title}
 Section ID: {section_spec.id}
@@ -1125,7 +1136,8 @@ Write the complete section now. Focus on quality and comprehensiveness - you hav
             prompt=prompt,
             system=system_prompt,
             temperature=0.7,
-            max_tokens=16384
+            max_tokens=16384,
+            cached_prefix=cached_prefix,
         )
 
         content = response.content
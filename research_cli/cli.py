@@ -11,7 +11,6 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .config import get_config, Config
-from .llm import ClaudeLLM, GeminiLLM, OpenAILLM
 
 console = Console()
 
@@ -183,6 +182,9 @@ def test(test_providers: bool):
 
 async def _test_providers():
     """Test all configured LLM providers."""
+    # Imported here so other commands don't load the provider SDKs
+    from .llm import ClaudeLLM, GeminiLLM, OpenAILLM
+
     config = get_config()
     validation = config.validate()
 
@@ -341,6 +343,19 @@ def run(
         ))
 
 
+async def _export_to_web() -> int:
+    """Run export_to_web in-process and return the number of exported projects.
+
+    Reuses the running interpreter and its already-imported modules instead
+    of starting a separate Python process; the file I/O runs in a worker
+    thread so the event loop stays free. The exporter's per-project summary,
+    meant for standalone runs, is turned off.
+    """
+    from export_to_web import export_results_to_web
+
+    return await asyncio.to_thread(export_results_to_web, quiet=True)
+
+
 async def _run_workflow(
     topic: str,
     num_experts: int,
@@ -470,14 +485,7 @@ async def _run_workflow(
         # Step 4: Export to web viewer
         console.print("[bold cyan]Step 4: Exporting to Web Viewer[/bold cyan]\n")
         try:
-            import subprocess
-            import sys
-            result = subprocess.run(
-                [sys.executable, "export_to_web.py"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            await _export_to_web()
             console.print("[green]✓ Results exported to web/data/[/green]")
             console.print("[dim]View at: http://localhost:8080/web/review-viewer.html[/dim]\n")
         except Exception as e:
@@ -675,14 +683,7 @@ async def _run_collaborative_from_run(
         # Export to web viewer
         console.print("\n[bold cyan]Step 4: Exporting to Web Viewer[/bold cyan]\n")
         try:
-            import subprocess
-            import sys
-            result = subprocess.run(
-                [sys.executable, "export_to_web.py"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            await _export_to_web()
             console.print("[green]✓ Results exported to web/data/[/green]")
             console.print("[dim]View at: http://localhost:8080/web/review-viewer.html[/dim]\n")
         except Exception as e:
@@ -8,7 +8,7 @@ import sqlite3
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 DB_PATH = Path("data/research.db")
 
@@ -436,6 +436,23 @@ def create_legacy_key(key: str, label: str = "", is_admin: bool = False):
         pass
 
 
+def create_legacy_keys(entries: Iterable[Tuple[str, str]]) -> int:
+    """Insert many legacy keys as (key, label) pairs in one transaction.
+
+    Returns the number of keys inserted (existing keys are skipped).
+    """
+    conn = get_connection()
+    now = _now()
+    before = conn.total_changes
+    with conn:
+        conn.executemany(
+            """INSERT OR IGNORE INTO api_keys (key, researcher_id, label, created_at, daily_quota, is_admin)
+               VALUES (?, NULL, ?, ?, 10, FALSE)""",
+            ((key, label, now) for key, label in entries),
+        )
+    return conn.total_changes - before
+
+
 def create_api_key_direct(label: str = "", daily_quota: int = 10) -> dict:
     """Create an API key directly (admin use, no researcher association)."""
     conn = get_connection()
@@ -1,18 +1,49 @@
-"""LLM provider abstractions and implementations."""
+"""LLM provider abstractions and implementations.
 
-from .base import BaseLLM, LLMResponse
-from .claude import ClaudeLLM
-from .openai import OpenAILLM
+Provider classes are imported lazily (PEP 562) because their SDKs
+(anthropic, openai, google-genai) take over a second to import together;
+code that only needs the base types or config should not pay for them.
+"""
 
-try:
-    from .gemini import GeminiLLM
-except ImportError:
-    GeminiLLM = None
+from .base import BaseLLM, LLMResponse
+from .circuit import CircuitBreaker, CircuitOpenError
+from .latency import LatencyTracker, LLMTimeoutError
+from .cache import FileBackend, LLMCache, MemoryBackend
 
 __all__ = [
     "BaseLLM",
     "LLMResponse",
+    "LLMCache",
+    "MemoryBackend",
+    "FileBackend",
+    "close_http_clients",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "LatencyTracker",
+    "LLMTimeoutError",
     "ClaudeLLM",
     "GeminiLLM",
     "OpenAILLM",
 ]
+
+
+def __getattr__(name):
+    if name == "ClaudeLLM":
+        from .claude import ClaudeLLM
+        value = ClaudeLLM
+    elif name == "OpenAILLM":
+        from .openai import OpenAILLM
+        value = OpenAILLM
+    elif name == "GeminiLLM":
+        try:
+            from .gemini import GeminiLLM
+            value = GeminiLLM
+        except ImportError:
+            value = None
+    elif name == "close_http_clients":
+        from .http import close_http_clients
+        value = close_http_clients
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
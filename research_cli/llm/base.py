@@ -3,9 +3,14 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple
 from dataclasses import dataclass
 
+from .circuit import breaker
+
+if TYPE_CHECKING:
+    from .cache import LLMCache
+
 logger = logging.getLogger(__name__)
 
 # Retry configuration
@@ -14,7 +19,13 @@ LLM_BASE_DELAY = 10  # seconds
 LLM_MAX_DELAY = 60   # seconds
 
 
-async def retry_llm_call(coro_factory, max_retries=LLM_MAX_RETRIES, base_delay=LLM_BASE_DELAY, max_delay=LLM_MAX_DELAY):
+async def retry_llm_call(
+    coro_factory,
+    max_retries=LLM_MAX_RETRIES,
+    base_delay=LLM_BASE_DELAY,
+    max_delay=LLM_MAX_DELAY,
+    circuit: Optional[Tuple[str, str]] = None,
+):
     """Retry an async LLM call with exponential backoff.
 
     Args:
@@ -22,6 +33,8 @@ async def retry_llm_call(coro_factory, max_retries=LLM_MAX_RETRIES, base_delay=L
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay in seconds before first retry
         max_delay: Maximum delay cap in seconds
+        circuit: Optional (provider, model) whose circuit breaker records the
+            final outcome (one success, or one failure once retries run out)
 
     Returns:
         The result of the coroutine
@@ -32,7 +45,7 @@ async def retry_llm_call(coro_factory, max_retries=LLM_MAX_RETRIES, base_delay=L
     last_exception = None
     for attempt in range(max_retries + 1):
         try:
-            return await coro_factory()
+            result = await coro_factory()
         except Exception as e:
             last_exception = e
             error_name = type(e).__name__
@@ -42,6 +55,8 @@ async def retry_llm_call(coro_factory, max_retries=LLM_MAX_RETRIES, base_delay=L
             non_retryable = ("invalid_api_key", "authentication", "permission", "not_found")
             if any(keyword in error_str.lower() for keyword in non_retryable):
                 logger.warning(f"LLM call failed with non-retryable error: {error_name}: {error_str}")
+                if circuit:
+                    breaker.record_failure(*circuit)
                 raise
 
             if attempt < max_retries:
@@ -56,10 +71,16 @@ async def retry_llm_call(coro_factory, max_retries=LLM_MAX_RETRIES, base_delay=L
                     f"LLM call failed after {max_retries + 1} attempts: "
                     f"{error_name}: {error_str}"
                 )
+        else:
+            if circuit:
+                breaker.record_success(*circuit)
+            return result
+    if circuit:
+        breaker.record_failure(*circuit)
     raise last_exception
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Standard response format from any LLM provider."""
 
@@ -69,6 +90,7 @@ class LLMResponse:
     input_tokens: Optional[int] = None
     output_tokens: Optional[int] = None
     stop_reason: Optional[str] = None  # "end_turn"/"stop" = normal, "max_tokens"/"length" = truncated
+    cached_input_tokens: Optional[int] = None  # Portion of input_tokens served from the prompt cache
 
     @property
     def total_tokens(self) -> Optional[int]:
@@ -77,6 +99,13 @@ class LLMResponse:
             return self.input_tokens + self.output_tokens
         return None
 
+    @property
+    def uncached_input_tokens(self) -> Optional[int]:
+        """Input tokens billed at the full (uncached) input rate."""
+        if self.input_tokens is None:
+            return None
+        return self.input_tokens - (self.cached_input_tokens or 0)
+
 
 class BaseLLM(ABC):
     """Abstract interface for LLM providers.
@@ -86,15 +115,17 @@ class BaseLLM(ABC):
     Claude, Gemini, GPT, and future providers.
     """
 
-    def __init__(self, api_key: str, model: str):
+    def __init__(self, api_key: str, model: str, cache: Optional["LLMCache"] = None):
         """Initialize LLM provider.
 
         Args:
             api_key: API authentication key
             model: Model identifier (e.g., "claude-opus-4-5", "gpt-4")
+            cache: Optional response cache for deterministic (temperature 0) calls
         """
         self.api_key = api_key
         self.model = model
+        self.cache = cache
 
     @abstractmethod
     async def generate(
@@ -142,6 +173,28 @@ class BaseLLM(ABC):
         """
         pass
 
+    async def batch_generate(
+        self,
+        prompts: List[Tuple[str, Optional[str]]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> List[LLMResponse]:
+        """Generate completions for many independent prompts as one batch job.
+
+        Batch jobs trade latency (up to 24h) for lower cost and separate rate
+        limits, so this suits offline passes whose results are not needed
+        immediately. Providers without a batch API raise NotImplementedError.
+
+        Args:
+            prompts: (prompt, system) pairs
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per prompt
+
+        Returns:
+            One LLMResponse per prompt, in input order
+        """
+        raise NotImplementedError(f"{self.provider_name} does not support batch generation")
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -0,0 +1,131 @@
+"""Deterministic LLM response cache.
+
+Calls made at temperature 0 with byte-identical requests return the same
+completion, so they can be answered from a local cache instead of the API.
+This is common during section re-runs, test loops and retried
+reviewer/moderator calls. Calls at any other temperature are never cached.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional, Protocol
+
+from .base import LLMResponse
+from ..utils import fast_json
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses, keyed by request hash."""
+
+    async def get(self, key: str) -> Optional[dict]: ...
+
+    async def set(self, key: str, value: dict) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class MemoryBackend:
+    """In-process LRU cache."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+
+    async def get(self, key: str) -> Optional[dict]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: dict) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class FileBackend:
+    """On-disk cache, one JSON file per entry, shared across processes.
+
+    Entries older than ttl seconds (by file mtime) are treated as misses.
+    """
+
+    def __init__(self, root: Optional[Path] = None, ttl: Optional[float] = None):
+        self.root = root or Path.home() / ".cache" / "research_cli" / "llm"
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return fast_json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, value: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(fast_json.dumps(value))
+        tmp.replace(path)
+
+    async def get(self, key: str) -> Optional[dict]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: dict) -> None:
+        await asyncio.to_thread(self._write, key, value)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+
+class LLMCache:
+    """Response cache for deterministic (temperature 0) LLM calls."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend or MemoryBackend()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def cache_key(model: str, messages: list, temperature: float, **params) -> Optional[str]:
+        """Hash a request, or return None if it is not deterministic.
+
+        Args:
+            model: Model identifier sent to the API
+            messages: Request messages
+            temperature: Temperature actually sent to the API
+            **params: Any other request parameters (max_tokens, response_format, ...)
+        """
+        if temperature != 0:
+            return None
+        payload = json.dumps(
+            {"model": model, "messages": messages, "temperature": temperature, "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[LLMResponse]:
+        """Return the cached response for key, if any."""
+        data = await self.backend.get(key)
+        if data is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return LLMResponse(**data)
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response under key."""
+        await self.backend.set(key, asdict(response))
@@ -0,0 +1,128 @@
+"""Per-model circuit breaker for LLM providers.
+
+When a provider is down or rate-limited, every call to it burns the full
+retry/backoff budget in ``retry_llm_call`` before failing over. The breaker
+remembers recent failures per (provider, model) so factories can skip a
+model that is known to be failing and go straight to its fallback.
+
+States:
+- closed: calls allowed; consecutive failures are counted
+- open: ``threshold`` consecutive failures seen; calls refused until
+  ``cooldown`` seconds have passed
+- half-open: cooldown elapsed; calls allowed again. One success closes
+  the circuit, one failure re-opens it for another cooldown
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0  # seconds
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a model is skipped because its circuit is open."""
+
+
+@dataclass
+class BreakerState:
+    """Failure tracking for one (provider, model) pair."""
+    failure_count: int = 0              # consecutive failures
+    opened_at: Optional[float] = None   # monotonic time the circuit opened
+    successes: int = 0                  # lifetime totals, for metrics()
+    failures: int = 0
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker keyed on (provider, model).
+
+    Holds no event-loop-bound primitives, so one module-level instance is
+    shared by every workflow, including those run in API server threads.
+    """
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN):
+        """Initialize breaker.
+
+        Args:
+            threshold: Consecutive failures that open a circuit
+            cooldown: Seconds an open circuit refuses calls before half-opening
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._state: Dict[Tuple[str, str], BreakerState] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: Tuple[str, str]) -> BreakerState:
+        state = self._state.get(key)
+        if state is None:
+            state = self._state[key] = BreakerState()
+        return state
+
+    def _state_name(self, state: BreakerState, now: float) -> str:
+        if state.opened_at is None:
+            return "closed"
+        if now - state.opened_at < self.cooldown:
+            return "open"
+        return "half-open"
+
+    def allow(self, provider: str, model: str) -> bool:
+        """Return False if calls to this model should be skipped right now."""
+        with self._lock:
+            state = self._state.get((provider, model))
+            if state is None:
+                return True
+            return self._state_name(state, time.monotonic()) != "open"
+
+    def record_success(self, provider: str, model: str) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            state = self._get((provider, model))
+            state.successes += 1
+            state.failure_count = 0
+            if state.opened_at is not None:
+                logger.info(f"Circuit closed for {provider}/{model}")
+            state.opened_at = None
+
+    def record_failure(self, provider: str, model: str) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            state = self._get((provider, model))
+            state.failures += 1
+            state.failure_count += 1
+            now = time.monotonic()
+            # A failed half-open probe re-opens immediately
+            if state.failure_count >= self.threshold or state.opened_at is not None:
+                if self._state_name(state, now) != "open":
+                    logger.warning(
+                        f"Circuit opened for {provider}/{model} after "
+                        f"{state.failure_count} consecutive failures; "
+                        f"skipping it for {self.cooldown:.0f}s"
+                    )
+                state.opened_at = now
+
+    def metrics(self) -> Dict[str, dict]:
+        """Per-model state and lifetime success/failure counts."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                f"{provider}/{model}": {
+                    "state": self._state_name(state, now),
+                    "successes": state.successes,
+                    "failures": state.failures,
+                    "consecutive_failures": state.failure_count,
+                }
+                for (provider, model), state in self._state.items()
+            }
+
+    def reset(self) -> None:
+        """Forget all state (for tests)."""
+        with self._lock:
+            self._state.clear()
+
+
+breaker = CircuitBreaker()
@@ -1,9 +1,11 @@
 """Anthropic Claude LLM provider implementation."""
 
-from typing import AsyncIterator, Optional
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Optional
 from anthropic import AsyncAnthropic
 
 from .base import BaseLLM, LLMResponse, retry_llm_call
+from .http import shared_http_client
 
 
 class ClaudeLLM(BaseLLM):
@@ -25,14 +27,58 @@ class ClaudeLLM(BaseLLM):
         client_kwargs = {"api_key": api_key}
         if base_url:
             client_kwargs["base_url"] = base_url
+        http_client = shared_http_client()
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
         self.client = AsyncAnthropic(**client_kwargs)
 
+    @staticmethod
+    def _build_messages(prompt: str, cached_prefix: Optional[str] = None) -> list:
+        """Build the user message, marking cached_prefix as a prompt-cache breakpoint.
+
+        Calls that share a byte-identical system prompt and cached_prefix within
+        the cache TTL (~5 min) are billed at the cached-input rate for that part.
+        """
+        if not cached_prefix:
+            return [{"role": "user", "content": prompt}]
+        return [{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt},
+            ],
+        }]
+
+    @staticmethod
+    def _usage_tokens(usage) -> tuple:
+        """Return (input_tokens, cached_input_tokens) from an Anthropic usage block.
+
+        Anthropic reports cache reads and writes separately from input_tokens;
+        they are folded back in so input_tokens covers the whole prompt, as
+        with the other providers.
+        """
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return usage.input_tokens + cache_read + cache_write, cache_read
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _system_blocks(system: str) -> list:
+        """Build the system content blocks once per distinct system prompt.
+
+        Agents reuse a handful of static system prompts, so the same block
+        list is handed to the SDK on every call instead of being rebuilt.
+        The SDK only reads it.
+        """
+        return [{"type": "text", "text": system}]
+
     async def generate(
         self,
         prompt: str,
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """Generate text using Claude.
@@ -42,12 +88,15 @@ class ClaudeLLM(BaseLLM):
             system: System prompt (Claude supports native system prompts)
             temperature: Sampling temperature
             max_tokens: Max output tokens
+            cached_prefix: Optional shared leading user content (e.g. a manuscript
+                reviewed by several specialists) sent ahead of prompt and marked
+                for Anthropic prompt caching
             **kwargs: Additional Claude-specific parameters
 
         Returns:
             LLMResponse with generated content
         """
-        messages = [{"role": "user", "content": prompt}]
+        messages = self._build_messages(prompt, cached_prefix)
 
         # Pop json_mode if passed (not natively supported by Claude API)
         kwargs.pop("json_mode", None)
@@ -61,19 +110,21 @@ class ClaudeLLM(BaseLLM):
                 **kwargs,
             )
             if system:
-                api_kwargs["system"] = [{"type": "text", "text": system}]
+                api_kwargs["system"] = self._system_blocks(system)
 
             response = await self.client.messages.create(**api_kwargs)
+            input_tokens, cached_tokens = self._usage_tokens(response.usage)
             return LLMResponse(
                 content=response.content[0].text,
                 model=response.model,
                 provider="anthropic",
-                input_tokens=response.usage.input_tokens,
+                input_tokens=input_tokens,
                 output_tokens=response.usage.output_tokens,
                 stop_reason=response.stop_reason,
+                cached_input_tokens=cached_tokens,
             )
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, circuit=(self.provider_name, self.model))
 
     async def generate_streaming(
         self,
@@ -81,6 +132,8 @@ class ClaudeLLM(BaseLLM):
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
         **kwargs
     ) -> LLMResponse:
         """Generate text using streaming to prevent proxy idle-connection timeouts.
@@ -88,8 +141,12 @@ class ClaudeLLM(BaseLLM):
         Behaves identically to generate() but uses the streaming API internally,
         keeping the HTTP connection alive with incremental chunks.  Returns the
         same LLMResponse once the full message has been received.
+
+        If on_text is given, it is called with each text delta as it arrives,
+        letting callers act on partial output while the response is still
+        being decoded.
         """
-        messages = [{"role": "user", "content": prompt}]
+        messages = self._build_messages(prompt, cached_prefix)
 
         async def _call():
             stream_kwargs = dict(
@@ -100,23 +157,27 @@ class ClaudeLLM(BaseLLM):
                 **kwargs,
             )
             if system:
-                stream_kwargs["system"] = [{"type": "text", "text": system}]
+                stream_kwargs["system"] = self._system_blocks(system)
 
             async with self.client.messages.stream(**stream_kwargs) as stream:
-                async for _chunk in stream.text_stream:
-                    pass  # drain the stream to keep connection alive
+                async for chunk in stream.text_stream:
+                    # Drain the stream to keep connection alive
+                    if on_text is not None:
+                        on_text(chunk)
                 message = await stream.get_final_message()
 
+            input_tokens, cached_tokens = self._usage_tokens(message.usage)
             return LLMResponse(
                 content=message.content[0].text,
                 model=message.model,
                 provider="anthropic",
-                input_tokens=message.usage.input_tokens,
+                input_tokens=input_tokens,
                 output_tokens=message.usage.output_tokens,
                 stop_reason=message.stop_reason,
+                cached_input_tokens=cached_tokens,
             )
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, circuit=(self.provider_name, self.model))
 
     async def stream(
         self,
@@ -124,6 +185,7 @@ class ClaudeLLM(BaseLLM):
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
         **kwargs
     ) -> AsyncIterator[str]:
         """Stream text generation from Claude.
@@ -133,12 +195,13 @@ class ClaudeLLM(BaseLLM):
             system: System prompt
             temperature: Sampling temperature
             max_tokens: Max output tokens
+            cached_prefix: Optional shared leading user content marked for prompt caching
             **kwargs: Additional parameters
 
         Yields:
             Text chunks as they arrive
         """
-        messages = [{"role": "user", "content": prompt}]
+        messages = self._build_messages(prompt, cached_prefix)
 
         stream_kwargs = dict(
             model=self.model,
@@ -148,7 +211,7 @@ class ClaudeLLM(BaseLLM):
             **kwargs,
         )
         if system:
-            stream_kwargs["system"] = [{"type": "text", "text": system}]
+            stream_kwargs["system"] = self._system_blocks(system)
 
         async with self.client.messages.stream(**stream_kwargs) as stream:
             async for text in stream.text_stream:
@@ -1,11 +1,12 @@
 """Google Gemini LLM provider implementation using the google-genai SDK."""
 
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Callable, Optional
 
 from google import genai
 from google.genai import types
 
 from .base import BaseLLM, LLMResponse, retry_llm_call
+from .http import shared_http_client
 
 
 class GeminiLLM(BaseLLM):
@@ -18,10 +19,13 @@ class GeminiLLM(BaseLLM):
 
     def __init__(self, api_key: str, model: str = "gemini-3-flash-preview"):
         super().__init__(api_key, model)
-        self.client = genai.Client(
-            api_key=api_key,
-            http_options=types.HttpOptions(timeout=300_000),  # 5 min
-        )
+        http_options = types.HttpOptions(timeout=300_000)  # 5 min
+        # Older google-genai releases have no httpx_async_client option and
+        # keep their own pool
+        http_client = shared_http_client()
+        if http_client is not None and "httpx_async_client" in types.HttpOptions.model_fields:
+            http_options.httpx_async_client = http_client
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
 
     @property
     def _is_thinking_model(self) -> bool:
@@ -40,12 +44,17 @@ class GeminiLLM(BaseLLM):
         system: Optional[str],
         **kwargs,
     ) -> types.GenerateContentConfig:
-        """Build GenerateContentConfig with thinking and json_mode support."""
+        """Build GenerateContentConfig with thinking and json_mode support.
+
+        With json_mode, an optional response_schema (OpenAPI-style dict)
+        constrains decoding to that structure, not just to valid JSON.
+        """
         effective_max_tokens = max_tokens
         if self._is_thinking_model:
             effective_max_tokens = max(max_tokens * 8, 8192)
 
         json_mode = kwargs.pop("json_mode", False)
+        response_schema = kwargs.pop("response_schema", None)
 
         thinking_config = None
         if self._is_gemini3:
@@ -57,6 +66,7 @@ class GeminiLLM(BaseLLM):
             system_instruction=system,
             thinking_config=thinking_config,
             response_mime_type="application/json" if json_mode else None,
+            response_schema=response_schema if json_mode else None,
         )
 
     async def generate(
@@ -65,17 +75,20 @@ class GeminiLLM(BaseLLM):
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
         **kwargs,
     ) -> LLMResponse:
         config = self._build_config(temperature, max_tokens, system, **kwargs)
+        # Shared context leads so Gemini's implicit prefix cache can match it
+        contents = cached_prefix + prompt if cached_prefix else prompt
 
         async def _call():
             response = await self.client.aio.models.generate_content(
-                model=self.model, contents=prompt, config=config,
+                model=self.model, contents=contents, config=config,
             )
             return self._parse_response(response)
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, circuit=(self.provider_name, self.model))
 
     async def generate_streaming(
         self,
@@ -83,6 +96,8 @@ class GeminiLLM(BaseLLM):
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
         **kwargs,
     ) -> LLMResponse:
         """Generate text using streaming to prevent proxy idle-connection timeouts.
@@ -90,24 +105,30 @@ class GeminiLLM(BaseLLM):
         Behaves identically to generate() but uses the streaming API internally,
         keeping the HTTP connection alive with incremental chunks. Returns the
         same LLMResponse once the full message has been received.
+
+        If on_text is given, it is called with each text chunk as it arrives.
         """
         config = self._build_config(temperature, max_tokens, system, **kwargs)
+        # Shared context leads so Gemini's implicit prefix cache can match it
+        contents = cached_prefix + prompt if cached_prefix else prompt
 
         async def _call():
             chunks_text = []
             last_chunk = None
             stream = await self.client.aio.models.generate_content_stream(
-                model=self.model, contents=prompt, config=config,
+                model=self.model, contents=contents, config=config,
             )
             async for chunk in stream:
                 last_chunk = chunk
                 if chunk.text:
                     chunks_text.append(chunk.text)
+                    if on_text is not None:
+                        on_text(chunk.text)
 
             content = "".join(chunks_text)
             return self._parse_response(last_chunk, content_override=content)
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, circuit=(self.provider_name, self.model))
 
     async def stream(
         self,
@@ -115,12 +136,15 @@ class GeminiLLM(BaseLLM):
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
         **kwargs,
     ) -> AsyncIterator[str]:
         config = self._build_config(temperature, max_tokens, system, **kwargs)
+        # Shared context leads so Gemini's implicit prefix cache can match it
+        contents = cached_prefix + prompt if cached_prefix else prompt
 
         stream = await self.client.aio.models.generate_content_stream(
-            model=self.model, contents=prompt, config=config,
+            model=self.model, contents=contents, config=config,
         )
         async for chunk in stream:
             if chunk.text:
@@ -136,9 +160,11 @@ class GeminiLLM(BaseLLM):
 
         input_tokens = None
         output_tokens = None
+        cached_tokens = None
         if response and hasattr(response, "usage_metadata") and response.usage_metadata:
             input_tokens = getattr(response.usage_metadata, "prompt_token_count", None)
             output_tokens = getattr(response.usage_metadata, "candidates_token_count", None)
+            cached_tokens = getattr(response.usage_metadata, "cached_content_token_count", None)
 
         stop_reason = None
         if response and hasattr(response, "candidates") and response.candidates:
@@ -153,6 +179,7 @@ class GeminiLLM(BaseLLM):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             stop_reason=stop_reason,
+            cached_input_tokens=cached_tokens,
         )
 
     @property
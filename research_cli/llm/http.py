@@ -0,0 +1,74 @@
+"""Shared HTTP connection pool for provider SDK clients.
+
+Each AsyncAnthropic/AsyncOpenAI client otherwise opens its own httpx pool,
+so every LLM instance (one per role and fallback) pays for fresh TCP/TLS
+handshakes. Instances created inside the same event loop share one pool
+instead. httpx pools are bound to the loop that opened their connections,
+so there is one pool per loop.
+"""
+
+import asyncio
+import weakref
+from typing import Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+# Matches the SDK default read timeout; long generations stream for minutes
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+class _SharedAsyncClient(httpx.AsyncClient):
+    """AsyncClient that ignores aclose() from the SDK clients sharing it.
+
+    SDK clients close their http_client on close(); WriterAgent does that to
+    drop a stalled connection before falling back. Cancelling the stalled
+    request already discards its connection, and the pool must stay open
+    for every other client, so only close_http_clients() really closes it.
+    """
+
+    async def aclose(self) -> None:
+        pass
+
+    async def _close(self) -> None:
+        await super().aclose()
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedAsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_http_client() -> Optional[httpx.AsyncClient]:
+    """Return the running loop's shared client, or None outside a loop.
+
+    Callers outside a running loop get None and should let the SDK create
+    its own client.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    client = _clients.get(loop)
+    if client is None:
+        client = _SharedAsyncClient(
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            http2=_HTTP2,
+            follow_redirects=True,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the running loop's shared client (call once at shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client._close()
@@ -0,0 +1,122 @@
+"""Rolling per-model latency tracking and adaptive request timeouts.
+
+Provider SDK defaults wait up to ten minutes for a response, so a slow
+provider stalls the workflow instead of failing over. The tracker keeps the
+most recent call durations per (provider, model, max_tokens bucket) and
+derives a timeout of twice the observed p99, so a call that runs far past
+what the model normally takes for that output budget is abandoned and
+handed to the fallback chain. Bucketing on max_tokens keeps short calls
+(title generation) from setting the budget for long ones (research notes)
+on the same model.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+LATENCY_WINDOW = 100        # recent calls kept per (model, bucket)
+LATENCY_MIN_SAMPLES = 20    # below this, no adaptive timeout is applied
+LATENCY_MIN_TIMEOUT = 5.0   # seconds
+LATENCY_MAX_TIMEOUT = 600.0  # seconds; the SDK default
+
+
+class LLMTimeoutError(RuntimeError):
+    """Raised when a call exceeds its model's adaptive timeout.
+
+    Transient from retry_llm_call's point of view, so the call is retried
+    and, once retries run out, counted as a circuit breaker failure.
+    """
+
+
+def _bucket(max_tokens: Optional[int]) -> int:
+    """Power-of-two ceiling of max_tokens; 0 when the caller gave none."""
+    if not max_tokens:
+        return 0
+    return 1 << (max_tokens - 1).bit_length()
+
+
+class LatencyTracker:
+    """Thread-safe rolling latency window keyed on (provider, model, bucket)."""
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = LATENCY_MIN_SAMPLES):
+        """Initialize tracker.
+
+        Args:
+            window: Number of recent durations kept per model
+            min_samples: Samples required before timeout_for() adapts
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[Tuple[str, str, int], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, provider: str, model: str, seconds: float, max_tokens: Optional[int] = None
+    ) -> None:
+        """Record the duration of a call.
+
+        Callers record timed-out attempts too (at the timeout they hit), so
+        a budget that proves too tight widens instead of failing forever.
+        """
+        key = (provider, model, _bucket(max_tokens))
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def _percentile(self, key: Tuple[str, str, int], q: float) -> Optional[float]:
+        with self._lock:
+            samples = self._samples.get(key)
+            if not samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def p50(self, provider: str, model: str, max_tokens: Optional[int] = None) -> Optional[float]:
+        """Median recent latency in seconds, or None without samples."""
+        return self._percentile((provider, model, _bucket(max_tokens)), 0.50)
+
+    def p99(self, provider: str, model: str, max_tokens: Optional[int] = None) -> Optional[float]:
+        """99th percentile recent latency in seconds, or None without samples."""
+        return self._percentile((provider, model, _bucket(max_tokens)), 0.99)
+
+    def timeout_for(
+        self, provider: str, model: str, max_tokens: Optional[int] = None
+    ) -> Optional[float]:
+        """Timeout for the next call: 2 x p99 within [5s, 600s].
+
+        Returns None (no timeout beyond the SDK's own) until min_samples
+        calls have been recorded for the model at this max_tokens bucket.
+        """
+        return self._timeout((provider, model, _bucket(max_tokens)))
+
+    def _timeout(self, key: Tuple[str, str, int]) -> Optional[float]:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+        p99 = self._percentile(key, 0.99)
+        return min(LATENCY_MAX_TIMEOUT, max(LATENCY_MIN_TIMEOUT, 2 * p99))
+
+    def metrics(self) -> Dict[str, dict]:
+        """Per-model (and max_tokens bucket) sample count, p50, p99 and timeout."""
+        with self._lock:
+            keys = list(self._samples)
+        return {
+            (f"{provider}/{model}@{bucket}" if bucket else f"{provider}/{model}"): {
+                "samples": len(self._samples[(provider, model, bucket)]),
+                "p50": self._percentile((provider, model, bucket), 0.50),
+                "p99": self._percentile((provider, model, bucket), 0.99),
+                "timeout": self._timeout((provider, model, bucket)),
+            }
+            for provider, model, bucket in keys
+        }
+
+    def reset(self) -> None:
+        """Forget all samples (for tests)."""
+        with self._lock:
+            self._samples.clear()
+
+
+latency = LatencyTracker()
@@ -1,9 +1,74 @@
 """OpenAI GPT LLM provider implementation."""
 
-from typing import AsyncIterator, Optional
+import asyncio
+import io
+import logging
+import time
+from typing import AsyncIterator, List, Optional, Tuple
 from openai import AsyncOpenAI
 
 from .base import BaseLLM, LLMResponse, retry_llm_call
+from .cache import LLMCache
+from .http import shared_http_client
+from .latency import LLMTimeoutError, latency
+from .tokens import count_message_tokens, count_tokens
+from ..utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+# Batch API polling (batches take minutes to hours)
+BATCH_POLL_INITIAL = 10   # seconds
+BATCH_POLL_MAX = 300      # seconds
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_FAILED = ("failed", "expired", "cancelled")
+
+
+def _cached_tokens(usage) -> Optional[int]:
+    """Prompt tokens served from OpenAI's automatic prefix cache, if reported."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", None) if details else None
+
+
+async def _read_sse(lines: AsyncIterator[str], model: str) -> LLMResponse:
+    """Assemble a chat completion from raw server-sent event lines.
+
+    Decodes each data frame with fast_json and reads only the fields used
+    here, instead of validating a full ChatCompletionChunk per frame.
+    """
+    parts = []
+    finish_reason = None
+    usage = None
+    async for line in lines:
+        # Skip blank separators, ": keep-alive" comments and event: lines
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        frame = fast_json.loads(data)
+        if frame.get("error"):
+            raise RuntimeError(f"OpenAI stream error: {frame['error']}")
+        choices = frame.get("choices")
+        if choices:
+            choice = choices[0]
+            content = (choice.get("delta") or {}).get("content")
+            if content:
+                parts.append(content)
+            if choice.get("finish_reason"):
+                finish_reason = choice["finish_reason"]
+        if frame.get("usage"):
+            usage = frame["usage"]
+
+    usage = usage or {}
+    return LLMResponse(
+        content="".join(parts),
+        model=model,
+        provider="openai",
+        input_tokens=usage.get("prompt_tokens"),
+        output_tokens=usage.get("completion_tokens"),
+        stop_reason=finish_reason,
+        cached_input_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens"),
+    )
 
 
 class OpenAILLM(BaseLLM):
@@ -13,26 +78,90 @@ class OpenAILLM(BaseLLM):
     Uses the official OpenAI Python SDK.
     """
 
-    def __init__(self, api_key: str, model: str = "gpt-5.2-pro", base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-5.2-pro",
+        base_url: Optional[str] = None,
+        cache: Optional[LLMCache] = None,
+        raw_stream: bool = True,
+    ):
         """Initialize OpenAI client.
 
         Args:
             api_key: OpenAI API key
             model: GPT model ID (default: GPT-4 Turbo)
             base_url: Optional custom base URL (e.g. OpenRouter)
+            cache: Optional response cache; generate() answers repeated
+                temperature-0 requests from it
+            raw_stream: Parse generate_streaming() SSE frames directly rather
+                than through the SDK's typed chunk objects
         """
-        super().__init__(api_key, model)
+        super().__init__(api_key, model, cache=cache)
+        self.raw_stream = raw_stream
         client_kwargs = {"api_key": api_key}
         if base_url:
             client_kwargs["base_url"] = base_url
+        http_client = shared_http_client()
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
         self.client = AsyncOpenAI(**client_kwargs)
 
+    @staticmethod
+    def _build_messages(prompt: str, system: Optional[str], cached_prefix: Optional[str] = None) -> list:
+        """Build chat messages with stable content first and the volatile tail last.
+
+        OpenAI caches prompts automatically once the leading >=1024 tokens are
+        byte-identical across calls, so the system prompt and cached_prefix
+        lead and only the per-call prompt varies.
+        """
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        content = cached_prefix + prompt if cached_prefix else prompt
+        messages.append({"role": "user", "content": content})
+        return messages
+
+    def _fill_missing_usage(self, response: LLMResponse, messages: list) -> LLMResponse:
+        """Estimate token counts that the endpoint didn't report.
+
+        Some OpenAI-compatible proxies omit usage (or drop it from streams);
+        counting locally keeps cost tracking from silently recording zero.
+        """
+        if response.input_tokens is None:
+            response.input_tokens = count_message_tokens(messages, self.model)
+        if response.output_tokens is None:
+            response.output_tokens = count_tokens(response.content or "", self.model)
+        return response
+
+    async def _timed(self, coro_factory, max_tokens: Optional[int] = None):
+        """Run one request attempt under the model's adaptive timeout.
+
+        The timeout comes from calls with a similar max_tokens budget. An
+        attempt that runs past 2 x their recent p99 raises LLMTimeoutError so
+        retry_llm_call and the caller's fallback handle it instead of waiting
+        on the SDK default; its duration is still recorded, so the budget
+        widens if it was too tight.
+        """
+        timeout = latency.timeout_for(self.provider_name, self.model, max_tokens)
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(coro_factory(), timeout=timeout)
+        except asyncio.TimeoutError:
+            latency.record(self.provider_name, self.model, time.monotonic() - start, max_tokens)
+            raise LLMTimeoutError(
+                f"{self.provider_name}/{self.model} exceeded adaptive timeout of {timeout:.1f}s"
+            ) from None
+        latency.record(self.provider_name, self.model, time.monotonic() - start, max_tokens)
+        return result
+
     async def generate(
         self,
         prompt: str,
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """Generate text using OpenAI GPT.
@@ -42,15 +171,15 @@ class OpenAILLM(BaseLLM):
             system: System prompt (OpenAI supports native system messages)
             temperature: Sampling temperature
             max_tokens: Max output tokens
+            cached_prefix: Optional shared leading user content (e.g. context
+                repeated across calls) placed ahead of prompt so the request
+                prefix stays cacheable
             **kwargs: Additional OpenAI-specific parameters
 
         Returns:
             LLMResponse with generated content
         """
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system, cached_prefix)
 
         # gpt-5 models only support temperature=1
         api_temp = 1.0 if "gpt-5" in self.model else temperature
@@ -61,13 +190,13 @@ class OpenAILLM(BaseLLM):
             kwargs.setdefault("response_format", {"type": "json_object"})
 
         async def _call():
-            response = await self.client.chat.completions.create(
+            response = await self._timed(lambda: self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=api_temp,
                 max_tokens=max_tokens,
                 **kwargs
-            )
+            ), max_tokens)
             return LLMResponse(
                 content=response.choices[0].message.content,
                 model=response.model,
@@ -75,9 +204,22 @@ class OpenAILLM(BaseLLM):
                 input_tokens=response.usage.prompt_tokens if response.usage else None,
                 output_tokens=response.usage.completion_tokens if response.usage else None,
                 stop_reason=response.choices[0].finish_reason,
+                cached_input_tokens=_cached_tokens(response.usage) if response.usage else None,
             )
 
-        return await retry_llm_call(_call)
+        key = None
+        if self.cache is not None:
+            key = self.cache.cache_key(self.model, messages, api_temp, max_tokens=max_tokens, **kwargs)
+        if key is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await retry_llm_call(_call, circuit=(self.provider_name, self.model))
+        self._fill_missing_usage(response, messages)
+        if key is not None:
+            await self.cache.set(key, response)
+        return response
 
     async def generate_streaming(
         self,
@@ -85,6 +227,7 @@ class OpenAILLM(BaseLLM):
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """Generate text using streaming to prevent proxy idle-connection timeouts.
@@ -93,15 +236,16 @@ class OpenAILLM(BaseLLM):
         keeping the HTTP connection alive with incremental chunks. Returns the
         same LLMResponse once the full message has been received.
         """
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system, cached_prefix)
 
         # gpt-5 models only support temperature=1
         api_temp = 1.0 if "gpt-5" in self.model else temperature
 
-        async def _call():
+        if self.raw_stream:
+            response = await self._generate_raw_stream(messages, api_temp, max_tokens, **kwargs)
+            return self._fill_missing_usage(response, messages)
+
+        async def _consume():
             stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
@@ -116,6 +260,7 @@ class OpenAILLM(BaseLLM):
             finish_reason = None
             input_tokens = None
             output_tokens = None
+            cached_tokens = None
 
             async for chunk in stream:
                 if chunk.choices and chunk.choices[0].delta.content:
@@ -127,6 +272,7 @@ class OpenAILLM(BaseLLM):
                 if hasattr(chunk, "usage") and chunk.usage:
                     input_tokens = chunk.usage.prompt_tokens
                     output_tokens = chunk.usage.completion_tokens
+                    cached_tokens = _cached_tokens(chunk.usage)
 
             return LLMResponse(
                 content="".join(full_content),
@@ -135,9 +281,44 @@ class OpenAILLM(BaseLLM):
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 stop_reason=finish_reason,
+                cached_input_tokens=cached_tokens,
             )
 
-        return await retry_llm_call(_call)
+        async def _call():
+            return await self._timed(_consume, max_tokens)
+
+        response = await retry_llm_call(_call, circuit=(self.provider_name, self.model))
+        return self._fill_missing_usage(response, messages)
+
+    async def _generate_raw_stream(
+        self,
+        messages: list,
+        temperature: float,
+        max_tokens: int,
+        **kwargs
+    ) -> LLMResponse:
+        """Streaming completion read from the raw HTTP response.
+
+        Goes through the SDK's with_streaming_response, so auth, base_url and
+        status-code errors are handled as usual, but skips the per-chunk
+        pydantic parsing, which dominates client CPU on long responses.
+        """
+        async def _consume():
+            async with self.client.chat.completions.with_streaming_response.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True},
+                **kwargs
+            ) as response:
+                return await _read_sse(response.iter_lines(), self.model)
+
+        async def _call():
+            return await self._timed(_consume, max_tokens)
+
+        return await retry_llm_call(_call, circuit=(self.provider_name, self.model))
 
     async def stream(
         self,
@@ -145,6 +326,7 @@ class OpenAILLM(BaseLLM):
         system: Optional[str] = None,
         temperature: float = 1.0,
         max_tokens: int = 4096,
+        cached_prefix: Optional[str] = None,
         **kwargs
     ) -> AsyncIterator[str]:
         """Stream text generation from OpenAI.
@@ -154,15 +336,13 @@ class OpenAILLM(BaseLLM):
             system: System prompt
             temperature: Sampling temperature
             max_tokens: Max output tokens
+            cached_prefix: Optional shared leading user content placed ahead of prompt
             **kwargs: Additional parameters
 
         Yields:
             Text chunks as they arrive
         """
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system, cached_prefix)
 
         api_temp = 1.0 if "gpt-5" in self.model else temperature
 
@@ -179,6 +359,104 @@ class OpenAILLM(BaseLLM):
             if chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
 
+    async def batch_generate(
+        self,
+        prompts: List[Tuple[str, Optional[str]]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> List[LLMResponse]:
+        """Generate completions for many prompts through the OpenAI Batch API.
+
+        Uploads the requests as a JSONL file, creates a batch with a 24h
+        completion window and polls it with exponential backoff. Batch
+        requests cost half as much as synchronous calls and draw on a
+        separate rate limit.
+
+        Args:
+            prompts: (prompt, system) pairs
+            temperature: Sampling temperature
+            max_tokens: Max output tokens per prompt
+
+        Returns:
+            One LLMResponse per prompt, in input order
+
+        Raises:
+            RuntimeError: If the batch fails, expires or is cancelled, or any
+                request in it returns an error
+        """
+        if not prompts:
+            return []
+
+        api_temp = 1.0 if "gpt-5" in self.model else temperature
+        lines = []
+        for i, (prompt, system) in enumerate(prompts):
+            lines.append(fast_json.dumps({
+                "custom_id": f"req-{i}",
+                "method": "POST",
+                "url": _BATCH_ENDPOINT,
+                "body": {
+                    "model": self.model,
+                    "messages": self._build_messages(prompt, system),
+                    "temperature": api_temp,
+                    "max_tokens": max_tokens,
+                },
+            }))
+        jsonl = b"\n".join(lines) + b"\n"
+
+        input_file = await retry_llm_call(lambda: self.client.files.create(
+            file=("batch_input.jsonl", io.BytesIO(jsonl)), purpose="batch",
+        ))
+        batch = await retry_llm_call(lambda: self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        ))
+        logger.info(f"OpenAI batch {batch.id} submitted with {len(prompts)} requests")
+
+        delay = BATCH_POLL_INITIAL
+        while batch.status != "completed":
+            if batch.status in _BATCH_FAILED:
+                raise RuntimeError(f"OpenAI batch {batch.id} {batch.status}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX)
+            batch = await retry_llm_call(lambda: self.client.batches.retrieve(batch.id))
+
+        results: dict = {}
+        if batch.output_file_id:
+            output = await retry_llm_call(lambda: self.client.files.content(batch.output_file_id))
+            for line in output.content.splitlines():
+                if line.strip():
+                    record = fast_json.loads(line)
+                    results[record["custom_id"]] = record
+
+        responses = []
+        failed = []
+        for i in range(len(prompts)):
+            record = results.get(f"req-{i}")
+            response = (record or {}).get("response") or {}
+            if record is None or record.get("error") or response.get("status_code") != 200:
+                failed.append(f"req-{i}")
+                continue
+            body = response["body"]
+            usage = body.get("usage") or {}
+            choice = body["choices"][0]
+            responses.append(LLMResponse(
+                content=choice["message"]["content"],
+                model=body.get("model", self.model),
+                provider="openai",
+                input_tokens=usage.get("prompt_tokens"),
+                output_tokens=usage.get("completion_tokens"),
+                stop_reason=choice.get("finish_reason"),
+                cached_input_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens"),
+            ))
+
+        if failed:
+            raise RuntimeError(
+                f"OpenAI batch {batch.id}: {len(failed)}/{len(prompts)} requests failed "
+                f"({', '.join(failed[:5])}{', ...' if len(failed) > 5 else ''})"
+            )
+        return responses
+
     @property
     def provider_name(self) -> str:
         """Provider identifier."""
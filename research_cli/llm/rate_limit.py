@@ -0,0 +1,72 @@
+"""Client-side request and token pacing for LLM providers.
+
+Provider rate limits are enforced per minute. Pacing requests just under
+those limits up front is cheaper than tripping a 429 and waiting out the
+exponential backoff in ``retry_llm_call``.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+
+class RateLimiter:
+    """Sliding-window limiter for requests-per-minute and tokens-per-minute.
+
+    Holds no event-loop-bound primitives, so a single module-level instance
+    can be shared across workflows and ``asyncio.run`` invocations. Check
+    and record happen without an intervening ``await``, which makes
+    ``acquire`` atomic under the single-threaded event loop.
+    """
+
+    def __init__(self, rpm: int, tpm: Optional[int] = None, period: float = 60.0):
+        """Initialize limiter.
+
+        Args:
+            rpm: Maximum requests per period
+            tpm: Maximum estimated tokens per period (None = unlimited)
+            period: Window length in seconds
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.period = period
+        self._events: deque = deque()  # (timestamp, tokens)
+        self._window_tokens = 0
+
+    def _prune(self, now: float) -> None:
+        """Drop events that have left the window."""
+        cutoff = now - self.period
+        while self._events and self._events[0][0] <= cutoff:
+            _, tokens = self._events.popleft()
+            self._window_tokens -= tokens
+
+    def _has_capacity(self, tokens: int) -> bool:
+        if len(self._events) >= self.rpm:
+            return False
+        if self.tpm is None or not self._events:
+            # An oversized request is admitted into an empty window rather
+            # than blocking forever
+            return True
+        return self._window_tokens + tokens <= self.tpm
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request of ``tokens`` estimated tokens fits the window.
+
+        Args:
+            tokens: Estimated input + output tokens for the request
+        """
+        while True:
+            now = time.monotonic()
+            self._prune(now)
+            if self._has_capacity(tokens):
+                self._events.append((now, tokens))
+                self._window_tokens += tokens
+                return
+            # Sleep until the oldest event expires, then re-check
+            await asyncio.sleep(max(self._events[0][0] + self.period - now, 0.01))
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 0) -> int:
+    """Rough token estimate for pacing: ~4 characters per token plus output budget."""
+    return len(text) // 4 + max_output_tokens
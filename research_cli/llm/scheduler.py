@@ -0,0 +1,50 @@
+"""Bounded, rate-limited execution of concurrent LLM calls."""
+
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from .rate_limit import RateLimiter
+
+T = TypeVar("T")
+
+# Defaults sized for a single workflow fanning out section writes
+SCHEDULER_MAX_CONCURRENCY = 10
+SCHEDULER_RPM = 500
+SCHEDULER_TPM = 200_000
+
+
+class LLMScheduler:
+    """Caps in-flight LLM calls and paces them under RPM/TPM limits.
+
+    The semaphore binds to the event loop on first use, so create one
+    scheduler per workflow run rather than sharing a module-level instance.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = SCHEDULER_MAX_CONCURRENCY,
+        rpm: int = SCHEDULER_RPM,
+        tpm: Optional[int] = SCHEDULER_TPM,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrency: Maximum calls running at once
+            rpm: Requests per minute
+            tpm: Estimated tokens per minute (None = unlimited)
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._limiter = RateLimiter(rpm=rpm, tpm=tpm)
+
+    async def submit(self, coro_factory: Callable[[], Awaitable[T]], estimated_tokens: int = 0) -> T:
+        """Run a call once a concurrency slot and rate-limit budget are free.
+
+        Args:
+            coro_factory: Callable returning the coroutine that performs the
+                LLM call; it is only called once the call is admitted
+            estimated_tokens: Estimated input + output tokens, debited from
+                the TPM budget before the call starts
+        """
+        async with self._semaphore:
+            await self._limiter.acquire(estimated_tokens)
+            return await coro_factory()
@@ -0,0 +1,101 @@
+"""Token counting with a content-hash cache.
+
+System prompts and shared context prefixes are re-sent on hundreds of calls
+per workflow, so counts are cached by SHA-256 of the text and each distinct
+block is tokenized once.
+
+tiktoken is optional. Without it, counts fall back to a ~4 characters per
+token estimate, which is close enough for budgeting and cost estimates.
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+TOKEN_CACHE_SIZE = 4096
+CHARS_PER_TOKEN = 4
+
+# OpenAI vision pricing: a low-detail image is a flat 85 tokens; high
+# detail adds 170 per 512px tile. Sizes aren't known here, so high/auto
+# assumes a 1024x1024 image (4 tiles).
+IMAGE_TOKENS_LOW = 85
+IMAGE_TOKENS_HIGH = 85 + 170 * 4
+
+# Per-message overhead of the chat format (role and separators)
+MESSAGE_OVERHEAD_TOKENS = 3
+
+_counts: Dict[Tuple[str, bytes], int] = {}
+
+
+@lru_cache(maxsize=1024)
+def get_encoder(model: str):
+    """tiktoken encoding for a model, or None if tiktoken is unavailable.
+
+    Models tiktoken doesn't know (Claude, Gemini, new OpenAI releases) use
+    o200k_base, which is close enough for estimates.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(content: str, model: str) -> int:
+    """Number of tokens in content under the model's encoding.
+
+    Args:
+        content: Text to count
+        model: Model ID used to pick the encoding
+
+    Returns:
+        Token count (estimated from length if tiktoken is not installed)
+    """
+    encoder = get_encoder(model)
+    if encoder is None:
+        return (len(content) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    key = (encoder.name, hashlib.sha256(content.encode("utf-8")).digest())
+    count = _counts.get(key)
+    if count is None:
+        count = len(encoder.encode(content, disallowed_special=()))
+        if len(_counts) >= TOKEN_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _counts.pop(next(iter(_counts)), None)
+        _counts[key] = count
+    return count
+
+
+def count_message_tokens(messages: Iterable[dict], model: str) -> int:
+    """Prompt tokens for chat messages, including image parts.
+
+    Args:
+        messages: Chat messages whose content is a string or a list of
+            OpenAI-style content parts ("text" / "image_url")
+        model: Model ID used to pick the encoding
+    """
+    total = 0
+    for message in messages:
+        total += MESSAGE_OVERHEAD_TOKENS
+        content = message.get("content") or ""
+        if isinstance(content, str):
+            total += count_tokens(content, model)
+            continue
+        for part in content:
+            if part.get("type") == "text":
+                total += count_tokens(part.get("text", ""), model)
+            elif part.get("type") == "image_url":
+                detail: Optional[str] = (part.get("image_url") or {}).get("detail")
+                total += IMAGE_TOKENS_LOW if detail == "low" else IMAGE_TOKENS_HIGH
+    return total
+
+
+def clear_token_cache() -> None:
+    """Drop cached counts (for tests)."""
+    _counts.clear()
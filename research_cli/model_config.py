@@ -4,56 +4,105 @@ Reads config/models.json and provides:
 - Role-based model/provider lookup
 - LLM instance factory with fallback chain
 - Pricing data for cost estimation
+
+Pricing entries are USD per 1M tokens:
+    "pricing": {"<model>": {"input": 3.0, "input_cached": 0.3, "output": 15.0}}
+"input_cached" is the prompt-cache read rate; entries without it are billed
+at the full input rate.
 """
 
-import json
 import logging
 import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from .llm.base import BaseLLM
+from .llm.base import BaseLLM, LLMResponse
+from .llm.circuit import CircuitOpenError, breaker
+from .utils.fast_json import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
 # Resolve config path relative to project root (two levels up from this file)
 _CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "models.json"
 
-# Cached config data
+# Cached config data and the models.json mtime it was parsed from
 _config_data: Optional[dict] = None
+_config_mtime_ns: Optional[int] = None
+
+# Pricing for models missing from config (Sonnet-class rates)
+_DEFAULT_PRICING = {"input": 3.0, "input_cached": 0.30, "output": 15.0}
+
+# Response cache shared by OpenAI-compatible clients. LLM_CACHE=memory keeps
+# it in-process; LLM_CACHE=file persists it under ~/.cache/research_cli/llm.
+# Only temperature-0 calls are cached.
+_llm_cache = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelSpec:
     """A single model+provider pair."""
     model: str
     provider: str
 
+    def __post_init__(self):
+        # Provider names repeat across every role; share one string per value
+        if isinstance(self.provider, str):
+            object.__setattr__(self, "provider", sys.intern(self.provider))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RoleConfig:
-    """Complete configuration for a role."""
+    """Complete configuration for a role (immutable; instances are cached)."""
     role: str
     primary: ModelSpec
-    fallback: List[ModelSpec]
+    fallback: Tuple[ModelSpec, ...]
     temperature: float
     max_tokens: int
 
 
+def _clear_lookup_caches() -> None:
+    _role_config.cache_clear()
+    _pricing.cache_clear()
+    _provider_env.cache_clear()
+
+
 def _load_config() -> dict:
-    """Load and cache models.json."""
-    global _config_data
-    if _config_data is None:
-        if not _CONFIG_PATH.exists():
-            raise FileNotFoundError(f"Model config not found: {_CONFIG_PATH}")
-        with open(_CONFIG_PATH) as f:
-            _config_data = json.load(f)
+    """Load and cache models.json, re-reading it when the file changes.
+
+    Costs one stat() per call. A changed mtime re-parses the file and
+    clears the role/pricing/provider lookup caches built on top of it. A
+    file that fails to parse (e.g. saved mid-edit) is logged and the last
+    good config is kept; it only raises if no config has loaded yet.
+    """
+    global _config_data, _config_mtime_ns
+    try:
+        mtime_ns = _CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        if _config_data is not None:
+            return _config_data
+        raise FileNotFoundError(f"Model config not found: {_CONFIG_PATH}") from None
+    if _config_data is None or mtime_ns != _config_mtime_ns:
+        try:
+            data = json_loads(_CONFIG_PATH.read_bytes())
+        except ValueError as e:
+            if _config_data is None:
+                raise
+            # Don't re-parse (and re-log) until the file changes again
+            _config_mtime_ns = mtime_ns
+            logger.error(f"Ignoring invalid model config {_CONFIG_PATH}: {e}")
+            return _config_data
+        if _config_data is not None:
+            logger.info(f"Reloading model config: {_CONFIG_PATH} changed")
+        _clear_lookup_caches()
+        _config_data, _config_mtime_ns = data, mtime_ns
     return _config_data
 
 
 def reload_config():
-    """Force reload config (useful for testing or hot-reload)."""
+    """Force reload config (useful for testing; file edits reload automatically)."""
     global _config_data
     _config_data = None
     _load_config()
@@ -71,6 +120,12 @@ def get_role_config(role: str) -> RoleConfig:
     Raises:
         KeyError: If role is not defined in config
     """
+    _load_config()  # invalidates _role_config if models.json changed
+    return _role_config(role)
+
+
+@lru_cache(maxsize=32)
+def _role_config(role: str) -> RoleConfig:
     config = _load_config()
     roles = config["roles"]
     if role not in roles:
@@ -94,7 +149,7 @@ def get_role_config(role: str) -> RoleConfig:
         fallback_data = role_data.get("fallback", [])
 
     primary = ModelSpec(**primary_data)
-    fallback = [ModelSpec(**f) for f in fallback_data]
+    fallback = tuple(ModelSpec(**f) for f in fallback_data)
 
     return RoleConfig(
         role=role,
@@ -121,30 +176,43 @@ def get_reviewer_rotation() -> List[ModelSpec]:
     return [rc.primary]
 
 
+@lru_cache(maxsize=16)
+def _provider_env(provider: str) -> Tuple[str, str, str, str, str]:
+    """Environment variable names configured for a provider.
+
+    Returns (env_key, env_key_alt, env_base_url, shared LLM key, shared LLM
+    base URL); empty strings where unset. Only the names are cached; values
+    are read from the environment on every call so key changes still apply.
+    """
+    provider_config = _load_config().get("provider_config", {})
+    provider_cfg = provider_config.get(provider, {})
+    llm_cfg = provider_config.get("llm", {})
+    return (
+        provider_cfg.get("env_key", ""),
+        provider_cfg.get("env_key_alt", ""),
+        provider_cfg.get("env_base_url", ""),
+        llm_cfg.get("env_key", ""),
+        llm_cfg.get("env_base_url", ""),
+    )
+
+
 def _get_api_key(provider: str) -> str:
     """Get API key for a provider from environment.
 
     Priority: provider-specific key > LLM_API_KEY (shared/router key).
     """
-    config = _load_config()
-    provider_cfg = config.get("provider_config", {}).get(provider, {})
+    env_key, alt_key, _, llm_key, _ = _provider_env(provider)
 
     # Try provider-specific env key
-    env_key = provider_cfg.get("env_key", "")
     api_key = os.environ.get(env_key, "") if env_key else ""
 
     # Try alternate env key (e.g. ANTHROPIC_AUTH_TOKEN)
-    if not api_key:
-        alt_key = provider_cfg.get("env_key_alt", "")
-        if alt_key:
-            api_key = os.environ.get(alt_key, "")
+    if not api_key and alt_key:
+        api_key = os.environ.get(alt_key, "")
 
     # Fallback to shared LLM_API_KEY (e.g. LiteLLM/OpenRouter router key)
-    if not api_key:
-        llm_cfg = config.get("provider_config", {}).get("llm", {})
-        llm_key = llm_cfg.get("env_key", "")
-        if llm_key:
-            api_key = os.environ.get(llm_key, "")
+    if not api_key and llm_key:
+        api_key = os.environ.get(llm_key, "")
 
     if not api_key:
         raise ValueError(
@@ -162,9 +230,7 @@ def _get_base_url(provider: str) -> Optional[str]:
     Note: Anthropic provider does NOT fallback to LLM_BASE_URL, as it should
     use the direct Anthropic API unless ANTHROPIC_BASE_URL is explicitly set.
     """
-    config = _load_config()
-    provider_cfg = config.get("provider_config", {}).get(provider, {})
-    env_base_url = provider_cfg.get("env_base_url", "")
+    _, _, env_base_url, _, llm_base = _provider_env(provider)
     base_url = os.environ.get(env_base_url, "") if env_base_url else ""
 
     # Anthropic & Google: only use direct API, no fallback to LLM_BASE_URL
@@ -172,15 +238,28 @@ def _get_base_url(provider: str) -> Optional[str]:
         return base_url or None
 
     # Other providers: fallback to shared LLM_BASE_URL (e.g. LiteLLM/OpenRouter endpoint)
-    if not base_url:
-        llm_cfg = config.get("provider_config", {}).get("llm", {})
-        llm_base = llm_cfg.get("env_base_url", "")
-        if llm_base:
-            base_url = os.environ.get(llm_base, "")
+    if not base_url and llm_base:
+        base_url = os.environ.get(llm_base, "")
 
     return base_url or None
 
 
+def _get_llm_cache():
+    """Return the shared response cache, or None if LLM_CACHE is unset."""
+    global _llm_cache
+    mode = os.getenv("LLM_CACHE", "").lower()
+    if _llm_cache is None and mode in ("memory", "file"):
+        from .llm.cache import FileBackend, LLMCache, MemoryBackend
+        _llm_cache = LLMCache(FileBackend() if mode == "file" else MemoryBackend())
+    return _llm_cache
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Hit/miss counts for the shared LLM response cache (empty if disabled)."""
+    cache = _get_llm_cache()
+    return dict(cache.stats) if cache else {}
+
+
 def _create_llm(provider: str, model: str) -> BaseLLM:
     """Create an LLM instance for a specific provider and model.
 
@@ -190,7 +269,21 @@ def _create_llm(provider: str, model: str) -> BaseLLM:
 
     Returns:
         BaseLLM instance (ClaudeLLM or OpenAILLM)
+
+    Raises:
+        ValueError: If the API key is missing or the provider is unknown
+        CircuitOpenError: If the model's circuit breaker is open
     """
+    llm = _instantiate_llm(provider, model)
+    # Keyed on the client actually used, since routed providers (deepseek,
+    # google via base_url) go through OpenAILLM
+    if not breaker.allow(llm.provider_name, llm.model):
+        raise CircuitOpenError(f"Circuit open for {llm.provider_name}/{llm.model}")
+    return llm
+
+
+def _instantiate_llm(provider: str, model: str) -> BaseLLM:
+    """Build the provider client for a model (no circuit breaker check)."""
     api_key = _get_api_key(provider)
     base_url = _get_base_url(provider)
 
@@ -199,12 +292,12 @@ def _create_llm(provider: str, model: str) -> BaseLLM:
         return ClaudeLLM(api_key=api_key, model=model, base_url=base_url)
     elif provider == "openai":
         from .llm.openai import OpenAILLM
-        return OpenAILLM(api_key=api_key, model=model, base_url=base_url)
+        return OpenAILLM(api_key=api_key, model=model, base_url=base_url, cache=_get_llm_cache())
     elif provider == "google":
         # If a custom base_url is present, use OpenAILLM (e.g. for LiteLLM routing)
         if base_url:
             from .llm.openai import OpenAILLM
-            return OpenAILLM(api_key=api_key, model=model, base_url=base_url)
+            return OpenAILLM(api_key=api_key, model=model, base_url=base_url, cache=_get_llm_cache())
         else:
             from .llm.gemini import GeminiLLM
             return GeminiLLM(api_key=api_key, model=model)
@@ -212,7 +305,7 @@ def _create_llm(provider: str, model: str) -> BaseLLM:
         from .llm.openai import OpenAILLM
         # Use DeepSeek API URL if no custom base_url is provided
         ds_base_url = base_url or "https://api.deepseek.com"
-        return OpenAILLM(api_key=api_key, model=model, base_url=ds_base_url)
+        return OpenAILLM(api_key=api_key, model=model, base_url=ds_base_url, cache=_get_llm_cache())
     else:
         raise ValueError(f"Unknown provider: {provider}")
 
@@ -222,7 +315,9 @@ def create_llm_for_role(role: str) -> BaseLLM:
 
     The fallback chain is NOT applied here — it is handled at the call site
     (e.g. WriterAgent._call_llm_once) where retry logic is appropriate.
-    This function simply instantiates the primary model for the role.
+    This function simply instantiates the primary model for the role, or
+    the first fallback if the primary has no API key or its circuit breaker
+    is open.
 
     Args:
         role: Role name from config/models.json
@@ -233,7 +328,7 @@ def create_llm_for_role(role: str) -> BaseLLM:
     rc = get_role_config(role)
     try:
         return _create_llm(rc.primary.provider, rc.primary.model)
-    except ValueError:
+    except (ValueError, CircuitOpenError):
         # If primary fails to instantiate (e.g. missing API key), try fallbacks
         for fb in rc.fallback:
             try:
@@ -242,7 +337,7 @@ def create_llm_for_role(role: str) -> BaseLLM:
                     f"trying fallback {fb.model}"
                 )
                 return _create_llm(fb.provider, fb.model)
-            except ValueError:
+            except (ValueError, CircuitOpenError):
                 continue
         raise ValueError(
             f"No available model for role '{role}'. "
@@ -265,11 +360,16 @@ def create_fallback_llm_for_role(role: str) -> Optional[BaseLLM]:
     for fb in rc.fallback:
         try:
             return _create_llm(fb.provider, fb.model)
-        except ValueError:
+        except (ValueError, CircuitOpenError):
             continue
     return None
 
 
+def get_breaker_metrics() -> Dict[str, dict]:
+    """Circuit breaker state and success/failure counts per provider/model."""
+    return breaker.metrics()
+
+
 def get_pricing(model: str) -> Dict[str, float]:
     """Get pricing for a model (per 1M tokens).
 
@@ -277,11 +377,55 @@ def get_pricing(model: str) -> Dict[str, float]:
         model: Model identifier
 
     Returns:
-        Dict with "input" and "output" pricing in USD per 1M tokens
+        Dict with "input", "input_cached" and "output" pricing in USD per
+        1M tokens. "input_cached" (prompt-cache reads) falls back to the
+        full input rate when a model does not list it.
     """
-    config = _load_config()
-    pricing = config.get("pricing", {})
-    return pricing.get(model, {"input": 3.0, "output": 15.0})
+    _load_config()  # invalidates _pricing if models.json changed
+    return dict(_pricing(model))
+
+
+@lru_cache(maxsize=256)
+def _pricing(model: str) -> Dict[str, float]:
+    """Resolved pricing for a model; shared, so get_pricing returns a copy."""
+    pricing = _load_config().get("pricing", {})
+    price = dict(pricing.get(model, _DEFAULT_PRICING))
+    price.setdefault("input_cached", price["input"])
+    return price
+
+
+def token_cost(
+    pricing: Dict[str, float],
+    input_tokens: int,
+    output_tokens: int,
+    cached_input_tokens: int = 0,
+) -> float:
+    """USD cost of a token count under a get_pricing() dict.
+
+    input_tokens includes cached_input_tokens; the cached portion is billed
+    at the "input_cached" rate and the rest at the full input rate.
+    """
+    uncached = input_tokens - cached_input_tokens
+    return (
+        uncached * pricing["input"]
+        + cached_input_tokens * pricing.get("input_cached", pricing["input"])
+        + output_tokens * pricing["output"]
+    ) / 1_000_000
+
+
+def compute_cost(usage: LLMResponse, pricing: Optional[Dict[str, float]] = None) -> float:
+    """USD cost of one LLM response.
+
+    Args:
+        usage: Response with token counts (missing counts are treated as 0)
+        pricing: get_pricing() dict; defaults to the pricing for usage.model
+    """
+    return token_cost(
+        pricing or get_pricing(usage.model),
+        usage.input_tokens or 0,
+        usage.output_tokens or 0,
+        usage.cached_input_tokens or 0,
+    )
 
 
 def get_all_pricing() -> Dict[str, Dict[str, float]]:
@@ -1,11 +1,14 @@
 """Research notes data models."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+from ..utils.fast_json import dumps as json_dumps
 
-@dataclass
+
+@dataclass(slots=True)
 class LiteratureNote:
     """Note from reading a paper/document."""
 
@@ -17,8 +20,13 @@ class LiteratureNote:
     relevance: str = ""  # How this relates to research question
     metadata: Dict = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Low-cardinality labels: share one string object per distinct value
+        if isinstance(self.source_type, str):
+            self.source_type = sys.intern(self.source_type)
 
-@dataclass
+
+@dataclass(slots=True)
 class DataAnalysisNote:
     """Note from data analysis."""
 
@@ -31,8 +39,12 @@ class DataAnalysisNote:
     limitations: List[str] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
 
+    def __post_init__(self):
+        if isinstance(self.analysis_type, str):
+            self.analysis_type = sys.intern(self.analysis_type)
 
-@dataclass
+
+@dataclass(slots=True)
 class ObservationNote:
     """General observation or insight."""
 
@@ -41,8 +53,12 @@ class ObservationNote:
     implications: List[str] = field(default_factory=list)
     confidence: str = "medium"  # "low", "medium", "high"
 
+    def __post_init__(self):
+        if isinstance(self.confidence, str):
+            self.confidence = sys.intern(self.confidence)
 
-@dataclass
+
+@dataclass(slots=True)
 class QuestionNote:
     """Research question or gap identified."""
 
@@ -74,115 +90,164 @@ class ResearchNotebook:
     last_updated: str = ""
     status: str = "active"  # "active", "ready_for_paper", "completed"
 
-    def to_markdown(self) -> str:
-        """Export notebook to markdown format (raw, unpolished)."""
-        lines = [f"# Research Notes: {self.topic}\n"]
-
-        lines.append(f"**Status:** {self.status}\n")
-        lines.append(f"**Last Updated:** {self.last_updated}\n\n")
+    def __post_init__(self):
+        self._version = 0
+        self._cached_md: Optional[Tuple[tuple, str]] = None
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.touch()
+
+    def touch(self) -> None:
+        """Invalidate the cached markdown after editing a note in place."""
+        self.__dict__["_version"] = self.__dict__.get("_version", 0) + 1
+
+    def add_literature_note(self, note: LiteratureNote) -> None:
+        self.literature_notes.append(note)
+        self.touch()
+
+    def add_data_analysis_note(self, note: DataAnalysisNote) -> None:
+        self.data_analysis_notes.append(note)
+        self.touch()
+
+    def add_observation(self, note: ObservationNote) -> None:
+        self.observations.append(note)
+        self.touch()
+
+    def add_question(self, note: QuestionNote) -> None:
+        self.questions.append(note)
+        self.touch()
+
+    def _cache_key(self) -> tuple:
+        # List lengths also catch notes appended directly to the lists
+        return (
+            self._version,
+            len(self.research_questions),
+            len(self.literature_notes),
+            len(self.data_analysis_notes),
+            len(self.observations),
+            len(self.questions),
+        )
 
-        # Research Questions
-        lines.append("## Research Questions\n")
+    def to_markdown(self) -> str:
+        """Export notebook to markdown format (raw, unpolished).
+
+        The result is cached until the notebook changes: any field
+        assignment, an add_* helper, a list growing or shrinking, or an
+        explicit touch() after editing an existing note in place.
+        """
+        key = self._cache_key()
+        if self._cached_md is not None and self._cached_md[0] == key:
+            return self._cached_md[1]
+        markdown = self._render_markdown()
+        self._cached_md = (key, markdown)
+        return markdown
+
+    def _render_markdown(self) -> str:
+        # Adjacent fixed fragments are merged into single f-strings so each
+        # line group is one append
+        buf: List[str] = []
+        write = buf.append
+
+        write(
+            f"# Research Notes: {self.topic}\n"
+            f"**Status:** {self.status}\n"
+            f"**Last Updated:** {self.last_updated}\n\n"
+            "## Research Questions\n"
+        )
         for i, q in enumerate(self.research_questions, 1):
-            lines.append(f"{i}. {q}\n")
-        lines.append("\n")
+            write(f"{i}. {q}\n")
+        write("\n")
 
         # Literature Review
         if self.literature_notes:
-            lines.append("## Literature Review\n\n")
+            write("## Literature Review\n\n")
             for note in self.literature_notes:
-                lines.append(f"### {note.source}\n")
-                lines.append(f"**Type:** {note.source_type}\n\n")
-
                 if note.relevance:
-                    lines.append(f"**Relevance:** {note.relevance}\n\n")
-
-                lines.append("**Key Findings:**\n")
+                    write(
+                        f"### {note.source}\n**Type:** {note.source_type}\n\n"
+                        f"**Relevance:** {note.relevance}\n\n**Key Findings:**\n"
+                    )
+                else:
+                    write(f"### {note.source}\n**Type:** {note.source_type}\n\n**Key Findings:**\n")
                 for finding in note.key_findings:
-                    lines.append(f"- {finding}\n")
-                lines.append("\n")
+                    write(f"- {finding}\n")
+                write("\n")
 
                 if note.quotes:
-                    lines.append("**Quotes:**\n")
+                    write("**Quotes:**\n")
                     for quote in note.quotes:
-                        lines.append(f"> {quote}\n")
-                    lines.append("\n")
+                        write(f"> {quote}\n")
+                    write("\n")
 
                 if note.questions_raised:
-                    lines.append("**Questions Raised:**\n")
+                    write("**Questions Raised:**\n")
                     for q in note.questions_raised:
-                        lines.append(f"- {q}\n")
-                    lines.append("\n")
+                        write(f"- {q}\n")
+                    write("\n")
 
         # Data Analysis
         if self.data_analysis_notes:
-            lines.append("## Data Analysis\n\n")
+            write("## Data Analysis\n\n")
             for note in self.data_analysis_notes:
-                lines.append(f"### {note.analysis_type.title()} Analysis\n")
-                lines.append(f"**Source:** {note.data_source}\n\n")
-
-                if note.methodology:
-                    lines.append(f"**Methodology:** {note.methodology}\n\n")
-
-                lines.append("**Raw Data:**\n")
-                lines.append("```json\n")
-                import json
-                lines.append(json.dumps(note.raw_data, indent=2))
-                lines.append("\n```\n\n")
-
-                lines.append("**Findings:**\n")
+                methodology = f"**Methodology:** {note.methodology}\n\n" if note.methodology else ""
+                raw_data = json_dumps(note.raw_data, indent=True).decode()
+                write(
+                    f"### {note.analysis_type.title()} Analysis\n**Source:** {note.data_source}\n\n"
+                    f"{methodology}**Raw Data:**\n```json\n{raw_data}\n```\n\n"
+                    "**Findings:**\n"
+                )
                 for finding in note.findings:
-                    lines.append(f"- {finding}\n")
-                lines.append("\n")
+                    write(f"- {finding}\n")
+                write("\n")
 
                 if note.visualizations:
-                    lines.append("**Visualizations:**\n")
+                    write("**Visualizations:**\n")
                     for viz in note.visualizations:
-                        lines.append(f"![Chart]({viz})\n")
-                    lines.append("\n")
+                        write(f"![Chart]({viz})\n")
+                    write("\n")
 
                 if note.limitations:
-                    lines.append("**Limitations:**\n")
+                    write("**Limitations:**\n")
                     for lim in note.limitations:
-                        lines.append(f"- {lim}\n")
-                    lines.append("\n")
+                        write(f"- {lim}\n")
+                    write("\n")
 
         # Observations
         if self.observations:
-            lines.append("## Key Observations\n\n")
+            write("## Key Observations\n\n")
             for obs in self.observations:
-                lines.append(f"**Observation** (confidence: {obs.confidence}):\n")
-                lines.append(f"{obs.observation}\n\n")
+                write(f"**Observation** (confidence: {obs.confidence}):\n{obs.observation}\n\n")
 
                 if obs.supporting_evidence:
-                    lines.append("Evidence:\n")
+                    write("Evidence:\n")
                     for ev in obs.supporting_evidence:
-                        lines.append(f"- {ev}\n")
-                    lines.append("\n")
+                        write(f"- {ev}\n")
+                    write("\n")
 
                 if obs.implications:
-                    lines.append("Implications:\n")
+                    write("Implications:\n")
                     for imp in obs.implications:
-                        lines.append(f"- {imp}\n")
-                    lines.append("\n")
+                        write(f"- {imp}\n")
+                    write("\n")
 
         # Open Questions
         if self.questions:
-            lines.append("## Open Questions & Gaps\n\n")
+            write("## Open Questions & Gaps\n\n")
             for q in self.questions:
                 status = "✓ ANSWERED" if q.answered else "❓ OPEN"
-                lines.append(f"**{status}:** {q.question}\n")
-                lines.append(f"*Why important:* {q.why_important}\n\n")
+                write(f"**{status}:** {q.question}\n*Why important:* {q.why_important}\n\n")
 
                 if q.answered:
-                    lines.append(f"*Answer:* {q.answer}\n\n")
+                    write(f"*Answer:* {q.answer}\n\n")
                 elif q.potential_approaches:
-                    lines.append("*Potential approaches:*\n")
+                    write("*Potential approaches:*\n")
                     for approach in q.potential_approaches:
-                        lines.append(f"- {approach}\n")
-                    lines.append("\n")
+                        write(f"- {approach}\n")
+                    write("\n")
 
-        return "".join(lines)
+        return "".join(buf)
 
     def get_statistics(self) -> Dict:
         """Get notebook statistics."""
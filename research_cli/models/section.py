@@ -1,10 +1,11 @@
 """Section-level writing data models."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionSpec:
     """Specification for a section to be written."""
 
@@ -16,6 +17,11 @@ class SectionSpec:
     depth_level: str = "detailed"  # "overview", "detailed", "comprehensive"
     order: int = 0  # Order in manuscript
 
+    def __post_init__(self):
+        # Low-cardinality label: share one string object per distinct value
+        if isinstance(self.depth_level, str):
+            self.depth_level = sys.intern(self.depth_level)
+
 
 @dataclass
 class ResearchPlan:
@@ -28,19 +34,32 @@ class ResearchPlan:
     recommended_experts: List[str] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
 
+    def __post_init__(self):
+        self._index_key: Optional[tuple] = None
+        self._by_id: Dict[str, SectionSpec] = {}
+        self._ordered: List[SectionSpec] = []
+
+    def _refresh_index(self) -> None:
+        """Rebuild lookups if the sections list was replaced or resized."""
+        key = self._index_key
+        if key is None or key[0] is not self.sections or key[1] != len(self.sections):
+            # Reversed so the first section wins on duplicate ids
+            self._by_id = {s.id: s for s in reversed(self.sections)}
+            self._ordered = sorted(self.sections, key=lambda s: s.order)
+            self._index_key = (self.sections, len(self.sections))
+
     def get_section(self, section_id: str) -> Optional[SectionSpec]:
         """Get section by ID."""
-        for section in self.sections:
-            if section.id == section_id:
-                return section
-        return None
+        self._refresh_index()
+        return self._by_id.get(section_id)
 
     def get_ordered_sections(self) -> List[SectionSpec]:
         """Get sections in writing order."""
-        return sorted(self.sections, key=lambda s: s.order)
+        self._refresh_index()
+        return list(self._ordered)
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionOutput:
     """Output from writing a section."""
 
@@ -55,30 +74,67 @@ class SectionOutput:
 class WritingContext:
     """Context provided to section writer."""
 
+    # Declared by hand (not slots=True) so the lookup caches get slots
+    # without being dataclass fields, keeping them out of asdict()/fields()
+    __slots__ = (
+        "research_plan", "previous_sections", "section_spec",
+        "_summary_cache", "_previous_key", "_previous_by_id",
+    )
+
     research_plan: ResearchPlan
     previous_sections: List[SectionOutput]
     section_spec: SectionSpec
 
+    def __post_init__(self):
+        # Lookup caches (see get_section_summary)
+        # section_id -> (content summarized, summary)
+        self._summary_cache: Dict[str, tuple] = {}
+        self._previous_key: Optional[tuple] = None
+        self._previous_by_id: Dict[str, SectionOutput] = {}
+
+    def _summarize(self, section: SectionOutput) -> str:
+        """First ~200 words of a section's non-empty lines, memoized per content."""
+        cached = self._summary_cache.get(section.section_id)
+        if cached is not None and cached[0] is section.content:
+            return cached[1]
+
+        # Walk lines with find() rather than split('\n') so long sections
+        # aren't fully split when the budget is reached in the first lines
+        content = section.content
+        find = content.find
+        summary_lines = []
+        word_count = 0
+        start = 0
+        while True:
+            end = find('\n', start)
+            line = content[start:end] if end >= 0 else content[start:]
+            if line.strip():
+                summary_lines.append(line)
+                word_count += len(line.split())
+                if word_count > 200:  # ~200 word summary
+                    break
+            if end < 0:
+                break
+            start = end + 1
+        summary = ' '.join(summary_lines)
+        self._summary_cache[section.section_id] = (section.content, summary)
+        return summary
+
     def get_section_summary(self, section_id: str) -> Optional[str]:
         """Get brief summary of previous section for context."""
-        for section in self.previous_sections:
-            if section.section_id == section_id:
-                # Return first paragraph as summary
-                lines = section.content.split('\n')
-                summary_lines = []
-                for line in lines:
-                    if line.strip():
-                        summary_lines.append(line)
-                        if len(' '.join(summary_lines).split()) > 200:  # ~200 word summary
-                            break
-                return ' '.join(summary_lines)
-        return None
+        previous = self.previous_sections
+        key = self._previous_key
+        if key is None or key[0] is not previous or key[1] != len(previous):
+            self._previous_by_id = {s.section_id: s for s in reversed(previous)}
+            self._previous_key = (previous, len(previous))
+        section = self._previous_by_id.get(section_id)
+        return self._summarize(section) if section is not None else None
 
     def get_all_previous_summaries(self) -> str:
         """Get summaries of all previous sections."""
         summaries = []
         for section in self.previous_sections:
-            summary = self.get_section_summary(section.section_id)
+            summary = self._summarize(section)
             if summary:
                 spec = self.research_plan.get_section(section.section_id)
                 title = spec.title if spec else section.section_id
@@ -87,7 +143,7 @@ class WritingContext:
         return "\n\n".join(summaries) if summaries else "No previous sections."
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationResult:
     """Result of integrating sections."""
 
@@ -2,12 +2,11 @@
 
 import time
 from collections import OrderedDict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
-from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 
-from .model_config import get_all_pricing, get_pricing
+from .model_config import get_all_pricing, get_pricing, token_cost
 
 
 class PhaseTimer:
@@ -47,6 +46,27 @@ class PhaseTimer:
         }
 
 
+class _OperationTimer:
+    """Context manager returned by PerformanceTracker.track_operation.
+
+    A plain slotted class rather than @contextmanager, which builds a
+    generator and its wrapper for every tracked operation.
+    """
+
+    __slots__ = ("tracker", "name")
+
+    def __init__(self, tracker: "PerformanceTracker", name: str):
+        self.tracker = tracker
+        self.name = name
+
+    def __enter__(self) -> "_OperationTimer":
+        self.tracker.start_operation(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.tracker.end_operation(self.name)
+
+
 def _load_model_pricing() -> Dict[str, dict]:
     """Load model pricing from central config."""
     try:
@@ -57,12 +77,18 @@ def _load_model_pricing() -> Dict[str, dict]:
 
 
 MODEL_PRICING = _load_model_pricing()
-_DEFAULT_PRICING = {"input": 3.0, "output": 15.0}
+_DEFAULT_PRICING = {"input": 3.0, "input_cached": 0.30, "output": 15.0}
+# Flat rate used when no per-model usage was tracked ($3 per 1M tokens)
+_FALLBACK_COST_PER_TOKEN = 3.0 / 1_000_000
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundMetrics:
-    """Performance metrics for a single review round."""
+    """Performance metrics for a single review round.
+
+    Durations are rounded to 0.01s as they are recorded, so instances
+    serialize as-is (fast_json handles dataclasses directly).
+    """
     round_number: int
     review_start: str  # ISO format datetime
     review_end: str  # ISO format datetime
@@ -82,21 +108,16 @@ class RoundMetrics:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "round_number": self.round_number,
-            "review_start": self.review_start,
-            "review_end": self.review_end,
-            "review_duration": round(self.review_duration, 2),
-            "reviewer_times": {k: round(v, 2) for k, v in self.reviewer_times.items()},
-            "moderator_time": round(self.moderator_time, 2),
-            "revision_time": round(self.revision_time, 2) if self.revision_time else None,
-            "round_tokens": self.round_tokens
-        }
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
-    """Complete performance metrics for the workflow."""
+    """Complete performance metrics for the workflow.
+
+    Values are rounded by PerformanceTracker when exported; pass the
+    instance straight to fast_json.dumps rather than building a dict.
+    """
     # Workflow start/end
     workflow_start: str  # ISO format datetime
     workflow_end: str  # ISO format datetime
@@ -129,24 +150,7 @@ class PerformanceMetrics:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "workflow_start": self.workflow_start,
-            "workflow_end": self.workflow_end,
-            "total_duration": round(self.total_duration, 2),
-            "initial_draft_time": round(self.initial_draft_time, 2),
-            "initial_draft_tokens": self.initial_draft_tokens,
-            "team_composition_time": round(self.team_composition_time, 2),
-            "team_composition_tokens": self.team_composition_tokens,
-            "citation_tokens": self.citation_tokens,
-            "revision_tokens": self.revision_tokens,
-            "author_response_tokens": self.author_response_tokens,
-            "desk_editor_tokens": self.desk_editor_tokens,
-            "moderator_tokens": self.moderator_tokens,
-            "rounds": [r.to_dict() for r in self.rounds],
-            "tokens_by_model": self.tokens_by_model,
-            "total_tokens": self.total_tokens,
-            "estimated_cost": round(self.estimated_cost, 4)
-        }
+        return asdict(self)
 
 
 class PerformanceTracker:
@@ -154,10 +158,20 @@ class PerformanceTracker:
 
     def __init__(self):
         """Initialize performance tracker."""
+        # Operations are almost always timed one at a time, so the first
+        # active one lives in these slots and only overlapping ones use
+        # the _timers dict
+        self._active_name: Optional[str] = None
+        self._active_start: float = 0.0
         self._timers: Dict[str, float] = {}
         self._workflow_start: Optional[float] = None
         self._current_round: Optional[RoundMetrics] = None
         self._rounds: List[RoundMetrics] = []
+        # (wall-clock start, monotonic start) of the current round, and the
+        # (start, end) wall-clock times of finished rounds; formatted to ISO
+        # strings only in export_metrics()
+        self._round_start: Optional[Tuple[float, float]] = None
+        self._round_walls: List[Tuple[float, float]] = []
         self._initial_draft_time: float = 0.0
         self._initial_draft_tokens: int = 0
         self._team_composition_time: float = 0.0
@@ -170,16 +184,24 @@ class PerformanceTracker:
         self._desk_editor_tokens: int = 0
         self._moderator_tokens: int = 0
 
+        # Running sum of every token count above plus finished rounds
+        self._total_tokens: int = 0
+
         # Model-level input/output tracking for accurate cost calculation
         self._tokens_by_model: Dict[str, dict] = {}
 
-    def _track_model_tokens(self, model: str, input_tokens: int, output_tokens: int):
-        """Track input/output tokens per model for cost calculation."""
+    def _track_model_tokens(self, model: str, input_tokens: int, output_tokens: int,
+                            cached_input_tokens: int = 0):
+        """Track input/output tokens per model for cost calculation.
+
+        cached_input_tokens is the prompt-cache portion of input_tokens.
+        """
         if not model:
             return
         if model not in self._tokens_by_model:
-            self._tokens_by_model[model] = {"input": 0, "output": 0}
+            self._tokens_by_model[model] = {"input": 0, "input_cached": 0, "output": 0}
         self._tokens_by_model[model]["input"] += input_tokens
+        self._tokens_by_model[model]["input_cached"] += cached_input_tokens
         self._tokens_by_model[model]["output"] += output_tokens
 
     def start_workflow(self):
@@ -192,7 +214,14 @@ class PerformanceTracker:
         Args:
             name: Name of the operation
         """
-        self._timers[name] = time.time()
+        now = time.monotonic()
+        if self._active_name is None or self._active_name == name:
+            self._active_name = name
+            self._active_start = now
+            if self._timers:
+                self._timers.pop(name, None)
+        else:
+            self._timers[name] = now
 
     def end_operation(self, name: str) -> float:
         """End timing an operation.
@@ -203,15 +232,16 @@ class PerformanceTracker:
         Returns:
             Duration in seconds
         """
-        if name not in self._timers:
-            return 0.0
+        if name == self._active_name:
+            self._active_name = None
+            return time.monotonic() - self._active_start
 
-        duration = time.time() - self._timers[name]
-        del self._timers[name]
-        return duration
+        start = self._timers.pop(name, None)
+        if start is None:
+            return 0.0
+        return time.monotonic() - start
 
-    @contextmanager
-    def track_operation(self, name: str):
+    def track_operation(self, name: str) -> "_OperationTimer":
         """Context manager for tracking an operation.
 
         Usage:
@@ -219,11 +249,7 @@ class PerformanceTracker:
                 # do work
                 pass
         """
-        self.start_operation(name)
-        try:
-            yield
-        finally:
-            duration = self.end_operation(name)
+        return _OperationTimer(self, name)
 
     def record_team_composition(self, duration: float, tokens: int = 0):
         """Record team composition metrics.
@@ -232,12 +258,13 @@ class PerformanceTracker:
             duration: Time taken in seconds
             tokens: Tokens used
         """
-        self._team_composition_time = duration
+        self._team_composition_time = round(duration, 2)
+        self._total_tokens += tokens - self._team_composition_tokens
         self._team_composition_tokens = tokens
 
     def record_initial_draft(self, duration: float, tokens: int = 0,
                              input_tokens: int = 0, output_tokens: int = 0,
-                             model: str = ""):
+                             model: str = "", cached_input_tokens: int = 0):
         """Record initial draft generation metrics.
 
         Args:
@@ -246,33 +273,38 @@ class PerformanceTracker:
             input_tokens: Input tokens used
             output_tokens: Output tokens used
             model: Model identifier
+            cached_input_tokens: Portion of input_tokens read from the prompt cache
         """
-        self._initial_draft_time = duration
+        self._initial_draft_time = round(duration, 2)
+        self._total_tokens += tokens - self._initial_draft_tokens
         self._initial_draft_tokens = tokens
-        self._track_model_tokens(model, input_tokens, output_tokens)
+        self._track_model_tokens(model, input_tokens, output_tokens, cached_input_tokens)
 
     def record_citation_verification(self, tokens: int = 0,
                                      input_tokens: int = 0,
                                      output_tokens: int = 0,
-                                     model: str = ""):
+                                     model: str = "", cached_input_tokens: int = 0):
         """Record citation verification token usage."""
         self._citation_tokens += tokens
-        self._track_model_tokens(model, input_tokens, output_tokens)
+        self._total_tokens += tokens
+        self._track_model_tokens(model, input_tokens, output_tokens, cached_input_tokens)
 
     def record_revision(self, tokens: int = 0,
                         input_tokens: int = 0, output_tokens: int = 0,
-                        model: str = ""):
+                        model: str = "", cached_input_tokens: int = 0):
         """Record manuscript revision token usage."""
         self._revision_tokens += tokens
-        self._track_model_tokens(model, input_tokens, output_tokens)
+        self._total_tokens += tokens
+        self._track_model_tokens(model, input_tokens, output_tokens, cached_input_tokens)
 
     def record_author_response(self, tokens: int = 0,
                                input_tokens: int = 0,
                                output_tokens: int = 0,
-                               model: str = ""):
+                               model: str = "", cached_input_tokens: int = 0):
         """Record author response token usage."""
         self._author_response_tokens += tokens
-        self._track_model_tokens(model, input_tokens, output_tokens)
+        self._total_tokens += tokens
+        self._track_model_tokens(model, input_tokens, output_tokens, cached_input_tokens)
 
     def record_desk_editor(self, tokens: int = 0,
                            input_tokens: int = 0,
@@ -280,6 +312,7 @@ class PerformanceTracker:
                            model: str = ""):
         """Record desk editor screening token usage."""
         self._desk_editor_tokens += tokens
+        self._total_tokens += tokens
         self._track_model_tokens(model, input_tokens, output_tokens)
 
     def record_moderator(self, tokens: int = 0,
@@ -288,6 +321,7 @@ class PerformanceTracker:
                          model: str = ""):
         """Record moderator decision token usage."""
         self._moderator_tokens += tokens
+        self._total_tokens += tokens
         self._track_model_tokens(model, input_tokens, output_tokens)
 
     def start_round(self, round_number: int):
@@ -298,11 +332,11 @@ class PerformanceTracker:
         """
         self._current_round = RoundMetrics(
             round_number=round_number,
-            review_start=datetime.now().isoformat(),
+            review_start="",
             review_end="",
             review_duration=0.0
         )
-        self.start_operation(f"round_{round_number}")
+        self._round_start = (time.time(), time.monotonic())
 
     def record_reviewer_time(self, reviewer_id: str, duration: float):
         """Record time for a specific reviewer.
@@ -312,7 +346,7 @@ class PerformanceTracker:
             duration: Time taken in seconds
         """
         if self._current_round:
-            self._current_round.reviewer_times[reviewer_id] = duration
+            self._current_round.reviewer_times[reviewer_id] = round(duration, 2)
 
     def record_moderator_time(self, duration: float):
         """Record moderator decision time.
@@ -321,7 +355,7 @@ class PerformanceTracker:
             duration: Time taken in seconds
         """
         if self._current_round:
-            self._current_round.moderator_time = duration
+            self._current_round.moderator_time = round(duration, 2)
 
     def record_revision_time(self, duration: float):
         """Record manuscript revision time.
@@ -329,6 +363,7 @@ class PerformanceTracker:
         Args:
             duration: Time taken in seconds
         """
+        duration = round(duration, 2)
         if self._current_round:
             self._current_round.revision_time = duration
         elif self._rounds:
@@ -347,21 +382,23 @@ class PerformanceTracker:
     def end_round(self):
         """Finish tracking current round."""
         if self._current_round:
-            round_num = self._current_round.round_number
-            duration = self.end_operation(f"round_{round_num}")
-            self._current_round.review_duration = duration
-            self._current_round.review_end = datetime.now().isoformat()
+            # Durations come from the monotonic clock; the end wall time is
+            # derived from it rather than read again
+            start_wall, start_mono = self._round_start
+            duration = time.monotonic() - start_mono
+            self._current_round.review_duration = round(duration, 2)
+            self._round_walls.append((start_wall, start_wall + duration))
+            self._total_tokens += self._current_round.round_tokens
             self._rounds.append(self._current_round)
             self._current_round = None
+            self._round_start = None
 
     def _calculate_cost(self) -> float:
         """Calculate estimated cost from model-level token tracking."""
         total_cost = 0.0
         for model, usage in self._tokens_by_model.items():
             pricing = MODEL_PRICING.get(model, _DEFAULT_PRICING)
-            input_cost = (usage["input"] / 1_000_000) * pricing["input"]
-            output_cost = (usage["output"] / 1_000_000) * pricing["output"]
-            total_cost += input_cost + output_cost
+            total_cost += token_cost(pricing, usage["input"], usage["output"], usage["input_cached"])
         return total_cost
 
     def export_metrics(self) -> PerformanceMetrics:
@@ -376,29 +413,24 @@ class PerformanceTracker:
         workflow_end = time.time()
         total_duration = workflow_end - self._workflow_start
 
-        # Calculate total tokens from all sources
-        total_tokens = (
-            self._initial_draft_tokens +
-            self._team_composition_tokens +
-            self._citation_tokens +
-            self._revision_tokens +
-            self._author_response_tokens +
-            self._desk_editor_tokens +
-            self._moderator_tokens +
-            sum(r.round_tokens for r in self._rounds)
-        )
+        for metrics, (start, end) in zip(self._rounds, self._round_walls):
+            if not metrics.review_start:
+                metrics.review_start = datetime.fromtimestamp(start).isoformat()
+                metrics.review_end = datetime.fromtimestamp(end).isoformat()
+
+        total_tokens = self._total_tokens
 
         # Calculate cost from model-level breakdown (accurate)
         # Fall back to flat rate if no model data
         if self._tokens_by_model:
             estimated_cost = self._calculate_cost()
         else:
-            estimated_cost = (total_tokens / 1_000_000) * 3.0  # fallback $3/M
+            estimated_cost = total_tokens * _FALLBACK_COST_PER_TOKEN
 
         return PerformanceMetrics(
             workflow_start=datetime.fromtimestamp(self._workflow_start).isoformat(),
             workflow_end=datetime.fromtimestamp(workflow_end).isoformat(),
-            total_duration=total_duration,
+            total_duration=round(total_duration, 2),
             initial_draft_time=self._initial_draft_time,
             initial_draft_tokens=self._initial_draft_tokens,
             team_composition_time=self._team_composition_time,
@@ -411,5 +443,5 @@ class PerformanceTracker:
             rounds=self._rounds,
             tokens_by_model=self._tokens_by_model,
             total_tokens=total_tokens,
-            estimated_cost=estimated_cost
+            estimated_cost=round(estimated_cost, 4)
         )
@@ -0,0 +1,63 @@
+"""Fast JSON encoding and decoding with an optional orjson backend.
+
+orjson is used when installed; otherwise this falls back to the stdlib
+``json`` module so callers never need to know which backend is active.
+"""
+
+import dataclasses
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this single type regardless of backend.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes):
+    """Parse a JSON document from str or bytes.
+
+    Args:
+        data: JSON text (str) or UTF-8 encoded bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj):
+    # orjson serializes dataclasses natively; match that for the stdlib path
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes.
+
+    Non-ASCII characters are written as-is rather than escaped, non-string
+    dict keys are converted to strings, and dataclass instances are
+    serialized field by field, with either backend.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_default).encode("utf-8")
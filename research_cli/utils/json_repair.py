@@ -5,14 +5,28 @@ import logging
 import re
 from pathlib import Path
 
+from . import fast_json
+
 logger = logging.getLogger(__name__)
 
+# Optional leading ```/```json fence and optional trailing ``` fence
+_CODE_FENCE_RE = re.compile(r"^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+
+
+def strip_code_fence(text: str) -> str:
+    """Strip a surrounding markdown code fence and whitespace from LLM output.
+
+    Handles ```json ... ```, ``` ... ```, and unterminated fences in a
+    single regex pass. Text without a fence is returned stripped.
+    """
+    return _CODE_FENCE_RE.match(text).group(1)
+
 
 def repair_json(text: str) -> dict:
     """Parse JSON from LLM response, repairing truncated output if needed.
 
     Attempts multiple strategies in order:
-    1. Direct json.loads
+    1. Direct parse (orjson fast path, then lenient json.loads)
     2. Extract ```json code block
     3. Extract first { ... last } substring
     4. Repair truncated JSON by closing open quotes/brackets/braces
@@ -28,7 +42,20 @@ def repair_json(text: str) -> dict:
     """
     text = text.strip()
 
-    # Strategy 1: Direct parse
+    # Fenced replies are the common case: strip the fence in one pass and
+    # parse before the direct-parse attempts, which would both fail on it
+    if text.startswith("```"):
+        try:
+            return fast_json.loads(strip_code_fence(text))
+        except ValueError:
+            pass
+
+    # Strategy 1: Direct parse — strict fast path first, then lenient stdlib
+    # parse which tolerates raw control characters inside strings
+    try:
+        return fast_json.loads(text)
+    except ValueError:
+        pass
     try:
         return json.loads(text, strict=False)
     except (json.JSONDecodeError, ValueError):
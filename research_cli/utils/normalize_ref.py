@@ -1,29 +1,39 @@
 """Shared reference normalization helpers for dedup."""
 
 import re
+from functools import lru_cache
 
-# DOI values that LLMs hallucinate instead of leaving as None
-_BOGUS_DOI_PATTERNS = {
-    "not provided", "n/a", "na", "none", "unknown", "null", "",
-}
+# A usable identifier starts with one of these. Placeholders that LLMs
+# emit instead of leaving the DOI as None ("not provided", "n/a", "none",
+# "unknown", "null", "") never do, so the prefix check rejects them too.
+_DOI_PREFIXES = ("10.", "arXiv:")
 
+# normalize_title patterns, compiled once (dedup calls it per reference)
+_ARXIV_PREFIX = re.compile(r"^\[\d{4}\.\d{4,5}]\s*")
+_SUFFIX_SPLIT = re.compile(r"\s*[|\u2013\u2014]\s*|\s+[-]\s+")
+_PUNCT = re.compile(r"[^\w\s]")
+_WS = re.compile(r"\s+")
 
+
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
     """Normalize a reference title for dedup comparison.
 
     - Strips leading arXiv IDs like ``[2412.01708]``
     - Removes trailing site-name suffixes (``| Journal``, ``- PMC``, etc.)
     - Strips punctuation and collapses whitespace
+
+    Memoized: the same references recur across reviewers and rounds.
     """
     t = title.lower().strip()
     # Strip leading arXiv ID like "[2412.01708] "
-    t = re.sub(r"^\[\d{4}\.\d{4,5}]\s*", "", t)
+    t = _ARXIV_PREFIX.sub("", t)
     # Remove trailing " | journal", " - site" style suffixes
-    t = re.split(r"\s*[|\u2013\u2014]\s*|\s+[-]\s+", t)[0]
+    t = _SUFFIX_SPLIT.split(t, 1)[0]
     # Remove all punctuation except alphanumeric and spaces
-    t = re.sub(r"[^\w\s]", "", t)
+    t = _PUNCT.sub("", t)
     # Collapse whitespace
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _WS.sub(" ", t).strip()
     return t
 
 
@@ -32,9 +42,7 @@ def clean_doi(doi: str | None) -> str | None:
     if doi is None:
         return None
     stripped = doi.strip()
-    if stripped.lower() in _BOGUS_DOI_PATTERNS:
-        return None
-    # Must look vaguely like a DOI (contains "10." or "arXiv:")
-    if not stripped.startswith("10.") and not stripped.startswith("arXiv:"):
+    # Must look vaguely like a DOI (starts with "10." or "arXiv:")
+    if not stripped.startswith(_DOI_PREFIXES):
         return None
     return stripped
@@ -1,11 +1,36 @@
 """Title generator using LLM to create academic titles from manuscript content."""
 
+import asyncio
 import logging
 import re
+import weakref
+from typing import Dict
+
+from ..llm.base import BaseLLM
 from ..model_config import create_llm_for_role
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM_PROMPT = (
+    "You generate concise English titles from manuscript content. Match the tone and "
+    "vocabulary to the specified audience level. Respond with only the title text, nothing else."
+)
+
+# LLM clients per event loop and role. Clients share their loop's HTTP pool
+# (see llm/http.py), so they are reused within a loop but never across loops.
+_llms: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, BaseLLM]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_llm(role: str) -> BaseLLM:
+    """Return the running loop's client for a role, creating it on first use."""
+    llms = _llms.setdefault(asyncio.get_running_loop(), {})
+    llm = llms.get(role)
+    if llm is None:
+        llm = llms[role] = create_llm_for_role(role)
+    return llm
+
 _AUDIENCE_GUIDANCE = {
     "beginner": (
         "The target audience is BEGINNERS (general public, students).\n"
@@ -91,7 +116,7 @@ async def generate_title_from_manuscript(
 
         audience_guide = _AUDIENCE_GUIDANCE.get(audience_level, _AUDIENCE_GUIDANCE["professional"])
 
-        llm = create_llm_for_role("title_generator")
+        llm = _get_llm("title_generator")
 
         prompt = f"""Based on the following research manuscript, generate a concise title IN ENGLISH.
 
@@ -117,7 +142,7 @@ Respond with ONLY the title text on a single line. No quotes, no explanation, no
 
         response = await llm.generate(
             prompt=prompt,
-            system="You generate concise English titles from manuscript content. Match the tone and vocabulary to the specified audience level. Respond with only the title text, nothing else.",
+            system=_SYSTEM_PROMPT,
             temperature=0.7,
             max_tokens=100,
         )
@@ -126,9 +151,10 @@ Respond with ONLY the title text on a single line. No quotes, no explanation, no
 
         # Clean up common issues
         title = title.strip('"').strip("'").strip()
-        title = re.sub(r'^Title:\s*', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\*\*', '', title)  # Remove markdown bold
-        title = re.sub(r'\n.*', '', title)  # Take only the first line
+        if title[:6].lower() == "title:":
+            title = title[6:].lstrip()
+        title = title.replace("**", "")  # Remove markdown bold
+        title = title.partition("\n")[0]  # Take only the first line
 
         # Validate: must be reasonable length
         if len(title) < 15 or len(title) > 200:
@@ -16,11 +16,16 @@ from ..models.manuscript import (
 )
 from ..agents.lead_author import LeadAuthorAgent
 from ..agents.coauthor import CoauthorAgent
+from ..llm.scheduler import LLMScheduler
 from ..performance import PhaseTimer
 
 
 console = Console()
 
+# Prompt-side token allowance (notes, plan, dependency drafts) added to each
+# section's output estimate when pacing parallel section writes
+SECTION_PROMPT_TOKENS = 8_000
+
 
 class ManuscriptWritingPhase:
     """
@@ -263,25 +268,52 @@ class ManuscriptWritingPhase:
         self,
         plan: ManuscriptPlan
     ) -> List[SectionDraft]:
-        """Write all sections in parallel using plan context only."""
+        """Write sections concurrently, following the plan's dependency DAG.
+
+        Each section starts as soon as the sections it lists in
+        ``dependencies`` are written, and gets those drafts as context;
+        sections without dependencies start immediately with plan context
+        only. Only dependencies on earlier sections (by order) are honoured,
+        which keeps the graph acyclic. Calls share one LLMScheduler, so the
+        fan-out stays under the concurrency and rate limits.
+        """
 
         sorted_specs = sorted(plan.sections, key=lambda s: s.order)
+        scheduler = LLMScheduler()
 
         console.print(f"\n  Writing {len(sorted_specs)} sections in parallel...")
 
-        async def write_one(section_spec: 'SectionSpec') -> SectionDraft:
-            section_draft = await self.lead_agent.write_section(
-                section_spec=section_spec,
-                research_notes=self.research_notes,
-                previous_sections=[],  # No sequential context — plan is sufficient
-                manuscript_plan=plan,
-                audience_level=self.audience_level,
+        async def write_one(section_spec: 'SectionSpec', dependencies: List[asyncio.Future]) -> SectionDraft:
+            previous_sections = list(await asyncio.gather(*dependencies)) if dependencies else []
+            section_draft = await scheduler.submit(
+                lambda: self.lead_agent.write_section(
+                    section_spec=section_spec,
+                    research_notes=self.research_notes,
+                    previous_sections=previous_sections,
+                    manuscript_plan=plan,
+                    audience_level=self.audience_level,
+                ),
+                # ~4 tokens per 3 words of output, plus a fixed prompt allowance
+                estimated_tokens=section_spec.target_length * 4 // 3 + SECTION_PROMPT_TOKENS,
             )
             console.print(f"  ✓ {section_spec.title}: {section_draft.word_count} words, "
                          f"{len(section_draft.citations)} citations")
             return section_draft
 
-        drafts = await asyncio.gather(*(write_one(spec) for spec in sorted_specs))
+        tasks: List[asyncio.Future] = []
+        by_id: Dict[str, asyncio.Future] = {}
+        for spec in sorted_specs:
+            dependencies = [by_id[dep] for dep in spec.dependencies if dep in by_id]
+            task = asyncio.ensure_future(write_one(spec, dependencies))
+            tasks.append(task)
+            by_id.setdefault(spec.id, task)
+
+        try:
+            drafts = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
         # Return in section order
         return list(drafts)
@@ -2,10 +2,13 @@
 
 import asyncio
 import json
+import os
 import re
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from statistics import fmean
 from typing import List, Dict, Optional
 
 from rich.console import Console
@@ -13,7 +16,9 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from ..llm.rate_limit import RateLimiter, estimate_tokens
 from ..model_config import _create_llm
+from ..utils.fast_json import dumps as json_dumps
 from ..utils.json_repair import repair_json
 from ..agents import WriterAgent, ModeratorAgent
 from ..agents.writer import validate_manuscript_completeness
@@ -27,6 +32,12 @@ from ..utils.source_retriever import SourceRetriever
 
 console = Console()
 
+# Reviewer request pacing, shared by every review round in the process so
+# larger teams stay under provider limits instead of retrying 429s
+REVIEW_RPM = int(os.getenv("REVIEW_RPM", "50"))
+REVIEW_TPM = int(os.getenv("REVIEW_TPM", "400000"))
+_review_limiter = RateLimiter(rpm=REVIEW_RPM, tpm=REVIEW_TPM)
+
 _REVISION_MARKER_RE = re.compile(r'\s*\[NO CHANGES(?:\s+NEEDED)?\]')
 
 
@@ -35,6 +46,17 @@ def _clean_manuscript_markers(text: str) -> str:
     return _REVISION_MARKER_RE.sub('', text)
 
 
+@lru_cache(maxsize=8)
+def _word_count(text: str) -> int:
+    """Whitespace-delimited word count, memoized per manuscript version.
+
+    A round counts the same few manuscript versions several times; str
+    caches its hash and compares identical objects by pointer, so repeat
+    lookups don't rescan or re-split the text.
+    """
+    return len(text.split())
+
+
 async def generate_review(
     specialist_id: str,
     specialist: dict,
@@ -346,6 +368,7 @@ Provide your review in the following JSON format:
 Penalize: unsupported claims, citation-context mismatches. Reward: inline [1], [2] citations, real DOIs/URLs.
 Remember: a reference you haven't seen is NOT fabricated. Only flag fabrication if metadata is internally contradictory."""
 
+    await _review_limiter.acquire(estimate_tokens(review_prompt, 4096))
     tracker.start_operation(f"review_{specialist_id}")
 
     response = await llm.generate(
@@ -367,7 +390,7 @@ Remember: a reference you haven't seen is NOT fabricated. Only flag fabrication
     )
     review_data = repair_json(response.content)
     scores = review_data["scores"]
-    average = sum(scores.values()) / len(scores)
+    average = fmean(scores.values())
 
     return {
         "specialist": specialist_id,
@@ -467,7 +490,7 @@ async def run_review_round(
     active_reviews = [r for r in reviews if not r.get("on_leave")]
     if not active_reviews:
         raise RuntimeError("All reviewers failed. Cannot continue workflow.")
-    overall_average = sum(r["average"] for r in active_reviews) / len(active_reviews)
+    overall_average = fmean(r["average"] for r in active_reviews)
 
     # Display scores
     table = Table(title=f"\nRound {round_number} Scores", show_header=True)
@@ -889,7 +912,7 @@ class WorkflowOrchestrator:
 
             console.print(f"[green]✓ Citation verification complete[/green]")
 
-        word_count = len(manuscript.split())
+        word_count = _word_count(manuscript)
         console.print(f"Length: {word_count:,} words")
         console.print(f"Max rounds: {self.max_rounds}")
         console.print(f"Threshold: {self.threshold}/10")
@@ -940,7 +963,7 @@ class WorkflowOrchestrator:
             round_data = {
                 "round": 0,
                 "manuscript_version": "v1",
-                "word_count": len(current_manuscript.split()),
+                "word_count": _word_count(current_manuscript),
                 "reviews": [],
                 "overall_average": 0,
                 "moderator_decision": {
@@ -957,8 +980,7 @@ class WorkflowOrchestrator:
             all_rounds.append(round_data)
 
             round_file = self.output_dir / "round_0.json"
-            with open(round_file, "w") as f:
-                json.dump(round_data, f, indent=2)
+            round_file.write_bytes(json_dumps(round_data, indent=True))
 
             if self.status_callback:
                 self.status_callback("completed", 0, "Desk rejected by editor")
@@ -1109,7 +1131,7 @@ class WorkflowOrchestrator:
             # Calculate manuscript diff
             manuscript_diff = None
             if previous_manuscript:
-                words_added = len(current_manuscript.split()) - len(previous_manuscript.split())
+                words_added = _word_count(current_manuscript) - _word_count(previous_manuscript)
                 manuscript_diff = {
                     "words_added": words_added,
                     "previous_version": f"v{round_num-1}",
@@ -1123,7 +1145,7 @@ class WorkflowOrchestrator:
             round_data = {
                 "round": round_num,
                 "manuscript_version": f"v{round_num}",
-                "word_count": len(current_manuscript.split()),
+                "word_count": _word_count(current_manuscript),
                 "reviews": reviews,
                 "overall_average": round(overall_average, 1),
                 "moderator_decision": moderator_decision,
@@ -1135,8 +1157,7 @@ class WorkflowOrchestrator:
             }
 
             round_file = self.output_dir / f"round_{round_num}.json"
-            with open(round_file, "w") as f:
-                json.dump(round_data, f, indent=2)
+            round_file.write_bytes(json_dumps(round_data, indent=True))
             console.print(f"[dim]Saved: {round_file}[/dim]")
 
             all_rounds.append(round_data)
@@ -1221,8 +1242,8 @@ class WorkflowOrchestrator:
             if self.sources:
                 revised_manuscript = _strip_ghost_citations(revised_manuscript, self.sources)
 
-            new_word_count = len(revised_manuscript.split())
-            word_change = new_word_count - len(current_manuscript.split())
+            new_word_count = _word_count(revised_manuscript)
+            word_change = new_word_count - _word_count(current_manuscript)
             console.print(f"[green]✓ Revision complete[/green]")
             console.print(f"New length: {new_word_count:,} words ([{word_change:+,}])\n")
 
@@ -1260,7 +1281,7 @@ class WorkflowOrchestrator:
 
             # Update round data with actual revision diff
             revision_diff = {
-                "words_added": new_word_count - len(previous_manuscript.split()),
+                "words_added": new_word_count - _word_count(previous_manuscript),
                 "previous_version": f"v{round_num}",
                 "current_version": f"v{round_num + 1}"
             }
@@ -1268,8 +1289,7 @@ class WorkflowOrchestrator:
             round_data["revised_word_count"] = new_word_count
 
             # Re-save round file with updated revision diff
-            with open(round_file, "w") as f:
-                json.dump(round_data, f, indent=2)
+            round_file.write_bytes(json_dumps(round_data, indent=True))
 
             # Update checkpoint with REVISED manuscript (resume gets correct version)
             self._save_checkpoint(round_num, current_manuscript, all_rounds)
@@ -1426,14 +1446,13 @@ Research Type: {self.research_type}
             "final_score": all_rounds[-1]["overall_average"],
             "passed": all_rounds[-1]["passed"],
             "total_rounds": len(all_rounds),
-            "performance": metrics.to_dict(),
+            "performance": metrics,
             "phase_timings": self.phase_timings if self.phase_timings else None,
             "timestamp": datetime.now().isoformat()
         }
 
         workflow_file = self.output_dir / "workflow_complete.json"
-        with open(workflow_file, "w") as f:
-            json.dump(workflow_data, f, indent=2)
+        workflow_file.write_bytes(json_dumps(workflow_data, indent=True))
 
         console.print(f"[bold green]✓ Complete workflow saved:[/bold green] {workflow_file}\n")
 
@@ -1625,7 +1644,7 @@ Research Type: {self.research_type}
                 if self.sources:
                     revised_manuscript = _strip_ghost_citations(revised_manuscript, self.sources)
 
-                new_word_count = len(revised_manuscript.split())
+                new_word_count = _word_count(revised_manuscript)
                 console.print(f"[green]✓ Revision complete[/green] — {new_word_count:,} words")
 
                 revised_path.write_text(revised_manuscript)
@@ -1633,7 +1652,7 @@ Research Type: {self.research_type}
 
                 # Update last round data with revision diff
                 last_round["manuscript_diff"] = {
-                    "words_added": new_word_count - len(current_manuscript.split()),
+                    "words_added": new_word_count - _word_count(current_manuscript),
                     "previous_version": f"v{start_round}",
                     "current_version": f"v{start_round + 1}"
                 }
@@ -1789,7 +1808,7 @@ Research Type: {self.research_type}
             # Calculate diff
             manuscript_diff = None
             if previous_manuscript:
-                words_added = len(current_manuscript.split()) - len(previous_manuscript.split())
+                words_added = _word_count(current_manuscript) - _word_count(previous_manuscript)
                 manuscript_diff = {
                     "words_added": words_added,
                     "previous_version": f"v{round_num-1}",
@@ -1803,7 +1822,7 @@ Research Type: {self.research_type}
             round_data = {
                 "round": round_num,
                 "manuscript_version": f"v{round_num}",
-                "word_count": len(current_manuscript.split()),
+                "word_count": _word_count(current_manuscript),
                 "reviews": reviews,
                 "overall_average": round(overall_average, 1),
                 "moderator_decision": moderator_decision,
@@ -1815,8 +1834,7 @@ Research Type: {self.research_type}
             }
 
             round_file = self.output_dir / f"round_{round_num}.json"
-            with open(round_file, "w") as f:
-                json.dump(round_data, f, indent=2)
+            round_file.write_bytes(json_dumps(round_data, indent=True))
             console.print(f"[dim]Saved: {round_file}[/dim]")
 
             all_rounds.append(round_data)
@@ -1900,8 +1918,8 @@ Research Type: {self.research_type}
             if self.sources:
                 revised_manuscript = _strip_ghost_citations(revised_manuscript, self.sources)
 
-            new_word_count = len(revised_manuscript.split())
-            word_change = new_word_count - len(current_manuscript.split())
+            new_word_count = _word_count(revised_manuscript)
+            word_change = new_word_count - _word_count(current_manuscript)
             console.print(f"[green]✓ Revision complete[/green]")
             console.print(f"New length: {new_word_count:,} words ([{word_change:+,}])\n")
 
@@ -1939,7 +1957,7 @@ Research Type: {self.research_type}
 
             # Update round data with actual revision diff
             revision_diff = {
-                "words_added": new_word_count - len(previous_manuscript.split()),
+                "words_added": new_word_count - _word_count(previous_manuscript),
                 "previous_version": f"v{round_num}",
                 "current_version": f"v{round_num + 1}"
             }
@@ -1947,8 +1965,7 @@ Research Type: {self.research_type}
             round_data["revised_word_count"] = new_word_count
 
             # Re-save round file with updated revision diff
-            with open(round_file, "w") as f:
-                json.dump(round_data, f, indent=2)
+            round_file.write_bytes(json_dumps(round_data, indent=True))
 
             # Update checkpoint with REVISED manuscript (resume gets correct version)
             self._save_checkpoint(round_num, current_manuscript, all_rounds)
@@ -2,17 +2,24 @@
 """Full iterative peer review workflow with automatic revision."""
 
 import asyncio
-import json
+import re
+import shutil
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from statistics import fmean
+from typing import Annotated, Any, Callable, List, Dict, Optional, Tuple, Union
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from research_cli.config import get_config
-from research_cli.llm import ClaudeLLM
+from research_cli.llm import BaseLLM, ClaudeLLM, close_http_clients
+from research_cli.llm.rate_limit import RateLimiter, estimate_tokens
 from research_cli.agents import WriterAgent, ModeratorAgent
+from research_cli.utils.fast_json import dumps as json_dumps
+from research_cli.utils.json_repair import strip_code_fence
+from pydantic import BaseModel, Field
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -77,104 +84,352 @@ Provide technically rigorous, implementation-focused feedback."""
 }
 
 
-async def generate_review(specialist_id: str, manuscript: str, round_number: int) -> dict:
-    """Generate review from a specialist (reuses demo_review logic)."""
-    specialist = SPECIALISTS[specialist_id]
-    config = get_config()
-
-    provider = specialist["provider"]
-    model = specialist["model"]
+# Pace specialist requests under provider per-minute limits
+REVIEW_RPM = 50
+REVIEW_TPM = 400_000
+_review_limiter = RateLimiter(rpm=REVIEW_RPM, tpm=REVIEW_TPM)
 
-    llm_config = config.get_llm_config("anthropic", model)
-    llm = ClaudeLLM(
-        api_key=llm_config.api_key,
-        model=llm_config.model,
-        base_url=llm_config.base_url
-    )
+# LLM clients keyed by (provider, model), reused across specialists and rounds
+# so their HTTP connection pools stay warm
+_LLM_CACHE: Dict[Tuple[str, str], BaseLLM] = {}
 
-    review_prompt = f"""Review this research manuscript (Round {round_number}) from your expert perspective.
 
-MANUSCRIPT:
-{manuscript}
-
----
+def _get_llm(provider: str, model: str) -> BaseLLM:
+    """Return the cached LLM client for a provider/model, creating it on first use."""
+    llm = _LLM_CACHE.get((provider, model))
+    if llm is None:
+        llm_config = get_config().get_llm_config("anthropic", model)
+        llm = ClaudeLLM(
+            api_key=llm_config.api_key,
+            model=llm_config.model,
+            base_url=llm_config.base_url
+        )
+        _LLM_CACHE[(provider, model)] = llm
+    return llm
 
-Provide your review in the following JSON format:
 
-{{
-  "scores": {{
+_REVIEW_SCHEMA = """{
+  "scores": {
     "accuracy": <1-10>,
     "completeness": <1-10>,
     "clarity": <1-10>,
     "novelty": <1-10>,
     "rigor": <1-10>
-  }},
+  },
   "summary": "<2-3 sentence overall assessment>",
   "strengths": ["<strength 1>", "<strength 2>", "<strength 3>"],
   "weaknesses": ["<weakness 1>", "<weakness 2>", "<weakness 3>"],
   "suggestions": ["<suggestion 1>", "<suggestion 2>", "<suggestion 3>"],
   "detailed_feedback": "<paragraph of detailed feedback from your domain expertise>"
-}}
+}"""
+
+class ReviewScores(BaseModel):
+    """Per-dimension scores (1-10) in a reviewer's JSON reply."""
+    accuracy: int | float
+    completeness: int | float
+    clarity: int | float
+    novelty: int | float
+    rigor: int | float
 
-Scoring guide:
+
+class ReviewPayload(BaseModel):
+    """A reviewer's JSON reply, as laid out in _REVIEW_SCHEMA."""
+    scores: ReviewScores
+    summary: str
+    strengths: List[str]
+    weaknesses: List[str]
+    suggestions: List[str]
+    detailed_feedback: str
+
+
+class PanelReview(ReviewPayload):
+    """One panel member's review in a batched reply."""
+    specialist_id: str
+
+
+class PanelReply(BaseModel):
+    """A batched reply.
+
+    Entries that do not match PanelReview are kept as raw values rather than
+    failing the whole reply, so one malformed review only costs that
+    specialist an individual call.
+    """
+    reviews: List[Annotated[Union[PanelReview, Any], Field(union_mode="left_to_right")]] = []
+
+
+_SCORING_GUIDE = """Scoring guide:
 - 9-10: Exceptional, publication-ready
 - 7-8: Strong, minor improvements needed
 - 5-6: Adequate, significant improvements needed
 - 3-4: Weak, major revisions required
-- 1-2: Poor, fundamental issues
+- 1-2: Poor, fundamental issues"""
+
+# Shared by every specialist so the cached manuscript prefix matches across calls
+_REVIEWER_SYSTEM_PROMPT = "You are an expert peer reviewer for blockchain research. Adopt the reviewer role described in the request."
+
+_REVISION_NOTE = "Note: This is a revision - check if previous issues were addressed."
+
+
+def _format_review_instructions(persona: str, revision: bool) -> str:
+    """Per-specialist review instructions that follow the cached manuscript."""
+    return f"""YOUR ROLE:
+{persona}
+
+Review the manuscript above from your expert perspective.
+
+Provide your review in the following JSON format:
+
+{_REVIEW_SCHEMA}
+
+{_SCORING_GUIDE}
 
 Be honest and constructive. Focus on your domain of expertise.
-{"Note: This is a revision - check if previous issues were addressed." if round_number > 1 else ""}"""
+{_REVISION_NOTE if revision else ""}"""
 
-    response = await llm.generate(
-        prompt=review_prompt,
-        system=specialist["system_prompt"],
-        temperature=0.3,
-        max_tokens=4096
-    )
 
-    # Parse JSON
-    content = response.content.strip()
-    if content.startswith("```json"):
-        content = content[7:]
-    if content.startswith("```"):
-        content = content[3:]
-    if content.endswith("```"):
-        content = content[:-3]
-    content = content.strip()
+# The instructions depend only on the specialist and whether this is a
+# revision round, so they are built once here instead of on every call
+_REVIEW_INSTRUCTIONS: Dict[Tuple[str, bool], str] = {
+    (specialist_id, revision): _format_review_instructions(specialist["system_prompt"], revision)
+    for specialist_id, specialist in SPECIALISTS.items()
+    for revision in (False, True)
+}
+
+@lru_cache(maxsize=4)
+def _review_prefix(manuscript: str, round_number: int) -> str:
+    """Manuscript block leading every specialist's review request.
+
+    It is identical for every specialist in a round, so it goes first as a
+    cached prefix (the persona follows it instead of living in the system
+    prompt, which would break the shared prefix). Memoized so concurrent
+    specialists share one string rather than each copying the manuscript.
+    """
+    return f"""Review this research manuscript (Round {round_number}).
+
+MANUSCRIPT:
+{manuscript}
+
+---
+"""
+
+
+# A specialist whose previous review scored at least this on every criterion
+# and listed no weaknesses is not asked again; that review carries over
+CONVERGED_SCORE = 9
+
+# Output budget per review in a batched call; batching is skipped when the
+# combined budget would exceed BATCH_MAX_OUTPUT_TOKENS
+REVIEW_OUTPUT_TOKENS = 1500
+BATCH_MAX_OUTPUT_TOKENS = 6000
 
-    review_data = json.loads(content)
-    scores = review_data["scores"]
-    average = sum(scores.values()) / len(scores)
+
+# A completed score field in a streamed review, e.g. `"rigor": 7,`
+_SCORE_FIELD_RE = re.compile(r'"(accuracy|completeness|clarity|novelty|rigor)"\s*:\s*(\d+)\s*[,}\n]')
+
+
+class _ScoreWatcher:
+    """Report each review score as soon as it appears in the streamed response.
+
+    Only a short tail of earlier chunks is kept, enough to match a score field
+    split across chunk boundaries.
+    """
+
+    def __init__(self, on_score: Callable[[str, int], None]):
+        self.on_score = on_score
+        self._tail = ""
+        self._seen = set()
+
+    def __call__(self, text: str) -> None:
+        window = self._tail + text
+        for match in _SCORE_FIELD_RE.finditer(window):
+            key = match.group(1)
+            if key not in self._seen:
+                self._seen.add(key)
+                self.on_score(key, int(match.group(2)))
+        self._tail = window[-48:]
+
+
+def _build_review(specialist_id: str, review_data: ReviewPayload, tokens: Optional[int]) -> dict:
+    """Build the review record for a specialist from a validated reply."""
+    specialist = SPECIALISTS[specialist_id]
+    scores = review_data.scores.model_dump()
+    average = fmean(scores.values())
 
     return {
         "specialist": specialist_id,
         "specialist_name": specialist["name"],
-        "provider": provider,
-        "model": model,
+        "provider": specialist["provider"],
+        "model": specialist["model"],
         "scores": scores,
         "average": round(average, 1),
-        "summary": review_data["summary"],
-        "strengths": review_data["strengths"],
-        "weaknesses": review_data["weaknesses"],
-        "suggestions": review_data["suggestions"],
-        "detailed_feedback": review_data["detailed_feedback"],
-        "tokens": response.total_tokens
+        "summary": review_data.summary,
+        "strengths": review_data.strengths,
+        "weaknesses": review_data.weaknesses,
+        "suggestions": review_data.suggestions,
+        "detailed_feedback": review_data.detailed_feedback,
+        "tokens": tokens
     }
 
 
-async def run_review_round(manuscript: str, round_number: int) -> tuple[List[Dict], float]:
+async def generate_review(
+    specialist_id: str,
+    manuscript: str,
+    round_number: int,
+    on_score: Optional[Callable[[str, int], None]] = None,
+) -> dict:
+    """Generate review from a specialist (reuses demo_review logic).
+
+    The response is streamed; on_score, if given, is called with each
+    score (e.g. ("rigor", 7)) as soon as it has been generated.
+    """
+    specialist = SPECIALISTS[specialist_id]
+
+    provider = specialist["provider"]
+    model = specialist["model"]
+
+    llm = _get_llm(provider, model)
+
+    cached_prefix = _review_prefix(manuscript, round_number)
+    review_prompt = _REVIEW_INSTRUCTIONS[specialist_id, round_number > 1]
+
+    await _review_limiter.acquire(estimate_tokens(cached_prefix) + estimate_tokens(review_prompt, 4096))
+    response = await llm.generate_streaming(
+        prompt=review_prompt,
+        system=_REVIEWER_SYSTEM_PROMPT,
+        temperature=0.3,
+        max_tokens=4096,
+        cached_prefix=cached_prefix,
+        on_text=_ScoreWatcher(on_score) if on_score else None
+    )
+
+    # Parse and validate in one pass; a malformed reply raises ValidationError
+    review_data = ReviewPayload.model_validate_json(strip_code_fence(response.content))
+    return _build_review(specialist_id, review_data, response.total_tokens)
+
+
+def _is_converged(review: dict) -> bool:
+    """Whether a review leaves nothing for its specialist to re-check."""
+    return not review["weaknesses"] and min(review["scores"].values()) >= CONVERGED_SCORE
+
+
+def can_batch_reviews(specialist_ids: List[str]) -> bool:
+    """Whether the specialists can share one batched review call.
+
+    Requires a single provider/model across the panel and a combined
+    output budget that fits one response.
+    """
+    models = {(SPECIALISTS[sid]["provider"], SPECIALISTS[sid]["model"]) for sid in specialist_ids}
+    return (
+        len(specialist_ids) > 1
+        and len(models) == 1
+        and len(specialist_ids) * REVIEW_OUTPUT_TOKENS <= BATCH_MAX_OUTPUT_TOKENS
+    )
+
+
+async def generate_reviews_batched(
+    specialist_ids: List[str], manuscript: str, round_number: int
+) -> Dict[str, dict]:
+    """Generate reviews for several specialists in a single LLM call.
+
+    The manuscript is sent once and the model answers as every panel member,
+    returning one JSON object per specialist. Specialists missing from the
+    reply are omitted from the result so the caller can review them
+    individually.
+
+    Returns:
+        Dict mapping specialist_id to review record
+    """
+    first = SPECIALISTS[specialist_ids[0]]
+    llm = _get_llm(first["provider"], first["model"])
+
+    personas = "\n\n".join(
+        f"### Reviewer \"{sid}\" ({SPECIALISTS[sid]['name']})\n{SPECIALISTS[sid]['system_prompt']}"
+        for sid in specialist_ids
+    )
+    system_prompt = f"""You are a review panel of {len(specialist_ids)} independent experts.
+Write one review per panel member, each strictly from that member's perspective.
+
+{personas}"""
+
+    review_prompt = f"""Review this research manuscript (Round {round_number}) once per panel member: {", ".join(specialist_ids)}.
+
+MANUSCRIPT:
+{manuscript}
+
+---
+
+Respond with JSON only, in the following format:
+
+{{
+  "reviews": [
+    {{"specialist_id": "<panel member id>", ...review fields...}}
+  ]
+}}
+
+Each review object has "specialist_id" plus these fields:
+
+{_REVIEW_SCHEMA}
+
+{_SCORING_GUIDE}
+
+Be honest and constructive. Keep each review focused on that member's domain of expertise.
+{_REVISION_NOTE if round_number > 1 else ""}"""
+
+    max_tokens = len(specialist_ids) * REVIEW_OUTPUT_TOKENS
+    await _review_limiter.acquire(estimate_tokens(review_prompt, max_tokens))
+    response = await llm.generate(
+        prompt=review_prompt,
+        system=system_prompt,
+        temperature=0.3,
+        max_tokens=max_tokens
+    )
+
+    # Decoded and validated in one pass by the validators pydantic compiled
+    # for these models at import
+    reply = PanelReply.model_validate_json(strip_code_fence(response.content))
+    # Attribute the shared call's tokens evenly so per-round totals stay correct
+    tokens = response.total_tokens // len(specialist_ids) if response.total_tokens else None
+
+    reviews = {}
+    for entry in reply.reviews:
+        if not isinstance(entry, PanelReview):
+            continue
+        sid = entry.specialist_id
+        if sid in specialist_ids and sid not in reviews:
+            reviews[sid] = _build_review(sid, entry, tokens)
+    return reviews
+
+
+async def run_review_round(
+    manuscript: str,
+    round_number: int,
+    previous_reviews: Optional[List[Dict]] = None
+) -> tuple[List[Dict], float]:
     """Run one round of peer review.
 
+    Args:
+        manuscript: Manuscript text to review
+        round_number: Current round number
+        previous_reviews: Reviews from the previous round; converged
+            specialists' reviews are reused instead of calling them again
+
     Returns:
         (reviews, overall_average)
     """
     console.print(f"\n[bold cyan]Round {round_number}: Specialist Review[/bold cyan]\n")
 
-    reviews = []
+    # Carried-over reviews cost nothing this round
+    reviews = [
+        {**review, "carried_over": True, "tokens": 0}
+        for review in previous_reviews or []
+        if _is_converged(review)
+    ]
 
+    # Completed specialists are shown by finishing their spinner line rather
+    # than printing above the live display, so concurrent completions only
+    # touch task state and the display redraws at its own refresh rate
     with Progress(
-        SpinnerColumn(),
+        SpinnerColumn(finished_text="[green]✓[/green]"),
         TextColumn("[progress.description]{task.description}"),
         console=console
     ) as progress:
@@ -184,20 +439,67 @@ async def run_review_round(manuscript: str, round_number: int) -> tuple[List[Dic
             task = progress.add_task(f"[cyan]{specialist_name}...", total=None)
             tasks[specialist_id] = task
 
-        # Generate reviews concurrently
-        review_tasks = [
-            generate_review(specialist_id, manuscript, round_number)
-            for specialist_id in SPECIALISTS.keys()
-        ]
+        def _mark_complete(review: dict) -> None:
+            """Turn the specialist's spinner line into its result line."""
+            progress.update(
+                tasks[review["specialist"]],
+                description=f"{review['specialist_name']} complete (avg: {review['average']}/10)",
+                total=1,
+                completed=1
+            )
 
-        for review_result in asyncio.as_completed(review_tasks):
-            review = await review_result
-            reviews.append(review)
-            specialist_id = review["specialist"]
-            progress.update(tasks[specialist_id], completed=True)
-            console.print(f"[green]✓[/green] {review['specialist_name']} complete (avg: {review['average']}/10)")
+        for review in reviews:
+            progress.update(
+                tasks[review["specialist"]],
+                description=f"{review['specialist_name']} converged (avg: {review['average']}/10, carried over)",
+                total=1,
+                completed=1
+            )
 
-    overall_average = sum(r["average"] for r in reviews) / len(reviews)
+        # Try one batched call for the rest of the panel; anyone it misses is
+        # reviewed individually below
+        carried = {review["specialist"] for review in reviews}
+        pending = [sid for sid in SPECIALISTS if sid not in carried]
+        if can_batch_reviews(pending):
+            try:
+                batched = await generate_reviews_batched(pending, manuscript, round_number)
+            except Exception as e:
+                console.print(f"[yellow]⚠ Batched review failed, reviewing individually: {e}[/yellow]")
+                batched = {}
+            for review in batched.values():
+                reviews.append(review)
+                _mark_complete(review)
+            pending = [sid for sid in pending if sid not in batched]
+
+        def _score_reporter(specialist_id: str) -> Callable[[str, int], None]:
+            """Show scores on the specialist's spinner as they stream in."""
+            name = SPECIALISTS[specialist_id]["name"]
+            partial = []
+
+            def report(key: str, value: int) -> None:
+                partial.append(f"{key[:3]}={value}")
+                progress.update(tasks[specialist_id], description=f"[cyan]{name}... {' '.join(partial)}")
+            return report
+
+        async def _review(specialist_id: str) -> dict:
+            review = await generate_review(
+                specialist_id, manuscript, round_number, on_score=_score_reporter(specialist_id)
+            )
+            _mark_complete(review)
+            return review
+
+        # Generate remaining reviews concurrently; if one fails the group
+        # cancels the others instead of leaving them running unobserved.
+        # Results keep panel order.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                review_tasks = [tg.create_task(_review(sid)) for sid in pending]
+        except ExceptionGroup as eg:
+            # Surface the first reviewer failure, as gather() used to
+            raise eg.exceptions[0] from None
+        reviews.extend(task.result() for task in review_tasks)
+
+    overall_average = fmean(r["average"] for r in reviews)
 
     # Display scores
     table = Table(title=f"\nRound {round_number} Scores", show_header=True)
@@ -227,6 +529,11 @@ async def run_review_round(manuscript: str, round_number: int) -> tuple[List[Dic
     return reviews, overall_average
 
 
+def _save_round(round_file: Path, round_data: dict) -> None:
+    """Write one round's record to disk (run in a worker thread)."""
+    round_file.write_bytes(json_dumps(round_data, indent=True))
+
+
 async def run_full_workflow(
     manuscript_path: Path,
     max_rounds: int = 3,
@@ -250,9 +557,11 @@ async def run_full_workflow(
     # Setup
     if output_dir is None:
         output_dir = Path("results") / manuscript_path.stem
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # File I/O runs in worker threads so a slow disk does not stall the
+    # event loop while reviews are streaming
+    await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
 
-    manuscript = manuscript_path.read_text()
+    manuscript = await asyncio.to_thread(manuscript_path.read_text, encoding="utf-8")
     word_count = len(manuscript.split())
 
     console.print(f"\n[bold]Initial Manuscript:[/bold] {manuscript_path}")
@@ -260,9 +569,11 @@ async def run_full_workflow(
     console.print(f"Max rounds: {max_rounds}")
     console.print(f"Threshold: {threshold}/10\n")
 
-    # Save initial manuscript
+    # Save initial manuscript as a straight file copy (no re-encode); a
+    # re-run on a previous output may already be reading manuscript_v1.md
     manuscript_v1_path = output_dir / "manuscript_v1.md"
-    manuscript_v1_path.write_text(manuscript)
+    if manuscript_path.resolve() != manuscript_v1_path.resolve():
+        await asyncio.to_thread(shutil.copyfile, manuscript_path, manuscript_v1_path)
     console.print(f"[dim]Saved: {manuscript_v1_path}[/dim]")
 
     # Initialize agents
@@ -273,13 +584,20 @@ async def run_full_workflow(
     all_rounds = []
     current_manuscript = manuscript
     previous_manuscript = None
+    # Word counts are taken once per manuscript version and carried along
+    current_words = word_count
+    previous_words = None
 
     # Iterative review loop
     for round_num in range(1, max_rounds + 1):
         console.print("\n" + "="*80 + "\n")
 
         # Run review
-        reviews, overall_average = await run_review_round(current_manuscript, round_num)
+        reviews, overall_average = await run_review_round(
+            current_manuscript,
+            round_num,
+            previous_reviews=all_rounds[-1]["reviews"] if all_rounds else None
+        )
 
         # Moderator decision
         console.print("\n[cyan]Moderator evaluating reviews...[/cyan]")
@@ -318,7 +636,7 @@ async def run_full_workflow(
         # Calculate manuscript diff
         manuscript_diff = None
         if previous_manuscript:
-            words_added = len(current_manuscript.split()) - len(previous_manuscript.split())
+            words_added = current_words - previous_words
             manuscript_diff = {
                 "words_added": words_added,
                 "previous_version": f"v{round_num-1}",
@@ -329,7 +647,7 @@ async def run_full_workflow(
         round_data = {
             "round": round_num,
             "manuscript_version": f"v{round_num}",
-            "word_count": len(current_manuscript.split()),
+            "word_count": current_words,
             "reviews": reviews,
             "overall_average": round(overall_average, 1),
             "moderator_decision": moderator_decision,
@@ -340,8 +658,7 @@ async def run_full_workflow(
         }
 
         round_file = output_dir / f"round_{round_num}.json"
-        with open(round_file, "w") as f:
-            json.dump(round_data, f, indent=2)
+        await asyncio.to_thread(_save_round, round_file, round_data)
         console.print(f"[dim]Saved: {round_file}[/dim]")
 
         all_rounds.append(round_data)
@@ -353,7 +670,7 @@ async def run_full_workflow(
 
             # Save final manuscript
             final_path = output_dir / "manuscript_final.md"
-            final_path.write_text(current_manuscript)
+            await asyncio.to_thread(final_path.write_text, current_manuscript)
             console.print(f"[green]Final manuscript saved:[/green] {final_path}")
             break
 
@@ -364,7 +681,7 @@ async def run_full_workflow(
 
             # Save best attempt
             final_path = output_dir / f"manuscript_final_v{round_num}.md"
-            final_path.write_text(current_manuscript)
+            await asyncio.to_thread(final_path.write_text, current_manuscript)
             console.print(f"[yellow]Best attempt saved:[/yellow] {final_path}")
             break
 
@@ -375,6 +692,7 @@ async def run_full_workflow(
 
         # Store previous manuscript for diff
         previous_manuscript = current_manuscript
+        previous_words = current_words
 
         # Generate revision
         with Progress(
@@ -391,16 +709,17 @@ async def run_full_workflow(
             progress.update(task, completed=True)
 
         new_word_count = len(revised_manuscript.split())
-        word_change = new_word_count - len(current_manuscript.split())
+        word_change = new_word_count - current_words
         console.print(f"[green]✓ Revision complete[/green]")
         console.print(f"New length: {new_word_count:,} words ([{word_change:+,}])\n")
 
         # Save revised manuscript
         manuscript_path_next = output_dir / f"manuscript_v{round_num + 1}.md"
-        manuscript_path_next.write_text(revised_manuscript)
+        await asyncio.to_thread(manuscript_path_next.write_text, revised_manuscript)
         console.print(f"[dim]Saved: {manuscript_path_next}[/dim]")
 
         current_manuscript = revised_manuscript
+        current_words = new_word_count
 
     # Generate summary
     console.print("\n" + "="*80 + "\n")
@@ -439,8 +758,7 @@ async def run_full_workflow(
     }
 
     workflow_file = output_dir / "workflow_complete.json"
-    with open(workflow_file, "w") as f:
-        json.dump(workflow_data, f, indent=2)
+    await asyncio.to_thread(workflow_file.write_bytes, json_dumps(workflow_data, indent=True))
 
     console.print(f"\n[bold green]✓ Complete workflow saved:[/bold green] {workflow_file}")
 
@@ -455,13 +773,9 @@ async def run_full_workflow(
     # Export to web automatically
     console.print("[cyan]Exporting results to web viewer...[/cyan]")
     try:
-        import subprocess
-        result = subprocess.run(
-            [sys.executable, "export_to_web.py"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        from research_cli.cli import _export_to_web
+
+        await _export_to_web()
         console.print("[green]✓ Results exported to web/data/[/green]")
         console.print("[dim]View at: http://localhost:8080/web/review-viewer.html[/dim]\n")
     except Exception as e:
@@ -503,8 +817,20 @@ async def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        await close_http_clients()
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # uvloop cuts per-await scheduling overhead for the concurrent review
+    # streams; it is optional and the stdlib loop is used without it
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None:
+        exit_code = uvloop.run(main())
+    else:
+        exit_code = asyncio.run(main())
     sys.exit(exit_code)
@@ -18,7 +18,7 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from research_cli.db import init_db, create_legacy_key, get_connection
+from research_cli.db import init_db, create_legacy_keys, get_connection
 
 KEYS_FILE = Path("keys.json")
 BACKUP_FILE = Path("keys.json.backup")
@@ -46,23 +46,30 @@ def main():
         print("No keys found in keys.json. Nothing to migrate.")
         return
 
-    # Migrate each key
-    migrated = 0
+    # Migrate all keys in a single transaction (one fsync instead of one per key)
+    rows = []
+    log_lines = []
     for entry in keys:
         key_value = entry.get("key", "")
         label = entry.get("label", "")
         if not key_value:
             continue
 
-        print(f"  Migrating key: {key_value[:8]}... (label: {label or '-'})")
-        create_legacy_key(key_value, label=f"legacy: {label}" if label else "legacy key")
-        migrated += 1
+        log_lines.append(f"  Migrating key: {key_value[:8]}... (label: {label or '-'})")
+        rows.append((key_value, f"legacy: {label}" if label else "legacy key"))
 
-    print(f"\nMigrated {migrated} key(s) to SQLite.")
+    if log_lines:
+        print("\n".join(log_lines))
 
-    # Verify
     conn = get_connection()
-    count = conn.execute("SELECT COUNT(*) as c FROM api_keys").fetchone()["c"]
+    # WAL is already on; NORMAL skips the per-commit fsync of the WAL file
+    conn.execute("PRAGMA synchronous=NORMAL")
+    migrated = create_legacy_keys(rows)
+
+    print(f"\nMigrated {migrated} key(s) to SQLite ({len(rows) - migrated} already present).")
+
+    # Verify
+    count = conn.execute("SELECT COUNT(*) FROM api_keys").fetchone()[0]
     print(f"Total keys in database: {count}")
 
     # Backup original file
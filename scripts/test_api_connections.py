@@ -18,15 +18,21 @@ from research_cli.model_config import (
 )
 
 
-async def test_model(provider: str, model: str) -> dict:
+# Cap on in-flight tests so large configs stay under provider rate limits
+# (transient failures are already retried inside each client)
+CONCURRENCY = int(os.environ.get("API_TEST_CONCURRENCY", "8"))
+
+
+async def test_model(provider: str, model: str, sem: asyncio.Semaphore) -> dict:
     """Test a single model with a minimal prompt."""
     try:
         llm = _create_llm(provider, model)
-        response = await llm.generate(
-            prompt="Say hello in exactly 5 words.",
-            temperature=0.1,
-            max_tokens=50,
-        )
+        async with sem:
+            response = await llm.generate(
+                prompt="Say hello in exactly 5 words.",
+                temperature=0.1,
+                max_tokens=50,
+            )
         return {
             "model": model,
             "provider": provider,
@@ -46,40 +52,24 @@ async def test_model(provider: str, model: str) -> dict:
 async def main():
     config = _load_config()
 
-    # Collect unique model+provider pairs from tiers + reviewer_rotation
-    seen = set()
-    tests = []
-
-    # From tiers
-    for tier_name, tier_data in config.get("tiers", {}).items():
-        primary = tier_data["primary"]
-        key = (primary["provider"], primary["model"])
-        if key not in seen:
-            seen.add(key)
-            tests.append(key)
-        for fb in tier_data.get("fallback", []):
-            key = (fb["provider"], fb["model"])
-            if key not in seen:
-                seen.add(key)
-                tests.append(key)
-
-    # From reviewer_rotation
-    for r in config.get("roles", {}).get("reviewer_rotation", []):
-        key = (r["provider"], r["model"])
-        if key not in seen:
-            seen.add(key)
-            tests.append(key)
-        for fb in r.get("fallback", []):
-            key = (fb["provider"], fb["model"])
-            if key not in seen:
-                seen.add(key)
-                tests.append(key)
+    # Unique model+provider pairs from tiers + reviewer_rotation, in
+    # first-seen order (primary before its fallbacks)
+    entries = [
+        *config.get("tiers", {}).values(),
+        *config.get("roles", {}).get("reviewer_rotation", []),
+    ]
+    tests = list(dict.fromkeys(
+        (m["provider"], m["model"])
+        for entry in entries
+        for m in (entry.get("primary", entry), *entry.get("fallback", []))
+    ))
 
     print(f"Testing {len(tests)} unique model+provider combinations...\n")
     print(f"{'Provider':12s} {'Model':30s} {'Status':8s} {'Details'}")
     print("-" * 100)
 
-    results = await asyncio.gather(*[test_model(p, m) for p, m in tests])
+    sem = asyncio.Semaphore(CONCURRENCY)
+    results = await asyncio.gather(*[test_model(p, m, sem) for p, m in tests])
 
     ok = 0
     fail = 0
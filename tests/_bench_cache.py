@@ -0,0 +1,53 @@
+"""Opt-in response cache for the bench scripts.
+
+Bench runs send byte-identical prompts on every iteration. With
+BENCH_CACHE=1 each (provider, model, request) is answered from disk after
+its first run, so prompt or report tweaks can be iterated on without
+re-paying for the calls. Unlike LLMCache's own keying, temperature > 0
+requests are cached too: a bench replay only needs *a* representative
+response, not a fresh sample.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Tuple
+
+from research_cli.llm.base import BaseLLM, LLMResponse
+from research_cli.llm.cache import FileBackend, LLMCache
+
+ENABLED = os.environ.get("BENCH_CACHE") == "1"
+
+_cache = LLMCache(FileBackend(root=Path.home() / ".cache" / "research_cli" / "bench"))
+
+
+def _key(llm: BaseLLM, kwargs: dict) -> str:
+    # Callbacks (on_text) don't affect the response
+    params = {k: v for k, v in kwargs.items() if not callable(v)}
+    payload = json.dumps(
+        {"provider": llm.provider_name, "model": llm.model, "params": params},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def cached_generate(llm: BaseLLM, streaming: bool = False, **kwargs) -> Tuple[LLMResponse, bool]:
+    """Call llm.generate (or generate_streaming), replaying from disk if enabled.
+
+    Returns:
+        (response, cache_hit). Token counts of a replayed response are those
+        of the original call, so cost figures show what the call would cost.
+    """
+    key = _key(llm, kwargs) if ENABLED else None
+    if key is not None:
+        cached = await _cache.get(key)
+        if cached is not None:
+            return cached, True
+
+    call = llm.generate_streaming if streaming else llm.generate
+    response = await call(**kwargs)
+    if key is not None:
+        await _cache.set(key, response)
+    return response, False
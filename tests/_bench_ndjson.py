@@ -0,0 +1,44 @@
+"""Machine-readable bench output.
+
+With BENCH_NDJSON=/path/to/file.ndjson, each bench appends one JSON line
+per result, tagged with the run id, git commit and timestamp, so runs can
+be compared across commits without parsing the printed tables.
+"""
+
+import os
+import subprocess
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from research_cli.utils.fast_json import dumps as json_dumps
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RUN_ID = uuid.uuid4().hex
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def append_results(bench: str, rows: Iterable[dict]) -> None:
+    """Append rows to $BENCH_NDJSON (no-op when unset)."""
+    path = os.environ.get("BENCH_NDJSON")
+    if not path:
+        return
+    meta = {
+        "bench": bench,
+        "run_id": RUN_ID,
+        "git_commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    with open(path, "ab") as f:
+        f.write(b"".join(json_dumps({**meta, **row}) + b"\n" for row in rows))
@@ -5,9 +5,10 @@ measuring latency, token usage, cost, and output quality.
 """
 
 import asyncio
-import json
 import os
 import time
+from dataclasses import asdict, dataclass
+from typing import Optional
 
 TOPIC = "Game-theoretic approaches to mechanism design in decentralized systems"
 MANUSCRIPT_SNIPPET = """## TL;DR
@@ -28,11 +29,51 @@ The revelation principle states that for any mechanism with an equilibrium, ther
 
 MODELS = ["gemini-3-flash-preview", "gemini-2.5-flash"]
 
-# Gemini pricing (per 1M tokens)
-PRICING = {
-    "gemini-3-flash-preview": {"input": 0.15, "output": 0.60},
-    "gemini-2.5-flash": {"input": 0.15, "output": 0.60},
-}
+@dataclass(slots=True)
+class RoleResult:
+    """Outcome of one role test against one model."""
+
+    latency_s: float
+    ttft_s: float = 0
+    tokens_per_s: float = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0
+    quality_ok: bool = False
+    output_preview: str = ""
+    cache_hit: bool = False
+    timed_out: bool = False
+    error: Optional[str] = None
+
+
+# Per-role bound (including client retries) so one stalled call can't hold
+# up the rest of the report
+ROLE_TIMEOUT = 60  # seconds
+
+
+def _quality_categorizer(d: dict) -> bool:
+    return bool(d.get("primary_major")) and d.get("confidence", 0) > 0.5
+
+
+def _quality_team_composer(d: dict) -> bool:
+    return isinstance(d.get("experts"), list) and len(d.get("experts", [])) >= 2
+
+
+def _quality_moderator(d: dict) -> bool:
+    return (
+        d.get("decision") in ("MAJOR_REVISION", "MINOR_REVISION", "ACCEPT", "REJECT")
+        and len(d.get("key_issues", [])) >= 1
+    )
+
+
+def _quality_title(t: str) -> bool:
+    return 15 <= len(t) <= 200 and '\n' not in t.strip()
+
+
+def _quality_desk_editor(d: dict) -> bool:
+    return isinstance(d.get("pass"), bool) and isinstance(d.get("scope_ok"), bool)
+
 
 ROLE_TESTS = {
     "categorizer": {
@@ -53,7 +94,19 @@ Respond in JSON format:
         "temperature": 0.3,
         "max_tokens": 512,
         "json_mode": True,
-        "quality_check": lambda d: d.get("primary_major") and d.get("confidence", 0) > 0.5,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "primary_major": {"type": "string"},
+                "primary_subfield": {"type": "string"},
+                "secondary_major": {"type": "string", "nullable": True},
+                "secondary_subfield": {"type": "string", "nullable": True},
+                "confidence": {"type": "number"},
+                "reasoning": {"type": "string"},
+            },
+            "required": ["primary_major", "primary_subfield", "confidence"],
+        },
+        "quality_check": _quality_categorizer,
     },
 
     "team_composer": {
@@ -76,7 +129,25 @@ Return JSON:
         "temperature": 0.7,
         "max_tokens": 2048,
         "json_mode": True,
-        "quality_check": lambda d: isinstance(d.get("experts"), list) and len(d.get("experts", [])) >= 2,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "experts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "expert_domain": {"type": "string"},
+                            "rationale": {"type": "string"},
+                            "focus_areas": {"type": "array", "items": {"type": "string"}},
+                        },
+                        "required": ["expert_domain", "rationale", "focus_areas"],
+                    },
+                },
+            },
+            "required": ["experts"],
+        },
+        "quality_check": _quality_team_composer,
     },
 
     "moderator": {
@@ -112,7 +183,20 @@ Return JSON:
         "temperature": 0.3,
         "max_tokens": 2048,
         "json_mode": True,
-        "quality_check": lambda d: d.get("decision") in ("MAJOR_REVISION", "MINOR_REVISION", "ACCEPT", "REJECT") and len(d.get("key_issues", [])) >= 1,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "decision": {
+                    "type": "string",
+                    "enum": ["ACCEPT", "MINOR_REVISION", "MAJOR_REVISION", "REJECT"],
+                },
+                "key_issues": {"type": "array", "items": {"type": "string"}},
+                "revision_priorities": {"type": "array", "items": {"type": "string"}},
+                "specific_actions": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["decision", "key_issues"],
+        },
+        "quality_check": _quality_moderator,
     },
 
     "title_generator": {
@@ -134,7 +218,7 @@ Respond with ONLY the title text on a single line.""",
         "temperature": 0.7,
         "max_tokens": 100,
         "json_mode": False,
-        "quality_check": lambda t: 15 <= len(t) <= 200 and '\n' not in t.strip(),
+        "quality_check": _quality_title,
     },
 
     "desk_editor": {
@@ -162,7 +246,18 @@ Return JSON:
         "temperature": 0.1,
         "max_tokens": 512,
         "json_mode": True,
-        "quality_check": lambda d: isinstance(d.get("pass"), bool) and isinstance(d.get("scope_ok"), bool),
+        "schema": {
+            "type": "object",
+            "properties": {
+                "pass": {"type": "boolean"},
+                "scope_ok": {"type": "boolean"},
+                "quality_ok": {"type": "boolean"},
+                "issues": {"type": "array", "items": {"type": "string"}},
+                "notes": {"type": "string"},
+            },
+            "required": ["pass", "scope_ok", "quality_ok"],
+        },
+        "quality_check": _quality_desk_editor,
     },
 }
 
@@ -170,110 +265,180 @@ Return JSON:
 async def test_model(model_name: str):
     """Run all role tests against a single model."""
     from research_cli.llm.gemini import GeminiLLM
+    from research_cli.model_config import get_pricing, token_cost
+    from research_cli.utils.fast_json import dumps as json_dumps
     from research_cli.utils.json_repair import repair_json
+    from _bench_cache import cached_generate
 
     api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
     llm = GeminiLLM(api_key=api_key, model=model_name)
-    pricing = PRICING.get(model_name, {"input": 0.15, "output": 0.60})
+    # Rates from config/models.json, as the workflow bills them
+    pricing = get_pricing(model_name)
 
-    results = {}
+    async def _run_role(role: str, config: dict):
+        t0 = time.perf_counter_ns()
+        first_token_at = None
+
+        def _on_text(_chunk: str):
+            nonlocal first_token_at
+            if first_token_at is None:
+                first_token_at = time.perf_counter_ns()
 
-    for role, config in ROLE_TESTS.items():
-        t0 = time.monotonic()
         try:
-            response = await llm.generate(
-                prompt=config["prompt"],
-                system=config["system"],
-                temperature=config["temperature"],
-                max_tokens=config["max_tokens"],
-                json_mode=config.get("json_mode", False),
-            )
-            elapsed = time.monotonic() - t0
+            # Streamed so time to first token and decode speed can be
+            # reported separately from total latency
+            async with asyncio.timeout(ROLE_TIMEOUT):
+                response, cache_hit = await cached_generate(
+                    llm,
+                    streaming=True,
+                    on_text=_on_text,
+                    prompt=config["prompt"],
+                    system=config["system"],
+                    temperature=config["temperature"],
+                    max_tokens=config["max_tokens"],
+                    json_mode=config.get("json_mode", False),
+                    response_schema=config.get("schema"),
+                )
+            elapsed = (time.perf_counter_ns() - t0) / 1e9
+            ttft = (first_token_at - t0) / 1e9 if first_token_at is not None else elapsed
 
             content = response.content.strip()
             in_tok = response.input_tokens or 0
+            cached_tok = response.cached_input_tokens or 0
             out_tok = response.output_tokens or 0
-            cost = (in_tok * pricing["input"] + out_tok * pricing["output"]) / 1_000_000
+            # input_tokens includes the cached prefix, billed at the cached rate
+            cost = token_cost(pricing, in_tok, out_tok, cached_tok)
 
-            # Quality check
+            # Quality check. Schema-constrained replies are valid JSON, so
+            # repair_json returns from its strict first parse unless the
+            # reply was cut off at max_tokens
             if config["json_mode"]:
                 parsed = repair_json(content)
                 quality_ok = config["quality_check"](parsed)
-                output_preview = json.dumps(parsed, ensure_ascii=False)[:120]
+                # Slice the encoded bytes before decoding; "ignore" drops a
+                # multi-byte character cut at the boundary
+                output_preview = json_dumps(parsed)[:120].decode("utf-8", errors="ignore")
             else:
                 quality_ok = config["quality_check"](content)
                 output_preview = content[:120]
 
-            results[role] = {
-                "latency_s": round(elapsed, 2),
-                "input_tokens": in_tok,
-                "output_tokens": out_tok,
-                "cost_usd": round(cost, 6),
-                "quality_ok": quality_ok,
-                "output_preview": output_preview,
-                "error": None,
-            }
+            decode_s = elapsed - ttft
+            return role, RoleResult(
+                latency_s=round(elapsed, 2),
+                ttft_s=round(ttft, 2),
+                tokens_per_s=round(out_tok / decode_s, 1) if decode_s > 0 else 0,
+                input_tokens=in_tok,
+                cached_input_tokens=cached_tok,
+                output_tokens=out_tok,
+                cost_usd=round(cost, 6),
+                quality_ok=quality_ok,
+                output_preview=output_preview,
+                cache_hit=cache_hit,
+            )
         except Exception as e:
-            elapsed = time.monotonic() - t0
-            results[role] = {
-                "latency_s": round(elapsed, 2),
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "cost_usd": 0,
-                "quality_ok": False,
-                "output_preview": "",
-                "error": str(e),
-            }
+            elapsed = (time.perf_counter_ns() - t0) / 1e9
+            return role, RoleResult(
+                latency_s=round(elapsed, 2),
+                timed_out=isinstance(e, TimeoutError),
+                error=f"timed out after {ROLE_TIMEOUT}s" if isinstance(e, TimeoutError) else str(e),
+            )
 
-    return results
+    # Roles are independent calls: per-model latency is the slowest role
+    # rather than the sum of all five
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_run_role(r, c)) for r, c in ROLE_TESTS.items()]
+    return dict(task.result() for task in tasks)
 
 
 async def main():
-    all_results = {}
-    for model in MODELS:
-        print(f"\n{'='*60}")
-        print(f"  Testing: {model}")
-        print(f"{'='*60}")
-        results = await test_model(model)
-        all_results[model] = results
+    # Models are independent network-bound runs; benchmark them concurrently
+    # and print once all are done so the per-model tables don't interleave
+    from research_cli.llm.http import close_http_clients
+    from _bench_ndjson import append_results
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(test_model(m)) for m in MODELS]
+    all_results = {model: task.result() for model, task in zip(MODELS, tasks)}
+    # All GeminiLLM instances shared this loop's connection pool
+    await close_http_clients()
+
+    append_results("gemini_models", (
+        {"model": model, "role": role, **asdict(r)}
+        for model, results in all_results.items()
+        for role, r in results.items()
+    ))
+
+    # Report is built as lines and written once; row templates are parsed once
+    lines = []
+    out = lines.append
+    role_row = "  {:<20} {:>7.1f}s {:>6.1f}s {:>6.0f}/s  {:>5}+{:<5} tok  ${:.5f}  {}".format
+    compare_row = "  {:<20} {:>7.1f}s {}   {:>7.1f}s {}   {:>6.1f}x".format
+
+    # model -> (latency, cost) sums, reused by the comparison summary
+    totals = {}
+    for model, results in all_results.items():
+        out(f"\n{'='*60}")
+        out(f"  Testing: {model}")
+        out(f"{'='*60}")
+        out(f"  {'Role':<20} {'Total':>8} {'TTFT':>7} {'Decode':>8}  {'In+Out':>11}")
 
         total_latency = 0
         total_cost = 0
+        billed_cost = 0
         quality_pass = 0
+        timeouts = 0
+        input_tokens = 0
+        cached_tokens = 0
 
         for role, r in results.items():
-            status = "✓" if r["quality_ok"] else ("✗ " + (r["error"] or "quality fail"))
-            print(f"  {role:<20} {r['latency_s']:>7.1f}s  {r['input_tokens']:>5}+{r['output_tokens']:<5} tok  ${r['cost_usd']:.5f}  {status}")
-            total_latency += r["latency_s"]
-            total_cost += r["cost_usd"]
-            if r["quality_ok"]:
+            status = "✓" if r.quality_ok else ("✗ " + (r.error or "quality fail"))
+            if r.cache_hit:
+                status += " (cached)"
+            out(role_row(role, r.latency_s, r.ttft_s, r.tokens_per_s, r.input_tokens, r.output_tokens, r.cost_usd, status))
+            total_latency += r.latency_s
+            total_cost += r.cost_usd
+            if not r.cache_hit:
+                billed_cost += r.cost_usd
+            if r.quality_ok:
                 quality_pass += 1
-
-        print(f"  {'─'*58}")
-        print(f"  {'TOTAL':<20} {total_latency:>7.1f}s  {'':>12}  ${total_cost:.5f}  {quality_pass}/{len(results)} pass")
+            timeouts += r.timed_out
+            input_tokens += r.input_tokens
+            cached_tokens += r.cached_input_tokens
+
+        totals[model] = (total_latency, total_cost)
+
+        out(f"  {'─'*58}")
+        out(f"  {'TOTAL':<20} {total_latency:>7.1f}s  {'':>29}  ${total_cost:.5f}  {quality_pass}/{len(results)} pass"
+              + (f", {timeouts} timed out" if timeouts else ""))
+        if cached_tokens:
+            # Provider-side prompt cache hits (billed at the cached-input rate)
+            out(f"  {'CACHED INPUT':<20} {cached_tokens}/{input_tokens} tok ({cached_tokens / input_tokens:.0%})")
+        if billed_cost != total_cost:
+            # Cached replays report the original call's cost but bill nothing
+            out(f"  {'BILLED (cache on)':<20} {'':>7}   {'':>29}  ${billed_cost:.5f}")
 
     # Comparison summary
-    print(f"\n{'='*60}")
-    print(f"  COMPARISON SUMMARY")
-    print(f"{'='*60}")
-    print(f"  {'Role':<20} {'3-flash-preview':>16} {'2.5-flash':>12} {'Speedup':>9}")
-    print(f"  {'─'*58}")
+    out(f"\n{'='*60}")
+    out(f"  COMPARISON SUMMARY")
+    out(f"{'='*60}")
+    out(f"  {'Role':<20} {'3-flash-preview':>16} {'2.5-flash':>12} {'Speedup':>9}")
+    out(f"  {'─'*58}")
     for role in ROLE_TESTS:
         r3 = all_results[MODELS[0]][role]
         r25 = all_results[MODELS[1]][role]
-        speedup = r3["latency_s"] / r25["latency_s"] if r25["latency_s"] > 0 else float("inf")
-        q3 = "✓" if r3["quality_ok"] else "✗"
-        q25 = "✓" if r25["quality_ok"] else "✗"
-        print(f"  {role:<20} {r3['latency_s']:>7.1f}s {q3}   {r25['latency_s']:>7.1f}s {q25}   {speedup:>6.1f}x")
-
-    t3_total = sum(r["latency_s"] for r in all_results[MODELS[0]].values())
-    t25_total = sum(r["latency_s"] for r in all_results[MODELS[1]].values())
-    c3_total = sum(r["cost_usd"] for r in all_results[MODELS[0]].values())
-    c25_total = sum(r["cost_usd"] for r in all_results[MODELS[1]].values())
-
-    print(f"  {'─'*58}")
-    print(f"  {'TOTAL LATENCY':<20} {t3_total:>7.1f}s      {t25_total:>7.1f}s      {t3_total/t25_total if t25_total > 0 else 0:>6.1f}x")
-    print(f"  {'TOTAL COST':<20} ${c3_total:>.5f}      ${c25_total:>.5f}")
+        speedup = r3.latency_s / r25.latency_s if r25.latency_s > 0 else float("inf")
+        q3 = "✓" if r3.quality_ok else "✗"
+        q25 = "✓" if r25.quality_ok else "✗"
+        out(compare_row(role, r3.latency_s, q3, r25.latency_s, q25, speedup))
+
+    t3_total, c3_total = totals[MODELS[0]]
+    t25_total, c25_total = totals[MODELS[1]]
+
+    out(f"  {'─'*58}")
+    out(f"  {'TOTAL LATENCY':<20} {t3_total:>7.1f}s      {t25_total:>7.1f}s      {t3_total/t25_total if t25_total > 0 else 0:>6.1f}x")
+    out(f"  {'TOTAL COST':<20} ${c3_total:>.5f}      ${c25_total:>.5f}")
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
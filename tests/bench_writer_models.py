@@ -9,9 +9,12 @@ Gives the same section spec to both models and compares:
 import asyncio
 import json
 import os
+import re
 import sys
 import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Optional
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
@@ -71,20 +74,45 @@ RESEARCH CONTEXT:
 Write the section in markdown. Include inline citations [Author, Year].
 Do NOT include a references section — just the section body."""
 
+# Inline citations in the "[Author, Year]" form the system prompt asks for
+# (bare "[" also matches markdown links and checkboxes)
+_CITATION_RE = re.compile(r"\[[^\]]{2,80},\s*\d{4}[a-z]?\]")
+
 MODELS = [
     {"name": "gemini-3-pro-preview", "provider": "google"},
     {"name": "claude-sonnet-4-5", "provider": "anthropic"},
 ]
 
-# Pricing per 1M tokens
-PRICING = {
-    "gemini-3-pro-preview": {"input": 2.0, "output": 12.0},
-    "claude-sonnet-4-5": {"input": 3.0, "output": 15.0},
-}
+@dataclass(slots=True)
+class WriteResult:
+    """Outcome of one model's section write."""
+
+    model: str
+    latency_s: float
+    ttft_s: float = 0
+    tokens_per_s: float = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0
+    word_count: int = 0
+    citation_count: int = 0
+    line_count: int = 0
+    content: str = ""
+    cache_hit: bool = False
+    timed_out: bool = False
+    error: Optional[str] = None
+
+
+# Per-model bound on a full section write, including client retries
+WRITE_TIMEOUT = 300  # seconds
 
 
 async def test_writer(model_name: str, provider: str):
     """Run writing test for a single model."""
+    from research_cli.model_config import get_pricing, token_cost
+    from _bench_cache import cached_generate
+
     if provider == "google":
         from research_cli.llm.gemini import GeminiLLM
         api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
@@ -94,77 +122,100 @@ async def test_writer(model_name: str, provider: str):
         api_key = os.environ.get("ANTHROPIC_API_KEY") or os.environ.get("ANTHROPIC_AUTH_TOKEN")
         llm = ClaudeLLM(api_key=api_key, model=model_name)
 
-    pricing = PRICING[model_name]
+    # Rates from config/models.json, as the workflow bills them
+    pricing = get_pricing(model_name)
+
+    t0 = time.perf_counter_ns()
+    first_token_at = None
+
+    def _on_text(_chunk: str):
+        nonlocal first_token_at
+        if first_token_at is None:
+            first_token_at = time.perf_counter_ns()
 
-    t0 = time.monotonic()
     try:
-        response = await llm.generate(
-            prompt=USER_PROMPT,
-            system=SYSTEM_PROMPT,
-            temperature=0.7,
-            max_tokens=4096,
-        )
-        elapsed = time.monotonic() - t0
+        # Streamed so time to first token can be reported alongside latency
+        async with asyncio.timeout(WRITE_TIMEOUT):
+            response, cache_hit = await cached_generate(
+                llm,
+                streaming=True,
+                prompt=USER_PROMPT,
+                system=SYSTEM_PROMPT,
+                temperature=0.7,
+                max_tokens=4096,
+                on_text=_on_text,
+            )
+        elapsed = (time.perf_counter_ns() - t0) / 1e9
+        ttft = (first_token_at - t0) / 1e9 if first_token_at is not None else elapsed
 
         content = response.content.strip()
         in_tok = response.input_tokens or 0
+        cached_tok = response.cached_input_tokens or 0
         out_tok = response.output_tokens or 0
-        cost = (in_tok * pricing["input"] + out_tok * pricing["output"]) / 1_000_000
+        # input_tokens includes the cached prefix, billed at the cached rate
+        cost = token_cost(pricing, in_tok, out_tok, cached_tok)
 
         # Metrics
         words = len(content.split())
-        citations = content.count('[')
+        citations = len(_CITATION_RE.findall(content))
         lines = content.count('\n') + 1
 
-        return {
-            "model": model_name,
-            "latency_s": round(elapsed, 2),
-            "input_tokens": in_tok,
-            "output_tokens": out_tok,
-            "cost_usd": round(cost, 6),
-            "word_count": words,
-            "citation_count": citations,
-            "line_count": lines,
-            "content": content,
-            "error": None,
-        }
+        decode_s = elapsed - ttft
+        return WriteResult(
+            model=model_name,
+            latency_s=round(elapsed, 2),
+            ttft_s=round(ttft, 2),
+            tokens_per_s=round(out_tok / decode_s, 1) if decode_s > 0 else 0,
+            input_tokens=in_tok,
+            cached_input_tokens=cached_tok,
+            output_tokens=out_tok,
+            cost_usd=round(cost, 6),
+            word_count=words,
+            citation_count=citations,
+            line_count=lines,
+            content=content,
+            cache_hit=cache_hit,
+        )
     except Exception as e:
-        elapsed = time.monotonic() - t0
-        return {
-            "model": model_name,
-            "latency_s": round(elapsed, 2),
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cost_usd": 0,
-            "word_count": 0,
-            "citation_count": 0,
-            "line_count": 0,
-            "content": "",
-            "error": str(e),
-        }
+        elapsed = (time.perf_counter_ns() - t0) / 1e9
+        return WriteResult(
+            model=model_name,
+            latency_s=round(elapsed, 2),
+            timed_out=isinstance(e, TimeoutError),
+            error=f"timed out after {WRITE_TIMEOUT}s" if isinstance(e, TimeoutError) else str(e),
+        )
 
 
 async def main():
-    results = []
-
-    for model_info in MODELS:
-        name = model_info["name"]
-        provider = model_info["provider"]
+    # Independent network-bound runs: write with all models concurrently,
+    # then report in MODELS order
+    from research_cli.llm.http import close_http_clients
+    from _bench_ndjson import append_results
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(test_writer(m["name"], m["provider"])) for m in MODELS]
+    results = [task.result() for task in tasks]
+    # Both providers' clients shared this loop's connection pool
+    await close_http_clients()
+
+    # Metrics only; the full section text stays in the printed report
+    append_results("writer_models", (
+        {k: v for k, v in asdict(r).items() if k != "content"} for r in results
+    ))
+
+    for model_info, result in zip(MODELS, results):
         print(f"\n{'='*70}")
-        print(f"  Writing with: {name} ({provider})")
+        print(f"  Writing with: {model_info['name']} ({model_info['provider']})")
         print(f"{'='*70}")
 
-        result = await test_writer(name, provider)
-        results.append(result)
-
-        if result["error"]:
-            print(f"  ERROR: {result['error']}")
+        if result.error:
+            print(f"  ERROR: {result.error}")
         else:
-            print(f"  Latency:    {result['latency_s']}s")
-            print(f"  Tokens:     {result['input_tokens']} in + {result['output_tokens']} out")
-            print(f"  Cost:       ${result['cost_usd']:.5f}")
-            print(f"  Words:      {result['word_count']} (target: {SECTION_SPEC['target_length']})")
-            print(f"  Citations:  {result['citation_count']}")
+            print(f"  Latency:    {result.latency_s}s (first token {result.ttft_s}s, {result.tokens_per_s} tok/s)")
+            print(f"  Tokens:     {result.input_tokens} in ({result.cached_input_tokens} cached) + {result.output_tokens} out")
+            print(f"  Cost:       ${result.cost_usd:.5f}{' (cached, not billed)' if result.cache_hit else ''}")
+            print(f"  Words:      {result.word_count} (target: {SECTION_SPEC['target_length']})")
+            print(f"  Citations:  {result.citation_count}")
 
     # Side by side comparison
     print(f"\n{'='*70}")
@@ -174,24 +225,27 @@ async def main():
     r1, r2 = results[0], results[1]
     print(f"  {'Metric':<20} {'gemini-3-pro':>16} {'claude-sonnet':>16}")
     print(f"  {'─'*52}")
-    print(f"  {'Latency':<20} {r1['latency_s']:>14.1f}s {r2['latency_s']:>14.1f}s")
-    print(f"  {'Input tokens':<20} {r1['input_tokens']:>16} {r2['input_tokens']:>16}")
-    print(f"  {'Output tokens':<20} {r1['output_tokens']:>16} {r2['output_tokens']:>16}")
-    print(f"  {'Cost':<20} ${r1['cost_usd']:>14.5f} ${r2['cost_usd']:>14.5f}")
-    print(f"  {'Words':<20} {r1['word_count']:>16} {r2['word_count']:>16}")
-    print(f"  {'Citations':<20} {r1['citation_count']:>16} {r2['citation_count']:>16}")
-
-    if r2['latency_s'] > 0:
-        speedup = r1['latency_s'] / r2['latency_s']
+    print(f"  {'Latency':<20} {r1.latency_s:>14.1f}s {r2.latency_s:>14.1f}s")
+    print(f"  {'First token':<20} {r1.ttft_s:>14.1f}s {r2.ttft_s:>14.1f}s")
+    print(f"  {'Decode speed':<20} {r1.tokens_per_s:>12.0f}t/s {r2.tokens_per_s:>12.0f}t/s")
+    print(f"  {'Input tokens':<20} {r1.input_tokens:>16} {r2.input_tokens:>16}")
+    print(f"  {'Cached input':<20} {r1.cached_input_tokens:>16} {r2.cached_input_tokens:>16}")
+    print(f"  {'Output tokens':<20} {r1.output_tokens:>16} {r2.output_tokens:>16}")
+    print(f"  {'Cost':<20} ${r1.cost_usd:>14.5f} ${r2.cost_usd:>14.5f}")
+    print(f"  {'Words':<20} {r1.word_count:>16} {r2.word_count:>16}")
+    print(f"  {'Citations':<20} {r1.citation_count:>16} {r2.citation_count:>16}")
+
+    if r2.latency_s > 0:
+        speedup = r1.latency_s / r2.latency_s
         print(f"  {'Speed ratio':<20} {'':>16} {speedup:>15.1f}x {'(3-pro slower)' if speedup > 1 else '(sonnet slower)'}")
 
     # Full content output
     for r in results:
         print(f"\n{'='*70}")
-        print(f"  FULL OUTPUT: {r['model']}")
-        print(f"  ({r['word_count']} words, {r['citation_count']} citations)")
+        print(f"  FULL OUTPUT: {r.model}")
+        print(f"  ({r.word_count} words, {r.citation_count} citations)")
         print(f"{'='*70}")
-        print(r['content'])
+        print(r.content)
 
 
 if __name__ == "__main__":
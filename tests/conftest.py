@@ -0,0 +1,73 @@
+"""Shared pytest fixtures.
+
+The API TestClient is session-scoped so FastAPI lifespan startup and
+shutdown run once per pytest invocation, not once per module using it.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+# Imported here, before any test module is collected, so the real fastapi
+# is in sys.modules before test_team_pipeline stubs out missing packages
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ADMIN_KEY = "test-admin-key-12345"
+
+
+def pytest_configure(config):
+    # api_server reads the admin key at import time, so set it before any
+    # test module can import api_server, whatever the collection order
+    os.environ["RESEARCH_ADMIN_KEY"] = ADMIN_KEY
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _temp_db(tmp_path_factory):
+    """Point the SQLite database at a temp file instead of the repo's data/."""
+    from research_cli import db
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(db, "DB_PATH", tmp_path_factory.mktemp("data") / "research.db")
+        yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient for api_server with the admin key set."""
+    from api_server import app
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def admin_headers():
+    return {
+        "Content-Type": "application/json",
+        "X-API-Key": ADMIN_KEY,
+    }
+
+
+@pytest.fixture(scope="session")
+def bad_headers():
+    return {
+        "Content-Type": "application/json",
+        "X-API-Key": "wrong-key",
+    }
+
+
+@pytest.fixture(scope="session")
+def admin_edit_html():
+    """Source of web/admin-edit.html, read once per session."""
+    path = ROOT / "web" / "admin-edit.html"
+    assert path.exists(), "web/admin-edit.html not found"
+    return path.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def admin_html():
+    """Source of web/admin.html, read once per session."""
+    path = ROOT / "web" / "admin.html"
+    assert path.exists()
+    return path.read_text(encoding="utf-8")
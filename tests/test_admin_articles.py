@@ -10,25 +10,46 @@ Usage:
 No LLM calls, no external network. Uses FastAPI TestClient + temp fixtures.
 """
 
-import json
-import os
+import copy
 import re
 import shutil
 import textwrap
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
-# Set a known admin key before importing api_server
-os.environ["RESEARCH_ADMIN_KEY"] = "test-admin-key-12345"
+from research_cli.utils.fast_json import dumps as json_dumps, loads as json_loads
 
-from fastapi.testclient import TestClient  # noqa: E402
+# setup_test_article writes fixture files under the repo's web/articles
+# and results; under pytest-xdist every module that touches them must
+# share one worker
+pytestmark = pytest.mark.xdist_group("repo_articles")
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
 ROOT = Path(__file__).resolve().parent.parent
 
+@lru_cache(maxsize=32)
+def _read_json_cached(path: str, mtime_ns: int, size: int):
+    return json_loads(Path(path).read_bytes())
+
+
+def read_json(path: Path):
+    """Parsed JSON file, re-read only when its mtime or size changes.
+
+    Callers must not mutate the result: it is shared between reads.
+    """
+    st = path.stat()
+    return _read_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _latest_manuscript(results_dir: Path):
+    """Last manuscript_v*.md by name, or None if there is none."""
+    return max(results_dir.glob("manuscript_v*.md"), key=lambda p: p.name, default=None)
+
+
 # Unique test project ID unlikely to collide with real data
 TEST_PROJECT_ID = "__test_admin_article_9999__"
 TEST_TITLE = "Test Article Title 테스트"
@@ -50,40 +71,54 @@ TEST_CONTENT = textwrap.dedent("""\
     In conclusion, the answer is 42.
 """)
 
+# Minimal static article page, with TEST_CONTENT escaped for a JS template literal
+_ESCAPED_TEST_CONTENT = TEST_CONTENT.translate(
+    str.maketrans({"\\": "\\\\", "`": "\\`"})
+).replace("${", "\\${")
+_STATIC_HTML = (
+    f'<!DOCTYPE html><html><head><title>{TEST_TITLE}</title></head>'
+    f'<body><script>const rawMarkdown = `{_ESCAPED_TEST_CONTENT}`;</script></body></html>'
+)
 
-@pytest.fixture(scope="module")
-def client():
-    """Create a TestClient with the admin key set."""
-    from api_server import app
-    with TestClient(app) as c:
-        yield c
+# Fixture file payloads, encoded once
+_MD_BYTES = TEST_CONTENT.encode("utf-8")
+_HTML_BYTES = _STATIC_HTML.encode("utf-8")
+_WF_BYTES = json_dumps({
+    "title": TEST_TITLE,
+    "topic": TEST_TITLE,
+    "author": "Test Author",
+    "passed": True,
+    "final_score": 8.0,
+    "rounds": [],
+})
 
 
-@pytest.fixture(scope="module")
-def admin_headers():
-    return {
-        "Content-Type": "application/json",
-        "X-API-Key": "test-admin-key-12345",
-    }
+# client, admin_headers and bad_headers are session fixtures in conftest.py
 
 
 @pytest.fixture(scope="module")
-def bad_headers():
-    return {
-        "Content-Type": "application/json",
-        "X-API-Key": "wrong-key",
-    }
+def index_path(tmp_path_factory):
+    """Copy of web/data/index.json that the API reads and writes instead.
+
+    Starts empty on a checkout without a generated index.
+    """
+    path = tmp_path_factory.mktemp("web-data") / "index.json"
+    source = ROOT / "web" / "data" / "index.json"
+    if source.exists():
+        shutil.copyfile(source, path)
+    else:
+        path.write_bytes(json_dumps({"projects": []}))
+    import api_server
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(api_server, "INDEX_PATH", path)
+        yield path
 
 
 @pytest.fixture(scope="module", autouse=True)
-def setup_test_article(client, admin_headers):
+def setup_test_article(client, admin_headers, index_path):
     """Create a test article in all 5 data locations, clean up after."""
-    # 1. index.json — add entry
-    index_path = ROOT / "web" / "data" / "index.json"
-    with open(index_path) as f:
-        original_index = json.load(f)
-
-    index_data = json.loads(json.dumps(original_index))  # deep copy
+    # 1. index.json (temp copy) — add entry
+    index_data = copy.deepcopy(read_json(index_path))
     index_data["projects"].insert(0, {
         "id": TEST_PROJECT_ID,
         "title": TEST_TITLE,
@@ -96,46 +131,29 @@ def setup_test_article(client, admin_headers):
         "timestamp": "2026-01-01T00:00:00",
         "author": "Test Author",
     })
-    with open(index_path, "w") as f:
-        json.dump(index_data, f, indent=2, ensure_ascii=False)
+    index_path.write_bytes(json_dumps(index_data, indent=True))
 
     # 2. web/articles/{id}.md
     md_path = ROOT / "web" / "articles" / f"{TEST_PROJECT_ID}.md"
-    md_path.write_text(TEST_CONTENT, encoding="utf-8")
+    md_path.write_bytes(_MD_BYTES)
 
     # 3. web/articles/{id}.html — create minimal static article
     html_path = ROOT / "web" / "articles" / f"{TEST_PROJECT_ID}.html"
-    escaped = TEST_CONTENT.replace("\\", "\\\\").replace("`", "\\`").replace("${", "\\${")
-    html_path.write_text(
-        f'<!DOCTYPE html><html><head><title>{TEST_TITLE}</title></head>'
-        f'<body><script>const rawMarkdown = `{escaped}`;</script></body></html>',
-        encoding="utf-8",
-    )
+    html_path.write_bytes(_HTML_BYTES)
 
     # 4. results/{id}/ — manuscript + workflow_complete.json
     results_dir = ROOT / "results" / TEST_PROJECT_ID
     results_dir.mkdir(parents=True, exist_ok=True)
 
     manuscript_path = results_dir / "manuscript_v2.md"
-    manuscript_path.write_text(TEST_CONTENT, encoding="utf-8")
+    manuscript_path.write_bytes(_MD_BYTES)
 
     workflow_path = results_dir / "workflow_complete.json"
-    workflow_path.write_text(json.dumps({
-        "title": TEST_TITLE,
-        "topic": TEST_TITLE,
-        "author": "Test Author",
-        "passed": True,
-        "final_score": 8.0,
-        "rounds": [],
-    }, ensure_ascii=False), encoding="utf-8")
+    workflow_path.write_bytes(_WF_BYTES)
 
     yield  # tests run here
 
     # ── Cleanup ──
-    # Restore original index.json
-    with open(index_path, "w") as f:
-        json.dump(original_index, f, indent=2, ensure_ascii=False)
-
     # Remove test article files
     md_path.unlink(missing_ok=True)
     html_path.unlink(missing_ok=True)
@@ -152,20 +170,13 @@ class TestAdminAuth:
         resp = client.get("/api/admin/articles")
         assert resp.status_code == 403
 
-    def test_list_articles_wrong_key(self, client, bad_headers):
-        resp = client.get("/api/admin/articles", headers=bad_headers)
-        assert resp.status_code == 403
-
-    def test_get_article_wrong_key(self, client, bad_headers):
-        resp = client.get(f"/api/admin/articles/{TEST_PROJECT_ID}", headers=bad_headers)
-        assert resp.status_code == 403
-
-    def test_put_article_wrong_key(self, client, bad_headers):
-        resp = client.put(
-            f"/api/admin/articles/{TEST_PROJECT_ID}",
-            headers=bad_headers,
-            json={"title": "Hacked"},
-        )
+    @pytest.mark.parametrize("method,url,body", [
+        ("get", "/api/admin/articles", None),
+        ("get", f"/api/admin/articles/{TEST_PROJECT_ID}", None),
+        ("put", f"/api/admin/articles/{TEST_PROJECT_ID}", {"title": "Hacked"}),
+    ], ids=["list", "get", "put"])
+    def test_wrong_key(self, client, bad_headers, method, url, body):
+        resp = client.request(method.upper(), url, headers=bad_headers, json=body)
         assert resp.status_code == 403
 
 
@@ -270,30 +281,27 @@ class TestUpdateArticleContentAndTitle:
 
     def test_manuscript_updated(self):
         """results/{id}/manuscript_v*.md must have new content."""
-        results_dir = ROOT / "results" / TEST_PROJECT_ID
-        versions = sorted(results_dir.glob("manuscript_v*.md"))
-        assert len(versions) > 0
-        latest = versions[-1].read_text(encoding="utf-8")
-        assert latest == self.NEW_CONTENT
+        latest = _latest_manuscript(ROOT / "results" / TEST_PROJECT_ID)
+        assert latest is not None
+        assert latest.read_text(encoding="utf-8") == self.NEW_CONTENT
 
     def test_workflow_json_title_updated(self):
         """results/{id}/workflow_complete.json must have new title/topic."""
         wf_path = ROOT / "results" / TEST_PROJECT_ID / "workflow_complete.json"
         assert wf_path.exists()
-        data = json.load(open(wf_path))
+        data = read_json(wf_path)
         assert data["title"] == self.NEW_TITLE
         assert data["topic"] == self.NEW_TITLE
 
-    def test_index_json_topic_updated(self):
-        """web/data/index.json entry must have new topic."""
-        with open(ROOT / "web" / "data" / "index.json") as f:
-            data = json.load(f)
+    def test_index_json_topic_updated(self, index_path):
+        """index.json entry must have new topic."""
+        data = read_json(index_path)
         entry = next(p for p in data["projects"] if p["id"] == TEST_PROJECT_ID)
         assert entry["topic"] == self.NEW_TITLE
 
-    def test_index_json_preserves_unicode(self):
+    def test_index_json_preserves_unicode(self, index_path):
         """index.json must contain raw Unicode, not \\uXXXX escapes."""
-        raw = (ROOT / "web" / "data" / "index.json").read_text(encoding="utf-8")
+        raw = index_path.read_text(encoding="utf-8")
         # Our test title has Korean — it should appear as-is, not escaped
         assert "수정됨" in raw
 
@@ -335,7 +343,7 @@ class TestUpdateArticleTitleOnly:
 
     def test_workflow_json_updated(self):
         wf_path = ROOT / "results" / TEST_PROJECT_ID / "workflow_complete.json"
-        data = json.load(open(wf_path))
+        data = read_json(wf_path)
         assert data["title"] == self.TITLE_ONLY
         assert data["topic"] == self.TITLE_ONLY
 
@@ -360,10 +368,8 @@ class TestUpdateArticleContentOnly:
         assert md_path.read_text(encoding="utf-8") == self.CONTENT_ONLY
 
     def test_manuscript_has_new_content(self):
-        results_dir = ROOT / "results" / TEST_PROJECT_ID
-        versions = sorted(results_dir.glob("manuscript_v*.md"))
-        latest = versions[-1].read_text(encoding="utf-8")
-        assert latest == self.CONTENT_ONLY
+        latest = _latest_manuscript(ROOT / "results" / TEST_PROJECT_ID)
+        assert latest.read_text(encoding="utf-8") == self.CONTENT_ONLY
 
 
 # ── 7. Empty Content Save ─────────────────────────────────────────────────────
@@ -432,46 +438,33 @@ class TestAdminEditHTML:
     """admin-edit.html must exist and have correct structure."""
 
     @pytest.fixture(scope="class")
-    def html(self):
-        path = ROOT / "web" / "admin-edit.html"
-        assert path.exists(), "web/admin-edit.html not found"
-        return path.read_text(encoding="utf-8")
+    def html(self, admin_edit_html):
+        return admin_edit_html
 
     def test_no_api_key_in_url_params(self, html):
         """admin-edit.html must NOT read key from URL (sessionStorage only)."""
         assert "params.get('key')" not in html
         assert "params.get(\"key\")" not in html
 
-    def test_reads_key_from_session_storage(self, html):
-        """Must use sessionStorage for admin key."""
-        assert "sessionStorage.getItem('admin_key')" in html
-
-    def test_clears_session_on_403(self, html):
-        """Must clear sessionStorage on 403 response."""
-        assert "sessionStorage.removeItem('admin_key')" in html
+    @pytest.mark.parametrize("literal", [
+        "sessionStorage.getItem('admin_key')",     # key read from sessionStorage
+        "sessionStorage.removeItem('admin_key')",  # session cleared on 403
+        "edit-pane-editor",
+        "edit-pane-preview",
+        "saveArticle()",
+        "e.key === 's'",                           # Ctrl+S shortcut
+        "beforeunload",                            # unsaved-changes guard
+        "debounceTimer",                           # debounced preview
+        "renderPreview",
+    ])
+    def test_contains(self, html, literal):
+        assert literal in html
 
     def test_no_article_css_import(self, html):
         """Must NOT import article.css stylesheet (breaks layout)."""
         assert 'href="styles/article.css"' not in html
         assert "href='styles/article.css'" not in html
 
-    def test_has_editor_and_preview_panes(self, html):
-        assert 'edit-pane-editor' in html
-        assert 'edit-pane-preview' in html
-
-    def test_has_save_button(self, html):
-        assert 'saveArticle()' in html
-
-    def test_has_ctrl_s_shortcut(self, html):
-        assert "e.key === 's'" in html
-
-    def test_has_beforeunload_guard(self, html):
-        assert 'beforeunload' in html
-
-    def test_has_debounced_preview(self, html):
-        assert 'debounceTimer' in html
-        assert 'renderPreview' in html
-
     def test_sends_content_not_null(self, html):
         """Save must send content directly, not content || null."""
         # The old bug: content || null converted "" to null
@@ -482,14 +475,15 @@ class TestAdminEditHTML:
 
 # ── 10. admin.html sessionStorage Integration ────────────────────────────────
 
+_EDIT_ARTICLE_HREF = re.compile(r'function editArticle.*?\n.*?href\s*=\s*[`"\'](.*?)[`"\']', re.DOTALL)
+
+
 class TestAdminHTMLSessionStorage:
     """admin.html must use sessionStorage for admin key."""
 
     @pytest.fixture(scope="class")
-    def html(self):
-        path = ROOT / "web" / "admin.html"
-        assert path.exists()
-        return path.read_text(encoding="utf-8")
+    def html(self, admin_html):
+        return admin_html
 
     def test_stores_key_in_session_storage(self, html):
         assert "sessionStorage.setItem('admin_key'" in html
@@ -503,7 +497,7 @@ class TestAdminHTMLSessionStorage:
     def test_edit_url_has_no_key_param(self, html):
         """editArticle() redirect URL must NOT contain &key=."""
         # Find the editArticle function
-        match = re.search(r'function editArticle.*?\n.*?href\s*=\s*[`"\'](.*?)[`"\']', html, re.DOTALL)
+        match = _EDIT_ARTICLE_HREF.search(html)
         if match:
             url = match.group(1)
             assert 'key=' not in url, f"editArticle URL still contains key param: {url}"
@@ -515,18 +509,16 @@ class TestAdminHTMLSessionStorage:
 
 # ── 11. DOM ID Integrity for admin-edit.html ──────────────────────────────────
 
-class TestAdminEditDOMIntegrity:
-    """All getElementById() refs in admin-edit.html must have matching IDs."""
+_ID_DEF = re.compile(r'id=["\']([^"\']+)["\']')
+_ID_REF = re.compile(r'getElementById\(["\']([^"\']+)["\']\)')
 
-    def test_no_orphan_dom_references(self):
-        path = ROOT / "web" / "admin-edit.html"
-        content = path.read_text(encoding="utf-8")
 
-        id_def = re.compile(r'id=["\']([^"\']+)["\']')
-        id_ref = re.compile(r'getElementById\(["\']([^"\']+)["\']\)')
+class TestAdminEditDOMIntegrity:
+    """All getElementById() refs in admin-edit.html must have matching IDs."""
 
-        defined = set(id_def.findall(content))
-        referenced = set(id_ref.findall(content))
+    def test_no_orphan_dom_references(self, admin_edit_html):
+        defined = set(_ID_DEF.findall(admin_edit_html))
+        referenced = set(_ID_REF.findall(admin_edit_html))
 
         orphans = referenced - defined
         assert orphans == set(), (
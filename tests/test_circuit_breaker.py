@@ -0,0 +1,79 @@
+"""Tests for the per-model LLM circuit breaker."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from research_cli.llm.base import retry_llm_call
+from research_cli.llm.circuit import CircuitBreaker, breaker
+from research_cli.model_config import ModelSpec, RoleConfig, create_llm_for_role
+
+
+@pytest.fixture(autouse=True)
+def _reset_breaker():
+    breaker.reset()
+    yield
+    breaker.reset()
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_threshold_failures(self):
+        cb = CircuitBreaker(threshold=2, cooldown=60)
+        cb.record_failure("openai", "gpt-4.1")
+        assert cb.allow("openai", "gpt-4.1")
+        cb.record_failure("openai", "gpt-4.1")
+        assert not cb.allow("openai", "gpt-4.1")
+        assert cb.allow("anthropic", "claude-opus-4-6")
+        assert cb.metrics()["openai/gpt-4.1"] == {
+            "state": "open", "successes": 0, "failures": 2, "consecutive_failures": 2,
+        }
+
+    def test_half_open_probe_closes_or_reopens(self):
+        cb = CircuitBreaker(threshold=1, cooldown=0)
+        cb.record_failure("openai", "gpt-4.1")
+        assert cb.metrics()["openai/gpt-4.1"]["state"] == "half-open"
+        assert cb.allow("openai", "gpt-4.1")
+
+        cb.cooldown = 60
+        cb.record_failure("openai", "gpt-4.1")
+        assert not cb.allow("openai", "gpt-4.1")
+
+        cb.cooldown = 0
+        cb.record_success("openai", "gpt-4.1")
+        assert cb.metrics()["openai/gpt-4.1"]["state"] == "closed"
+
+    def test_retry_llm_call_records_final_outcome(self):
+        async def fail():
+            raise RuntimeError("authentication error")
+
+        async def ok():
+            return "done"
+
+        loop = asyncio.get_event_loop()
+        with pytest.raises(RuntimeError):
+            loop.run_until_complete(retry_llm_call(fail, circuit=("openai", "gpt-4.1")))
+        loop.run_until_complete(retry_llm_call(ok, circuit=("openai", "gpt-4.1")))
+
+        metrics = breaker.metrics()["openai/gpt-4.1"]
+        assert (metrics["failures"], metrics["successes"]) == (1, 1)
+        assert metrics["consecutive_failures"] == 0
+
+
+def test_create_llm_for_role_skips_open_primary():
+    rc = RoleConfig(
+        role="writer",
+        primary=ModelSpec(model="gpt-4.1", provider="openai"),
+        fallback=(ModelSpec(model="claude-opus-4-6", provider="anthropic"),),
+        temperature=0.7,
+        max_tokens=4096,
+    )
+    for _ in range(breaker.threshold):
+        breaker.record_failure("openai", "gpt-4.1")
+
+    with patch("research_cli.model_config.get_role_config", return_value=rc), \
+            patch("research_cli.model_config._get_api_key", return_value="test"):
+        llm = create_llm_for_role("writer")
+
+    assert llm.model == "claude-opus-4-6"
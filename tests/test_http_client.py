@@ -0,0 +1,52 @@
+"""Tests for the shared provider HTTP connection pool."""
+
+import asyncio
+
+from research_cli.llm.http import close_http_clients, shared_http_client
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+class TestSharedHttpClient:
+
+    def test_no_client_outside_running_loop(self):
+        assert shared_http_client() is None
+
+    def test_one_client_per_loop(self):
+        async def scenario():
+            first, second = shared_http_client(), shared_http_client()
+            await close_http_clients()
+            return first, second
+
+        first, second = _run(scenario())
+        assert first is second
+        assert first.is_closed
+
+    def test_sdk_close_keeps_pool_open(self):
+        from research_cli.llm.openai import OpenAILLM
+
+        async def scenario():
+            llm = OpenAILLM(api_key="test", model="gpt-4.1")
+            await llm.client.close()
+            client = shared_http_client()
+            still_open = not client.is_closed
+            await close_http_clients()
+            return llm.client._client is client, still_open
+
+        shared, still_open = _run(scenario())
+        assert shared
+        assert still_open
+
+    def test_gemini_uses_shared_pool(self):
+        from research_cli.llm.gemini import GeminiLLM
+
+        async def scenario():
+            llm = GeminiLLM(api_key="test", model="gemini-2.5-flash")
+            client = shared_http_client()
+            shared = llm.client._api_client._async_httpx_client is client
+            await close_http_clients()
+            return shared
+
+        assert _run(scenario())
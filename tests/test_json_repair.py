@@ -1,7 +1,8 @@
 """Tests for the JSON repair utility."""
 
 import pytest
-from research_cli.utils.json_repair import repair_json
+from research_cli.utils import fast_json
+from research_cli.utils.json_repair import repair_json, strip_code_fence
 
 
 class TestRepairJsonDirect:
@@ -32,6 +33,25 @@ class TestRepairJsonCodeBlock:
         assert result["items"] == [1, 2, 3]
 
 
+class TestStripCodeFence:
+    """Test markdown fence stripping shared by the direct JSON parsers."""
+
+    def test_json_fence(self):
+        assert strip_code_fence('```json\n{"key": "value"}\n```') == '{"key": "value"}'
+
+    def test_plain_fence(self):
+        assert strip_code_fence('  ```\n{"key": 1}\n```\n') == '{"key": 1}'
+
+    def test_unterminated_fence(self):
+        assert strip_code_fence('```json{"key": 1}') == '{"key": 1}'
+
+    def test_no_fence(self):
+        assert strip_code_fence('  {"key": 1}  ') == '{"key": 1}'
+
+    def test_backticks_inside_value_preserved(self):
+        assert strip_code_fence('```json\n{"a": "```"}\n```') == '{"a": "```"}'
+
+
 class TestRepairJsonBraceExtraction:
     """Test first-{ to last-} extraction (strategy 3)."""
 
@@ -150,3 +170,41 @@ class TestRepairJsonEdgeCases:
         result = repair_json(text)
         assert result["scores"]["accuracy"] == 8
         assert len(result["strengths"]) == 2
+
+
+class TestFastJsonDumps:
+    """fast_json.dumps must produce the same document with either backend."""
+
+    def test_round_trip(self):
+        data = {"round": 1, "scores": {"accuracy": 8.5}, "tags": ["a", "b"]}
+        assert fast_json.loads(fast_json.dumps(data)) == data
+
+    def test_indent_matches_stdlib(self):
+        import json
+        data = {"a": [1, 2], "b": {"c": None}}
+        assert fast_json.dumps(data, indent=True).decode() == json.dumps(data, indent=2)
+
+    def test_non_ascii_not_escaped(self):
+        assert "합의".encode() in fast_json.dumps({"t": "합의"})
+
+    def test_non_str_keys(self):
+        assert fast_json.loads(fast_json.dumps({1: "x"})) == {"1": "x"}
+
+    def test_dataclass_serialized_by_either_backend(self, monkeypatch):
+        from research_cli.performance import RoundMetrics
+        metrics = RoundMetrics(round_number=1, review_start="s", review_end="e", review_duration=1.5)
+        expected = metrics.to_dict()
+        assert fast_json.loads(fast_json.dumps(metrics)) == expected
+        monkeypatch.setattr(fast_json, "orjson", None)
+        assert fast_json.loads(fast_json.dumps(metrics)) == expected
+
+
+class TestRepairJsonFencedFastPath:
+
+    def test_fence_parsed_without_fallback_strategies(self, monkeypatch):
+        import research_cli.utils.json_repair as jr
+        monkeypatch.setattr(jr.json, "loads", lambda *a, **k: pytest.fail("fell through"))
+        assert repair_json('```json\n{"a": [1, 2]}\n```') == {"a": [1, 2]}
+
+    def test_fence_followed_by_prose_still_parsed(self):
+        assert repair_json('```json\n{"a": 1}\n```\nHope this helps!') == {"a": 1}
@@ -0,0 +1,85 @@
+"""Tests for adaptive per-model LLM timeouts."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from research_cli.llm.latency import LatencyTracker, LLMTimeoutError, latency
+from research_cli.llm.openai import OpenAILLM
+
+
+@pytest.fixture(autouse=True)
+def _reset_latency():
+    latency.reset()
+    yield
+    latency.reset()
+
+
+class TestLatencyTracker:
+
+    def test_no_timeout_until_min_samples(self):
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record("openai", "gpt-4.1", 10.0)
+        tracker.record("openai", "gpt-4.1", 10.0)
+        assert tracker.timeout_for("openai", "gpt-4.1") is None
+        tracker.record("openai", "gpt-4.1", 10.0)
+        assert tracker.timeout_for("openai", "gpt-4.1") == 20.0
+
+    def test_timeout_is_clamped(self):
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record("openai", "fast", 0.1)
+        tracker.record("openai", "slow", 1000.0)
+        assert tracker.timeout_for("openai", "fast") == 5.0
+        assert tracker.timeout_for("openai", "slow") == 600.0
+
+    def test_buckets_by_max_tokens(self):
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record("google", "gemini-2.5-flash", 1.2, max_tokens=256)
+        tracker.record("google", "gemini-2.5-flash", 90.0, max_tokens=8192)
+        assert tracker.timeout_for("google", "gemini-2.5-flash", 200) == 5.0
+        assert tracker.timeout_for("google", "gemini-2.5-flash", 8192) == 180.0
+        assert tracker.timeout_for("google", "gemini-2.5-flash", 16384) is None
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window=2, min_samples=1)
+        for seconds in (100.0, 1.0, 2.0):
+            tracker.record("openai", "gpt-4.1", seconds)
+        assert tracker.p99("openai", "gpt-4.1") == 2.0
+        assert tracker.p50("openai", "gpt-4.1") == 2.0
+
+
+class TestOpenAITimeout:
+
+    def test_slow_call_raises_llm_timeout_error(self):
+        llm = OpenAILLM(api_key="test", model="gpt-4.1")
+        latency.min_samples = 1
+        try:
+            latency.record("openai", "gpt-4.1", 0.001)
+
+            async def slow():
+                await asyncio.sleep(10)
+
+            loop = asyncio.get_event_loop()
+            with pytest.raises(LLMTimeoutError), pytest.MonkeyPatch.context() as mp:
+                mp.setattr("research_cli.llm.latency.LATENCY_MIN_TIMEOUT", 0.01)
+                loop.run_until_complete(llm._timed(slow))
+            # The timed-out attempt is recorded, so the next budget widens
+            assert latency.metrics()["openai/gpt-4.1"]["samples"] == 2
+            assert latency.p99("openai", "gpt-4.1") >= 0.01
+        finally:
+            latency.min_samples = 20
+
+    def test_successful_call_is_recorded(self):
+        llm = OpenAILLM(api_key="test", model="gpt-4.1")
+        llm.client = MagicMock()
+        llm.client.chat.completions.create = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content="ok"), finish_reason="stop")],
+            model="gpt-4.1",
+            usage=None,
+        ))
+
+        response = asyncio.get_event_loop().run_until_complete(llm.generate("hi"))
+
+        assert response.content == "ok"
+        assert latency.metrics()["openai/gpt-4.1@4096"]["samples"] == 1
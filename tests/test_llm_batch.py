@@ -0,0 +1,82 @@
+"""Tests for OpenAI Batch API generation."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from research_cli.llm.openai import OpenAILLM
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _output_line(custom_id, content, status_code=200):
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {
+            "status_code": status_code,
+            "body": {
+                "model": "gpt-4.1",
+                "choices": [{"message": {"content": content}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 3,
+                          "prompt_tokens_details": {"cached_tokens": 0}},
+            },
+        },
+        "error": None,
+    })
+
+
+def _llm_with_batch(output_lines, final_status="completed"):
+    llm = OpenAILLM(api_key="test", model="gpt-4.1")
+    pending = SimpleNamespace(id="batch-1", status="in_progress", output_file_id=None)
+    done = SimpleNamespace(id="batch-1", status=final_status, output_file_id="file-out")
+    files = SimpleNamespace(
+        create=AsyncMock(return_value=SimpleNamespace(id="file-in")),
+        content=AsyncMock(return_value=SimpleNamespace(
+            content="\n".join(output_lines).encode("utf-8"))),
+    )
+    batches = SimpleNamespace(
+        create=AsyncMock(return_value=pending),
+        retrieve=AsyncMock(return_value=done),
+    )
+    llm.client = SimpleNamespace(files=files, batches=batches)
+    return llm
+
+
+@patch("research_cli.llm.openai.BATCH_POLL_INITIAL", 0)
+class TestBatchGenerate:
+
+    def test_results_returned_in_input_order(self):
+        # Output files are not guaranteed to follow input order
+        llm = _llm_with_batch([_output_line("req-1", "second"), _output_line("req-0", "first")])
+        responses = _run(llm.batch_generate([("a", None), ("b", "system")]))
+
+        assert [r.content for r in responses] == ["first", "second"]
+        assert responses[0].input_tokens == 10
+        assert responses[0].provider == "openai"
+
+        uploaded = llm.client.files.create.await_args.kwargs["file"][1].getvalue()
+        requests = [json.loads(line) for line in uploaded.splitlines()]
+        assert [r["custom_id"] for r in requests] == ["req-0", "req-1"]
+        assert requests[1]["body"]["messages"][0] == {"role": "system", "content": "system"}
+
+    def test_failed_request_raises(self):
+        llm = _llm_with_batch([_output_line("req-0", "ok"), _output_line("req-1", "", 500)])
+        with pytest.raises(RuntimeError, match="1/2 requests failed"):
+            _run(llm.batch_generate([("a", None), ("b", None)]))
+
+    def test_expired_batch_raises(self):
+        llm = _llm_with_batch([], final_status="expired")
+        with pytest.raises(RuntimeError, match="expired"):
+            _run(llm.batch_generate([("a", None)]))
+
+
+def test_unsupported_provider_raises():
+    from research_cli.llm.claude import ClaudeLLM
+
+    with pytest.raises(NotImplementedError):
+        _run(ClaudeLLM(api_key="test").batch_generate([("a", None)]))
@@ -0,0 +1,84 @@
+"""Tests for the deterministic LLM response cache."""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from research_cli.llm.base import LLMResponse
+from research_cli.llm.cache import FileBackend, LLMCache, MemoryBackend
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+class TestCacheKey:
+
+    def test_nonzero_temperature_is_not_cached(self):
+        assert LLMCache.cache_key("gpt-4.1", MESSAGES, 0.7) is None
+
+    def test_key_is_stable_and_param_sensitive(self):
+        key = LLMCache.cache_key("gpt-4.1", MESSAGES, 0, max_tokens=100)
+        assert key == LLMCache.cache_key("gpt-4.1", MESSAGES, 0, max_tokens=100)
+        assert key != LLMCache.cache_key("gpt-4.1", MESSAGES, 0, max_tokens=200)
+        assert key != LLMCache.cache_key("gpt-4o", MESSAGES, 0, max_tokens=100)
+
+
+class TestBackends:
+
+    def test_memory_backend_evicts_least_recent(self):
+        backend = MemoryBackend(max_entries=2)
+        _run(backend.set("a", {"v": 1}))
+        _run(backend.set("b", {"v": 2}))
+        _run(backend.get("a"))
+        _run(backend.set("c", {"v": 3}))
+        assert _run(backend.get("b")) is None
+        assert _run(backend.get("a")) == {"v": 1}
+
+    def test_file_backend_round_trip_and_ttl(self, tmp_path):
+        backend = FileBackend(root=tmp_path, ttl=60)
+        _run(backend.set("abcdef", {"v": 1}))
+        assert _run(backend.get("abcdef")) == {"v": 1}
+
+        stale = time.time() - 120
+        os.utime(tmp_path / "ab" / "abcdef.json", (stale, stale))
+        assert _run(backend.get("abcdef")) is None
+
+        _run(backend.delete("abcdef"))
+        assert not (tmp_path / "ab" / "abcdef.json").exists()
+
+
+class TestLLMCache:
+
+    def test_hit_returns_stored_response(self):
+        cache = LLMCache()
+        response = LLMResponse(content="hi", model="m", provider="openai",
+                               input_tokens=5, output_tokens=1, cached_input_tokens=0)
+        assert _run(cache.get("k")) is None
+        _run(cache.set("k", response))
+        assert _run(cache.get("k")) == response
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_openai_generate_served_from_cache(self):
+        from research_cli.llm.openai import OpenAILLM
+
+        completion = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"), finish_reason="stop")],
+            model="gpt-4.1",
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=2, prompt_tokens_details=None),
+        )
+        llm = OpenAILLM(api_key="test", model="gpt-4.1", cache=LLMCache())
+        create = AsyncMock(return_value=completion)
+        llm.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        first = _run(llm.generate("hello", temperature=0))
+        second = _run(llm.generate("hello", temperature=0))
+        _run(llm.generate("hello", temperature=0.5))
+
+        assert first == second
+        assert create.await_count == 2
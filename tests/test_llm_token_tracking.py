@@ -95,6 +95,26 @@ class TestGeminiThinkingTokenMultiplier:
         )
 
 
+class TestGeminiResponseSchema:
+    """json_mode with a response_schema constrains Gemini's decoding."""
+
+    @pytest.fixture(scope="class")
+    def llm(self):
+        from research_cli.llm.gemini import GeminiLLM
+        return GeminiLLM(api_key="test", model="gemini-2.5-flash")
+
+    def test_schema_passed_in_json_mode(self, llm):
+        schema = {"type": "object", "properties": {"ok": {"type": "boolean"}}}
+        config = llm._build_config(0.1, 256, None, json_mode=True, response_schema=schema)
+        assert config.response_mime_type == "application/json"
+        assert config.response_schema == schema
+
+    def test_schema_ignored_without_json_mode(self, llm):
+        config = llm._build_config(0.1, 256, None, response_schema={"type": "object"})
+        assert config.response_mime_type is None
+        assert config.response_schema is None
+
+
 # ── OpenAI streaming usage tracking ─────────────────────────────────────────
 
 class TestOpenAIStreamingUsage:
@@ -184,3 +204,165 @@ class TestProviderConsistency:
         assert pattern.search(source), (
             f"{provider_file}: generate_streaming() should have -> LLMResponse return type"
         )
+
+
+# ── Claude prompt caching ────────────────────────────────────────────────────
+
+class TestClaudePromptCaching:
+    """cached_prefix must become a leading cache_control text block."""
+
+    def test_plain_prompt_without_prefix(self):
+        from research_cli.llm.claude import ClaudeLLM
+        messages = ClaudeLLM._build_messages("hello")
+        assert messages == [{"role": "user", "content": "hello"}]
+
+    def test_cached_prefix_precedes_prompt(self):
+        from research_cli.llm.claude import ClaudeLLM
+        messages = ClaudeLLM._build_messages("instructions", cached_prefix="MANUSCRIPT")
+        blocks = messages[0]["content"]
+        assert blocks[0] == {
+            "type": "text", "text": "MANUSCRIPT", "cache_control": {"type": "ephemeral"},
+        }
+        assert blocks[1] == {"type": "text", "text": "instructions"}
+
+    def test_system_blocks_built_once_per_prompt(self):
+        from research_cli.llm.claude import ClaudeLLM
+        first = ClaudeLLM._system_blocks("You are a reviewer.")
+        assert first == [{"type": "text", "text": "You are a reviewer."}]
+        assert ClaudeLLM._system_blocks("You are a reviewer.") is first
+
+
+class TestClaudeStreamingCallback:
+    """generate_streaming(on_text=...) must see every text delta in order."""
+
+    def test_on_text_receives_each_chunk(self):
+        import asyncio
+        from types import SimpleNamespace
+        from research_cli.llm.claude import ClaudeLLM
+
+        chunks = ['{"scores": ', '{"rigor": 7}', '}']
+
+        class FakeStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            @property
+            async def text_stream(self):
+                for chunk in chunks:
+                    yield chunk
+
+            async def get_final_message(self):
+                return SimpleNamespace(
+                    content=[SimpleNamespace(text="".join(chunks))],
+                    model="claude-test",
+                    usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+                    stop_reason="end_turn",
+                )
+
+        llm = ClaudeLLM(api_key="test")
+        llm.client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **kw: FakeStream()))
+
+        seen = []
+        response = asyncio.get_event_loop().run_until_complete(
+            llm.generate_streaming("hi", on_text=seen.append)
+        )
+        assert seen == chunks
+        assert response.content == "".join(chunks)
+
+
+class TestCachedInputTokens:
+    """Prompt-cache hits must be reported as a subset of input_tokens."""
+
+    def test_uncached_input_tokens(self):
+        from research_cli.llm.base import LLMResponse
+        response = LLMResponse(content="", model="m", provider="p",
+                               input_tokens=2000, output_tokens=10, cached_input_tokens=1536)
+        assert response.uncached_input_tokens == 464
+        assert LLMResponse(content="", model="m", provider="p", input_tokens=50).uncached_input_tokens == 50
+        assert LLMResponse(content="", model="m", provider="p").uncached_input_tokens is None
+
+    def test_claude_folds_cache_reads_into_input(self):
+        from types import SimpleNamespace
+        from research_cli.llm.claude import ClaudeLLM
+        usage = SimpleNamespace(input_tokens=100, cache_read_input_tokens=1500,
+                                cache_creation_input_tokens=0)
+        assert ClaudeLLM._usage_tokens(usage) == (1600, 1500)
+        assert ClaudeLLM._usage_tokens(SimpleNamespace(input_tokens=100)) == (100, 0)
+
+    def test_openai_cached_tokens(self):
+        from types import SimpleNamespace
+        from research_cli.llm.openai import _cached_tokens
+        usage = SimpleNamespace(prompt_tokens_details=SimpleNamespace(cached_tokens=1024))
+        assert _cached_tokens(usage) == 1024
+        assert _cached_tokens(SimpleNamespace(prompt_tokens_details=None)) is None
+
+    def test_openai_prefix_leads_user_message(self):
+        from research_cli.llm.openai import OpenAILLM
+        messages = OpenAILLM._build_messages("tail", "sys", cached_prefix="CONTEXT\n")
+        assert messages == [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": "CONTEXT\ntail"},
+        ]
+
+    def test_pricing_includes_cached_input_rate(self):
+        from research_cli.model_config import get_pricing
+        price = get_pricing("no-such-model")
+        assert set(price) == {"input", "input_cached", "output"}
+
+
+# ── OpenAI raw SSE streaming ─────────────────────────────────────────────────
+
+class TestOpenAIRawStream:
+    """The raw SSE path must return the same LLMResponse as the SDK path."""
+
+    SSE = (
+        ': keep-alive\n\n'
+        'data: {"id":"c1","object":"chat.completion.chunk","created":1,"model":"gpt-4.1",'
+        '"choices":[{"index":0,"delta":{"role":"assistant","content":"Hel"},"finish_reason":null}]}\n\n'
+        'data: {"id":"c1","object":"chat.completion.chunk","created":1,"model":"gpt-4.1",'
+        '"choices":[{"index":0,"delta":{"content":"lo ✓"},"finish_reason":"stop"}]}\n\n'
+        'data: {"id":"c1","object":"chat.completion.chunk","created":1,"model":"gpt-4.1","choices":[],'
+        '"usage":{"prompt_tokens":12,"completion_tokens":3,"total_tokens":15,'
+        '"prompt_tokens_details":{"cached_tokens":8}}}\n\n'
+        'data: [DONE]\n\n'
+    )
+
+    def _llm(self, raw_stream, body):
+        import httpx
+        from openai import AsyncOpenAI
+        from research_cli.llm.openai import OpenAILLM
+
+        def handler(request):
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+        llm = OpenAILLM(api_key="test", model="gpt-4.1", raw_stream=raw_stream)
+        llm.client = AsyncOpenAI(
+            api_key="test", base_url="http://test/v1",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        return llm
+
+    def _generate(self, llm):
+        import asyncio
+        return asyncio.get_event_loop().run_until_complete(llm.generate_streaming("hi"))
+
+    def test_matches_sdk_stream(self):
+        raw = self._generate(self._llm(True, self.SSE))
+        sdk = self._generate(self._llm(False, self.SSE))
+        assert raw == sdk
+        assert raw.content == "Hello ✓"
+        assert (raw.input_tokens, raw.output_tokens, raw.cached_input_tokens) == (12, 3, 8)
+        assert raw.stop_reason == "stop"
+
+    def test_error_frame_raises(self):
+        import asyncio
+        from research_cli.llm.openai import _read_sse
+
+        async def lines():
+            yield 'data: {"error":{"message":"overloaded"}}'
+
+        with pytest.raises(RuntimeError, match="overloaded"):
+            asyncio.get_event_loop().run_until_complete(_read_sse(lines(), "gpt-4.1"))
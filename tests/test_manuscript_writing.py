@@ -0,0 +1,48 @@
+"""Tests for dependency-aware parallel section writing."""
+
+import asyncio
+
+from research_cli.models.manuscript import ManuscriptPlan, SectionDraft, SectionSpec
+from research_cli.workflow.manuscript_writing import ManuscriptWritingPhase
+
+
+class FakeLeadAgent:
+    """Records which drafts each section received as context."""
+
+    def __init__(self):
+        self.context = {}
+        self.finished = []
+
+    async def write_section(self, section_spec, previous_sections, **kwargs):
+        self.context[section_spec.id] = [d.id for d in previous_sections]
+        await asyncio.sleep(0.01 * (4 - section_spec.order))
+        self.finished.append(section_spec.id)
+        return SectionDraft(id=section_spec.id, title=section_spec.title, content="", word_count=10)
+
+
+def _spec(sid, order, dependencies=()):
+    return SectionSpec(id=sid, title=sid.title(), order=order, purpose="", key_points=[],
+                       target_length=500, dependencies=list(dependencies))
+
+
+def test_parallel_writing_follows_dependencies():
+    phase = ManuscriptWritingPhase.__new__(ManuscriptWritingPhase)
+    phase.lead_agent = FakeLeadAgent()
+    phase.research_notes = None
+    phase.audience_level = "professional"
+    plan = ManuscriptPlan(title="t", abstract_outline="", sections=[
+        _spec("conclusion", 4, ["analysis", "intro"]),
+        _spec("intro", 1),
+        _spec("background", 2),
+        # A dependency on a later section is ignored to keep the graph acyclic
+        _spec("analysis", 3, ["background", "conclusion"]),
+    ])
+
+    drafts = asyncio.get_event_loop().run_until_complete(phase._write_sections_parallel(plan))
+
+    assert [d.id for d in drafts] == ["intro", "background", "analysis", "conclusion"]
+    assert phase.lead_agent.context == {
+        "intro": [], "background": [], "analysis": ["background"], "conclusion": ["analysis", "intro"],
+    }
+    # Independent sections ran concurrently: the shorter background finished first
+    assert phase.lead_agent.finished.index("background") < phase.lead_agent.finished.index("intro")
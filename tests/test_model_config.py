@@ -0,0 +1,97 @@
+"""Tests for model_config lookups and their caches."""
+
+import dataclasses
+import json
+import os
+
+import pytest
+
+from research_cli import model_config
+from research_cli.model_config import _get_api_key, get_pricing, get_role_config, reload_config
+
+
+class TestLookupCaching:
+
+    def test_role_config_is_cached_and_immutable(self):
+        rc = get_role_config("writer")
+        assert get_role_config("writer") is rc
+        assert isinstance(rc.fallback, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rc.max_tokens = 1
+
+    def test_reload_config_clears_caches(self):
+        rc = get_role_config("writer")
+        reload_config()
+        assert get_role_config("writer") is not rc
+        assert get_role_config("writer") == rc
+
+    def test_pricing_returns_independent_copies(self):
+        price = get_pricing("no-such-model")
+        price["input"] = 0
+        assert get_pricing("no-such-model")["input"] == 3.0
+
+    def test_api_key_reflects_environment_changes(self, monkeypatch):
+        env_key = model_config._provider_env("openai")[0]
+        monkeypatch.setenv(env_key, "first")
+        assert _get_api_key("openai") == "first"
+        monkeypatch.setenv(env_key, "second")
+        assert _get_api_key("openai") == "second"
+
+
+class TestComputeCost:
+
+    def test_cached_input_billed_at_cached_rate(self):
+        pricing = {"input": 3.0, "input_cached": 0.30, "output": 15.0}
+        cost = model_config.token_cost(pricing, 1_000_000, 1_000_000, cached_input_tokens=500_000)
+        assert cost == pytest.approx(0.5 * 3.0 + 0.5 * 0.30 + 15.0)
+
+    def test_missing_cached_rate_falls_back_to_input(self):
+        pricing = {"input": 2.0, "output": 8.0}
+        assert model_config.token_cost(pricing, 1_000_000, 0, cached_input_tokens=1_000_000) == pytest.approx(2.0)
+
+    def test_compute_cost_reads_usage_from_response(self):
+        from research_cli.llm.base import LLMResponse
+        usage = LLMResponse(content="", model="no-such-model", provider="test", input_tokens=1_000_000, output_tokens=0)
+        assert model_config.compute_cost(usage) == pytest.approx(3.0)
+
+
+class TestConfigHotReload:
+
+    @pytest.fixture
+    def config_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "models.json"
+        path.write_bytes(model_config._CONFIG_PATH.read_bytes())
+        monkeypatch.setattr(model_config, "_CONFIG_PATH", path)
+        reload_config()
+        yield path
+        monkeypatch.undo()
+        reload_config()
+
+    def test_edited_file_is_reloaded(self, config_file):
+        assert get_role_config("writer").max_tokens != 1234
+        config = json.loads(config_file.read_text())
+        config["roles"]["writer"]["max_tokens"] = 1234
+        config_file.write_text(json.dumps(config))
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert get_role_config("writer").max_tokens == 1234
+
+    def test_malformed_edit_keeps_last_good_config(self, config_file):
+        max_tokens = get_role_config("writer").max_tokens
+        config_file.write_text('{"roles": {"writer": ')
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert get_role_config("writer").max_tokens == max_tokens
+
+    def test_malformed_file_raises_without_previous_config(self, config_file):
+        config_file.write_text("{")
+        with pytest.raises(ValueError):
+            reload_config()
+
+    def test_unchanged_file_is_not_reparsed(self, config_file, monkeypatch):
+        model_config._load_config()
+        monkeypatch.setattr(model_config, "json_loads", lambda data: pytest.fail("re-parsed"))
+        get_role_config("writer")
+        get_pricing("no-such-model")
@@ -111,6 +111,7 @@ def test_performance_tracker():
     assert metrics.rounds[0].moderator_time == 5.2
     assert metrics.rounds[0].revision_time == 15.7
     assert metrics.rounds[0].round_tokens == 5000
+    assert metrics.rounds[0].review_start <= metrics.rounds[0].review_end
 
     # Test to_dict
     data = metrics.to_dict()
@@ -121,6 +122,40 @@ def test_performance_tracker():
     print("✓ Performance tracker works correctly")
 
 
+def test_performance_tracker_total_tokens():
+    """Running token total matches the per-source counts."""
+    from research_cli.performance import PerformanceTracker
+
+    tracker = PerformanceTracker()
+    tracker.start_workflow()
+    tracker.record_initial_draft(1.0, tokens=100)
+    tracker.record_initial_draft(1.0, tokens=150)  # re-recorded, not added
+    tracker.record_team_composition(1.0, tokens=10)
+    tracker.record_revision(tokens=5)
+    tracker.start_round(1)
+    tracker.record_round_tokens(1000)
+    tracker.end_round()
+    tracker.start_round(2)
+    tracker.record_round_tokens(500)  # unfinished round is not counted
+
+    assert tracker.export_metrics().total_tokens == 150 + 10 + 5 + 1000
+
+
+def test_performance_tracker_overlapping_operations():
+    """Overlapping and repeated operation timers stay independent."""
+    from research_cli.performance import PerformanceTracker
+
+    tracker = PerformanceTracker()
+    tracker.start_operation("outer")
+    tracker.start_operation("inner")
+    assert tracker.end_operation("outer") >= 0
+    tracker.start_operation("outer")
+    assert tracker.end_operation("inner") >= 0
+    assert tracker.end_operation("outer") >= 0
+    assert tracker.end_operation("outer") == 0.0
+    assert tracker.end_operation("never_started") == 0.0
+
+
 def test_interactive_display():
     """Test interactive editor display (non-interactive parts)."""
     from research_cli.models.expert import ExpertProposal
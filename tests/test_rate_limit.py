@@ -0,0 +1,77 @@
+"""Tests for the client-side LLM rate limiter."""
+
+import asyncio
+import time
+
+from research_cli.llm.rate_limit import RateLimiter, estimate_tokens
+
+
+class TestRateLimiter:
+    """RateLimiter paces requests by count and by token budget."""
+
+    def test_under_limit_does_not_wait(self):
+        async def run():
+            limiter = RateLimiter(rpm=5, tpm=1000, period=10)
+            start = time.monotonic()
+            for _ in range(5):
+                await limiter.acquire(100)
+            return time.monotonic() - start
+
+        assert asyncio.get_event_loop().run_until_complete(run()) < 0.1
+
+    def test_request_limit_waits_for_window(self):
+        async def run():
+            limiter = RateLimiter(rpm=2, period=0.3)
+            start = time.monotonic()
+            for _ in range(3):
+                await limiter.acquire()
+            return time.monotonic() - start
+
+        assert asyncio.get_event_loop().run_until_complete(run()) >= 0.25
+
+    def test_token_limit_waits_for_window(self):
+        async def run():
+            limiter = RateLimiter(rpm=100, tpm=100, period=0.3)
+            start = time.monotonic()
+            await limiter.acquire(60)
+            await limiter.acquire(60)
+            return time.monotonic() - start
+
+        assert asyncio.get_event_loop().run_until_complete(run()) >= 0.25
+
+    def test_oversized_request_admitted_into_empty_window(self):
+        async def run():
+            limiter = RateLimiter(rpm=10, tpm=100, period=10)
+            await asyncio.wait_for(limiter.acquire(500), timeout=1)
+
+        asyncio.get_event_loop().run_until_complete(run())
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("x" * 400) == 100
+    assert estimate_tokens("x" * 400, max_output_tokens=4096) == 4196
+
+
+class TestLLMScheduler:
+    """LLMScheduler bounds concurrency and only starts admitted calls."""
+
+    def test_concurrency_is_bounded(self):
+        from research_cli.llm.scheduler import LLMScheduler
+
+        running = 0
+        peak = 0
+
+        async def call():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "ok"
+
+        async def run():
+            scheduler = LLMScheduler(max_concurrency=2)
+            return await asyncio.gather(*(scheduler.submit(call, estimated_tokens=10) for _ in range(6)))
+
+        assert asyncio.get_event_loop().run_until_complete(run()) == ["ok"] * 6
+        assert peak == 2
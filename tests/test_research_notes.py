@@ -0,0 +1,76 @@
+"""Tests for ResearchNotebook markdown export."""
+
+from dataclasses import asdict
+
+from research_cli.models.research_notes import (
+    DataAnalysisNote,
+    LiteratureNote,
+    ObservationNote,
+    QuestionNote,
+    ResearchNotebook,
+)
+
+
+def _notebook():
+    notebook = ResearchNotebook(topic="Rollups", research_questions=["How fast?", "How safe?"])
+    notebook.add_literature_note(LiteratureNote(
+        source="Paper A", source_type="paper", key_findings=["f1", "f2"],
+        quotes=["q"], questions_raised=["r"], relevance="high",
+    ))
+    notebook.add_data_analysis_note(DataAnalysisNote(
+        analysis_type="statistical", data_source="L2Beat", raw_data={"tps": 12, "name": "Ünichain"},
+        findings=["up"], visualizations=["chart.png"], methodology="mean", limitations=["small"],
+    ))
+    notebook.add_observation(ObservationNote(
+        observation="Fees fell", supporting_evidence=["e"], implications=["i"], confidence="high",
+    ))
+    notebook.add_question(QuestionNote(question="Why?", why_important="cost", potential_approaches=["a"]))
+    notebook.add_question(QuestionNote(question="Done?", why_important="x", answered=True, answer="yes"))
+    return notebook
+
+
+class TestToMarkdown:
+
+    def test_renders_all_sections(self):
+        md = _notebook().to_markdown()
+        assert md.startswith("# Research Notes: Rollups\n**Status:** active\n")
+        assert "1. How fast?\n2. How safe?\n\n" in md
+        assert "### Paper A\n**Type:** paper\n\n**Relevance:** high\n\n**Key Findings:**\n- f1\n- f2\n\n" in md
+        assert '```json\n{\n  "tps": 12,\n  "name": "Ünichain"\n}\n```\n\n' in md
+        assert "![Chart](chart.png)\n" in md
+        assert "**Observation** (confidence: high):\nFees fell\n\n" in md
+        assert "**❓ OPEN:** Why?\n*Why important:* cost\n\n*Potential approaches:*\n- a\n\n" in md
+        assert md.endswith("**✓ ANSWERED:** Done?\n*Why important:* x\n\n*Answer:* yes\n\n")
+
+    def test_cached_until_notebook_changes(self):
+        notebook = _notebook()
+        first = notebook.to_markdown()
+        assert notebook.to_markdown() is first
+
+        notebook.status = "completed"
+        assert "**Status:** completed" in notebook.to_markdown()
+
+        notebook.observations.append(ObservationNote(observation="Appended directly"))
+        assert "Appended directly" in notebook.to_markdown()
+
+        notebook.literature_notes[0].key_findings.append("edited in place")
+        notebook.touch()
+        assert "- edited in place\n" in notebook.to_markdown()
+
+        notebook.data_analysis_notes[0].raw_data["tps"] = 99
+        notebook.touch()
+        assert '"tps": 99' in notebook.to_markdown()
+
+
+def test_data_analysis_note_asdict_has_only_declared_fields():
+    note = _notebook().data_analysis_notes[0]
+    assert set(asdict(note)) == {
+        "analysis_type", "data_source", "raw_data", "findings", "visualizations",
+        "methodology", "limitations", "metadata",
+    }
+
+
+def test_repeated_labels_are_interned():
+    a = LiteratureNote(source="a", source_type="".join(["pa", "per"]), key_findings=[])
+    b = LiteratureNote(source="b", source_type="".join(["pa", "per"]), key_findings=[])
+    assert a.source_type is b.source_type
@@ -0,0 +1,77 @@
+"""Tests for section-level writing models."""
+
+from dataclasses import asdict, fields
+
+from research_cli.models.section import ResearchPlan, SectionOutput, SectionSpec, WritingContext
+
+
+def _context(previous):
+    specs = [
+        SectionSpec(id="intro", title="Introduction", key_points=[], order=1),
+        SectionSpec(id="method", title="Method", key_points=[], order=2),
+        SectionSpec(id="results", title="Results", key_points=[], order=3),
+    ]
+    plan = ResearchPlan(topic="t", research_questions=[], sections=specs, total_estimated_tokens=0)
+    return WritingContext(research_plan=plan, previous_sections=previous, section_spec=specs[-1])
+
+
+class TestPreviousSummaries:
+
+    def test_summary_stops_after_200_words(self):
+        content = "\n\n".join(" ".join(["word"] * 50) for _ in range(10))
+        context = _context([SectionOutput("intro", content, word_count=500, tokens_used=0)])
+        # Lines are added until the running count passes 200 words
+        assert len(context.get_section_summary("intro").split()) == 250
+        assert context.get_section_summary("missing") is None
+
+    def test_all_summaries_use_plan_titles(self):
+        context = _context([
+            SectionOutput("intro", "# Intro\n\nFirst para.", word_count=3, tokens_used=0),
+            SectionOutput("extra", "Unplanned.", word_count=1, tokens_used=0),
+            SectionOutput("method", "", word_count=0, tokens_used=0),
+        ])
+        assert context.get_all_previous_summaries() == (
+            "## Introduction\n# Intro First para.\n\n## extra\nUnplanned."
+        )
+        assert _context([]).get_all_previous_summaries() == "No previous sections."
+
+    def test_summary_recomputed_when_content_changes(self):
+        section = SectionOutput("intro", "old text", word_count=2, tokens_used=0)
+        context = _context([section])
+        assert context.get_section_summary("intro") == "old text"
+        section.content = "new text"
+        assert context.get_section_summary("intro") == "new text"
+
+    def test_caches_are_not_dataclass_fields(self):
+        context = _context([SectionOutput("intro", "text", word_count=1, tokens_used=0)])
+        context.get_all_previous_summaries()
+        assert [f.name for f in fields(context)] == [
+            "research_plan", "previous_sections", "section_spec",
+        ]
+        assert "_summary_cache" not in asdict(context)
+
+
+class TestResearchPlanIndex:
+
+    def test_lookup_and_order_follow_section_changes(self):
+        plan = _context([]).research_plan
+        assert plan.get_section("method").title == "Method"
+        assert plan.get_section("missing") is None
+        assert [s.id for s in plan.get_ordered_sections()] == ["intro", "method", "results"]
+
+        plan.sections.append(SectionSpec(id="abstract", title="Abstract", key_points=[], order=0))
+        assert plan.get_section("abstract").title == "Abstract"
+        assert plan.get_ordered_sections()[0].id == "abstract"
+
+        plan.sections = plan.sections[:1]
+        assert plan.get_section("method") is None
+
+
+def test_summary_stops_after_word_budget():
+    lines = ["alpha " * 50] * 10 + ["", "omega"]
+    ctx = WritingContext(
+        research_plan=ResearchPlan(topic="t", research_questions=[], sections=[], total_estimated_tokens=0),
+        previous_sections=[SectionOutput(section_id="s", content="\n".join(lines), word_count=0, tokens_used=0)],
+        section_spec=SectionSpec(id="next", title="Next", key_points=[]),
+    )
+    assert ctx.get_section_summary("s") == " ".join(lines[:5])
@@ -0,0 +1,62 @@
+"""Tests for cached token counting."""
+
+from unittest.mock import patch
+
+import pytest
+
+from research_cli.llm import tokens
+from research_cli.llm.tokens import count_message_tokens, count_tokens
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    tokens.clear_token_cache()
+    yield
+    tokens.clear_token_cache()
+
+
+class _Encoder:
+    name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text, disallowed_special=()):
+        self.calls += 1
+        return text.split()
+
+
+def test_estimates_from_length_without_tiktoken():
+    with patch.object(tokens, "get_encoder", return_value=None):
+        assert count_tokens("abcdefghi", "gpt-4.1") == 3
+
+
+def test_identical_content_is_encoded_once():
+    encoder = _Encoder()
+    with patch.object(tokens, "get_encoder", return_value=encoder):
+        assert count_tokens("one two three", "gpt-4.1") == 3
+        assert count_tokens("one two three", "gpt-4.1") == 3
+    assert encoder.calls == 1
+
+
+def test_cache_is_bounded():
+    encoder = _Encoder()
+    with patch.object(tokens, "get_encoder", return_value=encoder), \
+            patch.object(tokens, "TOKEN_CACHE_SIZE", 2):
+        for text in ("a", "b", "c"):
+            count_tokens(text, "gpt-4.1")
+    assert len(tokens._counts) == 2
+
+
+def test_message_tokens_include_images():
+    encoder = _Encoder()
+    messages = [
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": [
+            {"type": "text", "text": "what is this"},
+            {"type": "image_url", "image_url": {"url": "x", "detail": "low"}},
+        ]},
+    ]
+    with patch.object(tokens, "get_encoder", return_value=encoder):
+        total = count_message_tokens(messages, "gpt-4.1")
+    assert total == 2 * tokens.MESSAGE_OVERHEAD_TOKENS + 2 + 3 + tokens.IMAGE_TOKENS_LOW